@@ -0,0 +1,82 @@
+import hashlib
+import os
+import pickle
+
+import DatasetCache
+from ClassifierData import ClassifierData
+
+CHECKPOINT_EXTENSION = '.pkl'
+WHOLE_RUN = 'all'
+
+
+def get_config_fingerprint(classifier_data: ClassifierData = ClassifierData()):
+    """Builds fingerprint of parameters, which influence results of one run, together with content of dataset
+
+    :param classifier_data: ClassifierData
+    :return: str
+    """
+    parameters = [classifier_data.type_of_classifier.value,
+                  classifier_data.type_of_composition.value,
+                  classifier_data.are_samples_generated,
+                  classifier_data.number_of_samples_if_generated,
+                  classifier_data.number_of_dataset_if_not_generated,
+                  classifier_data.switch_columns_while_loading,
+                  list(classifier_data.space_division),
+                  classifier_data.number_of_space_parts,
+                  classifier_data.number_of_classifiers,
+                  list(classifier_data.columns),
+                  classifier_data.is_validation_hard,
+                  classifier_data.generate_all_permutations,
+                  classifier_data.bagging,
+                  classifier_data.seed]
+    if not classifier_data.are_samples_generated:
+        parameters.append(DatasetCache.compute_file_hash(classifier_data.filename))
+    return hashlib.sha256(repr(parameters).encode()).hexdigest()
+
+
+def get_checkpoint_filename(fingerprint: str, permutation = WHOLE_RUN,
+                            classifier_data: ClassifierData = ClassifierData()):
+    """Returns path of checkpoint of one (dataset, bagging iteration, permutation) unit
+
+    :param fingerprint: str
+    :param permutation: int or WHOLE_RUN for results of all permutations
+    :param classifier_data: ClassifierData
+    :return: str
+    """
+    name = '{}_b_{}_p_{}{}'.format(os.path.basename(classifier_data.filename), classifier_data.bagging_iteration,
+                                   permutation, CHECKPOINT_EXTENSION)
+    return os.path.join(classifier_data.checkpoint_directory, fingerprint, name)
+
+
+def load(fingerprint: str, permutation = WHOLE_RUN, classifier_data: ClassifierData = ClassifierData()):
+    """Loads payload of finished unit
+
+    :param fingerprint: str
+    :param permutation: int or WHOLE_RUN
+    :param classifier_data: ClassifierData
+    :return: payload or None if unit was not finished
+    """
+    try:
+        with open(get_checkpoint_filename(fingerprint, permutation, classifier_data), 'rb') as file:
+            return pickle.load(file)
+    except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+        return None
+
+
+def store(fingerprint: str, payload, permutation = WHOLE_RUN, classifier_data: ClassifierData = ClassifierData()):
+    """Stores payload of finished unit atomically
+
+    :param fingerprint: str
+    :param payload: picklable object
+    :param permutation: int or WHOLE_RUN
+    :param classifier_data: ClassifierData
+    :return:
+    """
+    checkpoint_filename = get_checkpoint_filename(fingerprint, permutation, classifier_data)
+    os.makedirs(os.path.dirname(checkpoint_filename), exist_ok = True)
+    temporary_filename = '{}.{}.tmp'.format(checkpoint_filename, os.getpid())
+    with open(temporary_filename, 'wb') as file:
+        pickle.dump(payload, file)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporary_filename, checkpoint_filename)
@@ -0,0 +1,61 @@
+import os
+import tempfile
+import unittest
+
+import CheckpointStore
+import MergingAlgorithm
+from ClassifierData import ClassifierData
+
+
+class CheckpointStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def prepare_classifier_data(self, resume_from_checkpoints: bool = False):
+        return ClassifierData(number_of_classifiers = 3, space_division = [3], number_of_samples_if_generated = 200,
+                              logging_to_file = False, seed = 3, checkpoint_directory = self.directory.name,
+                              resume_from_checkpoints = resume_from_checkpoints)
+
+    def test_should_load_stored_payload(self):
+        # given
+        classifier_data = self.prepare_classifier_data()
+        fingerprint = CheckpointStore.get_config_fingerprint(classifier_data)
+        # when
+        CheckpointStore.store(fingerprint, [1, 2], 5, classifier_data)
+        # then
+        self.assertEqual([1, 2], CheckpointStore.load(fingerprint, 5, classifier_data))
+        self.assertIsNone(CheckpointStore.load(fingerprint, 6, classifier_data))
+
+    def test_should_change_fingerprint_with_parameters(self):
+        # given
+        classifier_data = self.prepare_classifier_data()
+        fingerprint = CheckpointStore.get_config_fingerprint(classifier_data)
+        # when
+        classifier_data.seed = 4
+        seed_fingerprint = CheckpointStore.get_config_fingerprint(classifier_data)
+        classifier_data.number_of_space_parts = 7
+        # then
+        self.assertEqual(3, len({fingerprint, seed_fingerprint,
+                                 CheckpointStore.get_config_fingerprint(classifier_data)}))
+
+    def test_should_resume_run_from_finished_permutations(self):
+        # given
+        expected = MergingAlgorithm.run(self.prepare_classifier_data())
+        checkpoint_directory = os.path.join(self.directory.name, os.listdir(self.directory.name)[0])
+        for name in os.listdir(checkpoint_directory):
+            if name.endswith('_p_1.pkl') or name.endswith('_p_all.pkl'):
+                os.remove(os.path.join(checkpoint_directory, name))
+        # when
+        results = MergingAlgorithm.run(self.prepare_classifier_data(resume_from_checkpoints = True))
+        # then
+        for expected_pro_selection, results_pro_selection in zip(expected, results):
+            for expected_res, res in zip(expected_pro_selection, results_pro_selection):
+                self.assertEqual(vars(expected_res), vars(res))
+
+
+if __name__ == '__main__':
+    unittest.main()
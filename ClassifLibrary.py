@@ -1,15 +1,18 @@
+import bisect
 import itertools
 import math
 import warnings
-from random import randint
 
 import matplotlib.pyplot as plt
 import numpy as np
+import pandas as pd
 import xlrd
 from sklearn.datasets import make_classification
 from sklearn.feature_selection import SelectKBest, f_classif
 from sklearn.metrics import confusion_matrix
 
+import DatasetCache
+import MemoryMappedDataset
 from ClassifierData import ClassifierData
 from ClfType import ClfType
 from IntegrRes import IntegrRes
@@ -29,7 +32,7 @@ def initialize_classifiers(classifier_data: ClassifierData = ClassifierData()):
     clfs = []
     if type_of_classifier == ClfType.LINEAR:
         for i in range(number_of_classifiers):
-            clfs.append(LinearSVC(max_iter = 1e6, tol = 1e-10, C = 100))
+            clfs.append(LinearSVC(max_iter = 1e6, tol = 1e-10, C = 100, random_state = classifier_data.seed))
     elif type_of_classifier == ClfType.MEAN:
         for i in range(number_of_classifiers):
             clfs.append(NearestCentroid())
@@ -58,6 +61,15 @@ def prepare_raw_data(classifier_data: ClassifierData = ClassifierData()):
         else:
             assert_distribution_simplified(X0, X1, classifier_data)
         return compose_sorted_parts(X0, X1)
+    elif classifier_data.dataset_cache_directory is not None:
+        key = DatasetCache.get_cache_key(classifier_data)
+        X, y = DatasetCache.load(key, classifier_data)
+        if X is None:
+            X, y = load_samples_from_datasets(classifier_data)
+            DatasetCache.store(key, X, y, classifier_data)
+        else:
+            print('Loaded prepared samples from cache')
+        return X, y
     else:
         return load_samples_from_datasets(classifier_data)
 
@@ -138,18 +150,10 @@ def get_separate_columns(X: [], y: [], columns: []):
     :param X: []
     :param y: []
     :param columns: []
-    :return: X0, X1: [], []
+    :return: X0, X1: np.array, np.array
     """
-    X0, X1 = [], []
-    for i in range(len(X)):
-        row = []
-        for column in columns:
-            row.append(X[i][column])
-        if y[i] == 0:
-            X0.append(row)
-        else:
-            X1.append(row)
-    return X0, X1
+    X_selected, y = np.asarray(X)[:, columns], np.asarray(y)
+    return X_selected[y == 0], X_selected[y != 0]
 
 
 def load_samples_from_datasets(classifier_data: ClassifierData = ClassifierData()):
@@ -160,15 +164,17 @@ def load_samples_from_datasets(classifier_data: ClassifierData = ClassifierData(
     """
     is_validation_hard = classifier_data.is_validation_hard
     filename = classifier_data.filename
-    if filename.endswith(".dat") or filename.endswith(".csv"):
-        X, y = read_csv_file(classifier_data)
-    elif filename.endswith(".tsv"):
-        X, y = read_sv_file(classifier_data, '\t')
-    elif filename.endswith(".scsv"):
-        X, y = read_sv_file(classifier_data, ';')
+    separator = get_separator(filename)
+    if classifier_data.memory_mapped and separator is not None:
+        X0, X1 = load_memory_mapped_selection(classifier_data, separator)
     else:
-        X, y = read_excel_file(classifier_data)
-    X0, X1 = make_selection(X, y, classifier_data)
+        if separator == ',':
+            X, y = read_csv_file(classifier_data)
+        elif separator is not None:
+            X, y = read_sv_file(classifier_data, separator)
+        else:
+            X, y = read_excel_file(classifier_data)
+        X0, X1 = make_selection(X, y, classifier_data)
     print('Ratio (0:1): {}:{}'.format(len(X0), len(X1)))
     X0, X1 = sort_attributes(X0), sort_attributes(X1)
     if is_validation_hard:
@@ -179,27 +185,44 @@ def load_samples_from_datasets(classifier_data: ClassifierData = ClassifierData(
     return X, y
 
 
+def get_separator(filename: str):
+    """Determines separator of delimited dataset from its extension
+
+    :param filename: str
+    :return: separator: str or None for excel files
+    """
+    if filename.endswith(".dat") or filename.endswith(".csv"):
+        return ','
+    elif filename.endswith(".tsv"):
+        return '\t'
+    elif filename.endswith(".scsv"):
+        return ';'
+    return None
+
+
+def load_memory_mapped_selection(classifier_data: ClassifierData = ClassifierData(), separator: str = ','):
+    """Opens dataset converted into memory mapped .npy pair (converting it once if needed), selects 2 best columns
+    from chunked F-values and materializes only them
+
+    :param classifier_data: ClassifierData
+    :param separator: str
+    :return: X0, X1: np.array, np.array
+    """
+    filename = classifier_data.filename
+    if not MemoryMappedDataset.is_converted(filename):
+        MemoryMappedDataset.convert_delimited_file(filename, separator)
+    X, y = MemoryMappedDataset.open_arrays(filename)
+    columns = select_columns(MemoryMappedDataset.compute_feature_scores(X, y), classifier_data)
+    return get_separate_columns(X, y, columns)
+
+
 def read_csv_file(classifier_data: ClassifierData = ClassifierData()):
     """Reads data from comma separated value files
 
     :param classifier_data: ClassifierData
-    :return: X, y: [], []
+    :return: X, y: np.array, np.array
     """
-    filename = classifier_data.filename
-    file = open(filename, "r")
-    lines = file.readlines()
-    file.close()
-    X, y = [], []
-    for line in lines:
-        if line.startswith("@"):
-            continue
-        line_as_array = line.replace("\n", "", 1).split(",")
-        row = []
-        for i in range(len(line_as_array) - 1):
-            row.append(float(line_as_array[i]))
-        X.append(row)
-        y.append(int(float(line_as_array[-1])))
-    return X, y
+    return read_delimited_file(classifier_data, ',')
 
 
 def read_sv_file(classifier_data: ClassifierData = ClassifierData(), separator: str = ','):
@@ -207,21 +230,25 @@ def read_sv_file(classifier_data: ClassifierData = ClassifierData(), separator:
 
     :param classifier_data: ClassifierData
     :param separator: str
-    :return: X, y: [], []
+    :return: X, y: np.array, np.array
+    """
+    return read_delimited_file(classifier_data, separator)
+
+
+def read_delimited_file(classifier_data: ClassifierData = ClassifierData(), separator: str = ','):
+    """Parses delimited text file (last column holds class) straight into float matrix using C parser, lines starting
+    with @ (KEEL headers) at the beginning of file are skipped
+
+    :param classifier_data: ClassifierData
+    :param separator: str
+    :return: X, y: np.array, np.array
     """
     filename = classifier_data.filename
-    file = open(filename, "r")
-    lines = file.readlines()
-    file.close()
-    X, y = [], []
-    for line in lines:
-        line_as_array = line.replace("\n", "", 1).split(separator)
-        row = []
-        for i in range(len(line_as_array) - 1):
-            row.append(float(line_as_array[i]))
-        X.append(row)
-        y.append(int(float(line_as_array[-1])))
-    return X, y
+    number_of_header_lines = MemoryMappedDataset.get_number_of_header_lines(filename)
+    data = pd.read_csv(filename, sep = separator, header = None, skiprows = number_of_header_lines,
+                       skipinitialspace = True, dtype = np.float64, engine = 'c',
+                       float_precision = 'round_trip').to_numpy()
+    return data[:, :-1], data[:, -1].astype(int)
 
 
 def make_selection(X: [], y: [], classifier_data: ClassifierData = ClassifierData()):
@@ -230,110 +257,179 @@ def make_selection(X: [], y: [], classifier_data: ClassifierData = ClassifierDat
     :param X: []
     :param y: []
     :param classifier_data: ClassifierData
-    :return: X0, X1: [], []
+    :return: X0, X1: np.array, np.array
     """
-    switch_columns_while_loading = classifier_data.switch_columns_while_loading
     selection = SelectKBest(k = 2, score_func = f_classif)
     with warnings.catch_warnings():
         warnings.simplefilter('ignore')
         selection.fit(X, y)
     feature_scores = selection.scores_
+    columns = select_columns(feature_scores, classifier_data)
+    return get_separate_columns(X, y, columns)
+
+
+def select_columns(feature_scores: [], classifier_data: ClassifierData = ClassifierData()):
+    """Returns columns of 2 best features, switched if requested
+
+    :param feature_scores: []
+    :param classifier_data: ClassifierData
+    :return: columns: []
+    """
+    switch_columns_while_loading = classifier_data.switch_columns_while_loading
     columns = get_columns_from_scores(feature_scores)
     if switch_columns_while_loading:
         columns[0], columns[1] = columns[1], columns[0]
         print('Columns switched: {} and {}'.format(columns[0], columns[1]))
-    return get_separate_columns(X, y, columns)
+    return columns
 
 
 def assert_distribution(X0: [], X1: [], classifier_data: ClassifierData = ClassifierData()):
-    """Asserts that samples can be divided into subspaces with the same amount of data
+    """Asserts that samples can be divided into subspaces with the same amount of data, samples of every class are
+    kept as window [start, stop) of sorted dataset and set of removed positions, so that counts in subspaces are
+    obtained with searchsorted and all removals are applied with single mask at the end. This is not a single pass:
+    cutting a sample at the edge moves extrema and with them boundaries of all subspaces, so scan of subspaces restarts
+    after every such cut, as in previous recursive implementation, only removals inside subspaces keep scan going
 
     :param X0: np.array, data with class 0
     :param X1: np.array, data with class 1
     :param classifier_data: ClassifierData
+    :return: X0, X1: np.array, np.array,
     data prepared to be divided into number_of_classifiers + 2 parts of same length
     """
     number_of_space_parts = classifier_data.number_of_space_parts
     number_of_classifiers = classifier_data.number_of_classifiers
     print('len0: {}, len1: {}'.format(len(X0), len(X1)))
-    x0_min, x0_max = get_subdata_limits(X0)
-    x1_min, x1_max = get_subdata_limits(X1)
-    x_min, x_max = min(x0_min, x1_min), max(x0_max, x1_max)
-    for i in range(number_of_space_parts):
-        counter0, counter1, index0, index1 = 0, 0, 0, 0
-        while True:
-            if index0 == len(X0):
-                break
-            if x_min + i * (x_max - x_min) / number_of_space_parts <= X0[index0][0] <= \
-                    x_min + (i + 1) * (x_max - x_min) / number_of_space_parts:
-                counter0 += 1
-                index0 += 1
-                continue
-            if counter0 > 0:
-                break
-            index0 += 1
-        while True:
-            if index1 == len(X1):
+    X = [np.asarray(X0), np.asarray(X1)]
+    values = [X[0][:, 0], X[1][:, 0]]
+    starts, stops, removed = [0, 0], [len(X0), len(X1)], [[], []]
+    is_asserted = False
+    while not is_asserted:
+        lengths = [get_number_of_remaining_samples(removed[j], starts[j], stops[j]) for j in range(2)]
+        if lengths[0] == 0 or lengths[1] == 0:
+            raise NotEnoughSamplesError('Not enough samples found when asserting distribution')
+        x_min = min(values[j][get_first_remaining_position(removed[j], starts[j])] for j in range(2))
+        x_max = max(values[j][get_last_remaining_position(removed[j], stops[j])] for j in range(2))
+        is_asserted = True
+        for i in range(number_of_space_parts):
+            counters, indices = [0, 0], [0, 0]
+            for j in range(2):
+                beginning = max(starts[j], np.searchsorted(
+                    values[j], x_min + i * (x_max - x_min) / number_of_space_parts, side = 'left'))
+                end = max(beginning, min(stops[j], np.searchsorted(
+                    values[j], x_min + (i + 1) * (x_max - x_min) / number_of_space_parts, side = 'right')))
+                counters[j] = get_number_of_remaining_samples(removed[j], beginning, end)
+                indices[j] = end if counters[j] > 0 else stops[j]
+            if counters[0] + counters[1] < number_of_classifiers + 2:
+                print('Only {} samples in {}. subspace'.format(counters[0] + counters[1], i + 1))
+                larger = 0 if lengths[0] > lengths[1] else 1
+                stops[larger] = get_last_remaining_position(removed[larger], stops[larger])
+                is_asserted = False
                 break
-            if x_min + i * (x_max - x_min) / number_of_space_parts <= X1[index1][0] <= \
-                    x_min + (i + 1) * (x_max - x_min) / number_of_space_parts:
-                counter1 += 1
-                index1 += 1
-                continue
-            if counter1 > 0:
-                break
-            index1 += 1
-        if counter0 + counter1 < number_of_classifiers + 2:
-            print('Only {} samples in {}. subspace'.format(counter0 + counter1, i + 1))
-            from_front = False
-            return cut_out_from_larger(X0, X1, from_front, classifier_data)
-        remainder = (counter0 + counter1) % (number_of_classifiers + 2)
-        if remainder != 0:
-            if i == 0:
-                from_front = True
-                return cut_out_from_larger(X0, X1, from_front, classifier_data)
-            if i == number_of_space_parts - 1:
-                from_front = False
-                return cut_out_from_larger(X0, X1, from_front, classifier_data)
-            if len(X0) > len(X1):
-                if counter0 < remainder:
-                    subtraction, rest = counter0, remainder - counter0
-                else:
-                    subtraction, rest = remainder, 0
-                X0 = np.vstack((X0[:index0 - subtraction], X0[index0:]))
-                X1 = np.vstack((X1[:index1 - rest], X1[index1:]))
-            else:
-                if counter1 < remainder:
-                    subtraction, rest = counter1, remainder - counter1
-                else:
-                    subtraction, rest = remainder, 0
-                X0 = np.vstack((X0[:index0 - rest], X0[index0:]))
-                X1 = np.vstack((X1[:index1 - subtraction], X1[index1:]))
-    print('len0: {}, len1: {}'.format(len(X0), len(X1)))
-    return X0, X1
+            remainder = (counters[0] + counters[1]) % (number_of_classifiers + 2)
+            if remainder != 0:
+                larger = 0 if lengths[0] > lengths[1] else 1
+                if i == 0:
+                    starts[larger] = get_first_remaining_position(removed[larger], starts[larger]) + 1
+                    is_asserted = False
+                    break
+                if i == number_of_space_parts - 1:
+                    stops[larger] = get_last_remaining_position(removed[larger], stops[larger])
+                    is_asserted = False
+                    break
+                smaller = 1 - larger
+                subtraction = min(counters[larger], remainder)
+                rest = remainder - subtraction
+                remove_remaining_positions_before(removed[larger], indices[larger], subtraction)
+                remove_remaining_positions_before(removed[smaller], indices[smaller], rest)
+                lengths[larger] -= subtraction
+                lengths[smaller] -= rest
+    for j in range(2):
+        mask = np.zeros(len(X[j]), dtype = bool)
+        mask[starts[j]:stops[j]] = True
+        mask[removed[j]] = False
+        X[j] = X[j][mask]
+    print('len0: {}, len1: {}'.format(len(X[0]), len(X[1])))
+    return X[0], X[1]
+
+
+def get_number_of_remaining_samples(removed: [], beginning: int, end: int):
+    """Counts positions from [beginning, end), which were not removed
+
+    :param removed: [], sorted removed positions
+    :param beginning: int
+    :param end: int
+    :return: int
+    """
+    return end - beginning - (bisect.bisect_left(removed, end) - bisect.bisect_left(removed, beginning))
 
 
-def cut_out_from_larger(X0: [], X1: [], from_front: bool, classifier_data: ClassifierData = ClassifierData()):
-    """Cuts value from set
+def get_first_remaining_position(removed: [], start: int):
+    """Finds first position not lower than start, which was not removed
 
-    :param X0: []
-    :param X1: []
-    :param from_front: bool
-    :param classifier_data: ClassifierData
+    :param removed: [], sorted removed positions
+    :param start: int
+    :return: int
+    """
+    position = start
+    index = bisect.bisect_left(removed, position)
+    while index < len(removed) and removed[index] == position:
+        position += 1
+        index += 1
+    return position
+
+
+def get_last_remaining_position(removed: [], stop: int):
+    """Finds last position lower than stop, which was not removed
+
+    :param removed: [], sorted removed positions
+    :param stop: int
+    :return: int
+    """
+    position = stop - 1
+    index = bisect.bisect_left(removed, position)
+    while index >= 0 and index < len(removed) and removed[index] == position:
+        position -= 1
+        index -= 1
+    return position
+
+
+def get_position_of_remaining_sample(removed: [], rank: int):
+    """Finds position of sample, which has rank not removed samples before it
+
+    :param removed: [], sorted removed positions
+    :param rank: int
+    :return: int
+    """
+    position = rank
+    for removed_position in removed:
+        if removed_position > position:
+            break
+        position += 1
+    return position
+
+
+def remove_remaining_positions_before(removed: [], end: int, count: int):
+    """Marks count of last not removed positions lower than end as removed
+
+    :param removed: [], sorted removed positions
+    :param end: int
+    :param count: int
     :return:
     """
-    if from_front:
-        if len(X0) > len(X1):
-            return assert_distribution(X0[1:], X1, classifier_data)
-        return assert_distribution(X0, X1[1:], classifier_data)
-    else:
-        if len(X0) > len(X1):
-            return assert_distribution(X0[:-1], X1, classifier_data)
-        return assert_distribution(X0, X1[:-1], classifier_data)
+    position = end - 1
+    while count > 0:
+        index = bisect.bisect_left(removed, position)
+        if index < len(removed) and removed[index] == position:
+            position -= 1
+            continue
+        removed.insert(index, position)
+        position -= 1
+        count -= 1
 
 
 def assert_distribution_simplified(X0: [], X1: [], classifier_data: ClassifierData = ClassifierData()):
-    """Asserts that samples can be divided into subspaces with the same amount of data
+    """Asserts that samples can be divided into subspaces with the same amount of data, counts in subspaces are
+    obtained with searchsorted on sorted first attribute and all trims are applied with single mask at the end
 
     :param X0: np.array, data with class 0
     :param X1: np.array, data with class 1
@@ -344,30 +440,42 @@ def assert_distribution_simplified(X0: [], X1: [], classifier_data: ClassifierDa
     number_of_classifiers = classifier_data.number_of_classifiers
     print('Validating dataset')
     x_min, x_max = get_extrema_for_subspaces(X0, X1)
-    previous_index0, previous_index1 = 0, 0
+    X = [np.asarray(X0), np.asarray(X1)]
+    values = [X[0][:, 0], X[1][:, 0]]
+    removed = [[], []]
+    previous_indices = [0, 0]
     print('Before assertion: len0: {}, len1: {}'.format(len(X0), len(X1)))
     for i in range(number_of_space_parts):
-        counter0, index0 = get_count_of_samples_in_subspace_and_beg_ind_of_next_subspace(X0, x_min, x_max, i,
-                                                                                         classifier_data)
-        counter1, index1 = get_count_of_samples_in_subspace_and_beg_ind_of_next_subspace(X1, x_min, x_max, i,
-                                                                                         classifier_data)
-        if counter0 + counter1 < number_of_classifiers + 2:
-            print('Only {} samples in {}. subspace'.format(counter0 + counter1, i + 1))
-        remainder = (counter0 + counter1) % (number_of_classifiers + 2)
+        counters, indices = [0, 0], [0, 0]
+        for j in range(2):
+            beginning = np.searchsorted(values[j], x_min + i * (x_max - x_min) / number_of_space_parts, side = 'left')
+            end = max(beginning, np.searchsorted(
+                values[j], x_min + (i + 1) * (x_max - x_min) / number_of_space_parts, side = 'right'))
+            counters[j] = get_number_of_remaining_samples(removed[j], beginning, end)
+            end = end if counters[j] > 0 else len(X[j])
+            indices[j] = get_number_of_remaining_samples(removed[j], 0, end)
+        if counters[0] + counters[1] < number_of_classifiers + 2:
+            print('Only {} samples in {}. subspace'.format(counters[0] + counters[1], i + 1))
+        remainder = (counters[0] + counters[1]) % (number_of_classifiers + 2)
         if remainder != 0:
-            if i != number_of_space_parts - 1:
-                relative_index0, relative_index1, is_last = index0, index1, False
-            else:
-                relative_index0, relative_index1, is_last = previous_index0, previous_index1, True
-            if counter0 > counter1:
-                counter, is_first_bigger = counter0, True
-            else:
-                counter, is_first_bigger = counter1, False
-            X0, X1 = limit_datasets(X0, X1, counter, remainder, relative_index0, relative_index1, is_first_bigger,
-                                    is_last)
-        previous_index0, previous_index1 = index0, index1
-    print('After assertion: len0: {}, len1: {}'.format(len(X0), len(X1)))
-    return X0, X1
+            bigger = 0 if counters[0] > counters[1] else 1
+            subtractions = [0, 0]
+            subtractions[bigger], subtractions[1 - bigger] = set_subtraction_and_rest(counters[bigger], remainder)
+            for j in range(2):
+                if i != number_of_space_parts - 1:
+                    end_rank = indices[j]
+                else:
+                    end_rank = min(previous_indices[j] + subtractions[j], len(X[j]) - len(removed[j]))
+                    subtractions[j] = max(0, end_rank - previous_indices[j])
+                remove_remaining_positions_before(removed[j], get_position_of_remaining_sample(removed[j], end_rank),
+                                                  subtractions[j])
+        previous_indices = indices
+    for j in range(2):
+        mask = np.ones(len(X[j]), dtype = bool)
+        mask[removed[j]] = False
+        X[j] = X[j][mask]
+    print('After assertion: len0: {}, len1: {}'.format(len(X[0]), len(X[1])))
+    return X[0], X[1]
 
 
 def get_extrema_for_subspaces(X0: [], X1: []):
@@ -382,33 +490,6 @@ def get_extrema_for_subspaces(X0: [], X1: []):
     return min(x0_min, x1_min), max(x0_max, x1_max)
 
 
-def get_count_of_samples_in_subspace_and_beg_ind_of_next_subspace(X0: [], x_min: float, x_max: float, i: int,
-                                                                  classifier_data: ClassifierData = ClassifierData()):
-    """Returns of count of data in subspace as well as index of the first element of next subspace
-
-    :param X0: np.array
-    :param x_min: float
-    :param x_max: float
-    :param i: int, number of subspace - 1
-    :param classifier_data: ClassifierData
-    :return: counter, index: int, int
-    """
-    number_of_space_parts = classifier_data.number_of_space_parts
-    counter, index = 0, 0
-    while True:
-        if index == len(X0):
-            break
-        if x_min + i * (x_max - x_min) / number_of_space_parts <= X0[index][0] <= x_min + (i + 1) * (x_max - x_min) / \
-                number_of_space_parts:
-            counter += 1
-            index += 1
-            continue
-        if counter > 0:
-            break
-        index += 1
-    return counter, index
-
-
 def set_subtraction_and_rest(counter: int, remainder: int):
     """Calculates substracion and rest for limiting datasets
 
@@ -422,74 +503,6 @@ def set_subtraction_and_rest(counter: int, remainder: int):
         return remainder, 0
 
 
-def limit_datasets_for_every_subspace_but_last(X0: [], X1: [], counter: int, remainder: int, index0: int,
-                                               index1: int, is_first_bigger: bool):
-    """Returns limited datasets for every subspace but last one
-
-    :param X0: np.array
-    :param X1: np.array
-    :param counter: int
-    :param remainder: int
-    :param index0: int
-    :param index1: int
-    :param is_first_bigger: boolean, true if there is more data in analysiert subspace in the first dataset
-    :return: X0, X1: np.array, np.array
-    """
-    subtraction, rest = set_subtraction_and_rest(counter, remainder)
-    if is_first_bigger:
-        first_subtraction, second_subtraction = subtraction, rest
-    else:
-        first_subtraction, second_subtraction = rest, subtraction
-    X0 = np.vstack((X0[:index0 - first_subtraction], X0[index0:]))
-    X1 = np.vstack((X1[:index1 - second_subtraction], X1[index1:]))
-    return X0, X1
-
-
-def limit_datasets_for_last_subspace(X0: [], X1: [], counter: int, remainder: int, previous_index0: int,
-                                     previous_index1: int, is_first_bigger: bool):
-    """Returns limited datasets for last subspace
-
-    :param X0: np.array
-    :param X1: np.array
-    :param counter: int
-    :param remainder: int
-    :param previous_index0: int
-    :param previous_index1: int
-    :param is_first_bigger: boolean, true if there is more data in analysiert subspace in the first dataset
-    :return: X0, X1: np.array, np.array
-    """
-    subtraction, rest = set_subtraction_and_rest(counter, remainder)
-    if is_first_bigger:
-        first_subtraction, second_subtraction = subtraction, rest
-    else:
-        first_subtraction, second_subtraction = rest, subtraction
-    X0 = np.vstack((X0[:previous_index0], X0[previous_index0 + first_subtraction:]))
-    X1 = np.vstack((X1[:previous_index1], X1[previous_index1 + second_subtraction:]))
-    return X0, X1
-
-
-def limit_datasets(X0: [], X1: [], counter: int, remainder: int, relative_index0: int, relative_index1: int,
-                   is_first_bigger: bool, is_last: bool):
-    """Returns limited datasets
-
-    :param X0: np.array
-    :param X1: np.array
-    :param counter: int
-    :param remainder: int
-    :param relative_index0: int
-    :param relative_index1: int
-    :param is_first_bigger: boolean
-    :param is_last: boolean, true if it is last subspace
-    :return: X0, X1: np.array, np.array
-    """
-    if is_last:
-        return limit_datasets_for_last_subspace(X0, X1, counter, remainder, relative_index0, relative_index1,
-                                                is_first_bigger)
-    else:
-        return limit_datasets_for_every_subspace_but_last(X0, X1, counter, remainder, relative_index0, relative_index1,
-                                                          is_first_bigger)
-
-
 def compose_sorted_parts(X0: [], X1: []):
     """Composes classification data from 1 and 0 parts, datasets must be sorted
 
@@ -497,32 +510,20 @@ def compose_sorted_parts(X0: [], X1: []):
     :param X1: [], data, where y = 1
     :return: X, y: np.array, np.array - samples for classification
     """
-    X, y = np.zeros((len(X0) + len(X1), 2)), np.zeros(len(X0) + len(X1), dtype = np.int)
-    for i in range(len(X0)):
-        X[i, :], y[i] = X0[i], 0
-    for i in range(len(X1)):
-        X[len(X0) + i, :], y[len(X0) + i] = X1[i], 1
+    X0, X1 = np.asarray(X0, dtype = float).reshape(-1, 2), np.asarray(X1, dtype = float).reshape(-1, 2)
+    X = np.concatenate((X0, X1))
+    y = np.concatenate((np.zeros(len(X0), dtype = int), np.ones(len(X1), dtype = int)))
     return X, y
 
 
 def sort_attributes(X: []):
-    """Sorts attribute array
+    """Sorts attribute array by first attribute, order of samples with equal first attribute is kept
 
     :param X: []
     :return: X: np.array
     """
-    length, X_result_array = len(X), []
-    for input_index in range(length):
-        output_index = 0
-        while output_index < input_index:
-            if X_result_array[output_index][0] > X[input_index][0]:
-                break
-            output_index += 1
-        X_result_array.insert(output_index, X[input_index])
-    X_result = np.zeros((length, 2))
-    for i in range(length):
-        X_result[i, :] = X_result_array[i]
-    return X_result
+    X = np.asarray(X, dtype = float).reshape(-1, 2)
+    return X[np.argsort(X[:, 0], kind = 'stable')]
 
 
 def divide_generated_samples(X: [], y: []):
@@ -530,15 +531,10 @@ def divide_generated_samples(X: [], y: []):
 
     :param X: np.array
     :param y: np.array
-    :return: X0, X1: [], []
+    :return: X0, X1: np.array, np.array
     """
-    X0, X1 = [], []
-    for i in range(len(y)):
-        if y[i] == 0:
-            X0.append(X[i, :])
-        else:
-            X1.append(X[i, :])
-    return X0, X1
+    X, y = np.asarray(X), np.asarray(y)
+    return X[y == 0], X[y != 0]
 
 
 # TODO: TEsts
@@ -555,33 +551,20 @@ def split_sorted_unitary_bagging(X: [], y: [], classifier_data: ClassifierData =
     print('Splitting samples')
     if len(X) < (number_of_classifiers + 2) * number_of_space_parts:
         raise NotEnoughSamplesError('Not enough samples found when sorting (len(X) = {})'.format(len(X)))
-    X_splitted, y_splitted = [], []
     length = len(X)
-    for i in range(number_of_classifiers + 2):
-        X_temp, y_temp = np.zeros((length, 2)), np.zeros(length, dtype = np.int)
-        for j in range(length):
-            rand = randint(0, length - 1)
-            X_temp[j, :] = X[rand, :]
-            try:
-                if X[rand, 0] < minimum:
-                    minimum = X[rand, 0]
-            except UnboundLocalError:
-                minimum = X[rand, 0]
-            try:
-                if X[rand, 0] > maximum:
-                    maximum = X[rand, 0]
-            except UnboundLocalError:
-                maximum = X[rand, 0]
-            y_temp[j] = y[rand]
-        X_splitted.append(X_temp)
-        y_splitted.append(y_temp)
-    classifier_data.minimum = minimum
-    classifier_data.maximum = maximum
+    X, y = np.asarray(X, dtype = float), np.asarray(y)
+    rng = np.random.default_rng(classifier_data.seed)
+    indices = rng.integers(0, length, size = (number_of_classifiers + 2, length))
+    X_splitted = [X[subset_indices] for subset_indices in indices]
+    y_splitted = [y[subset_indices].astype(int) for subset_indices in indices]
+    drawn = X[:, 0][indices]
+    classifier_data.minimum = drawn.min()
+    classifier_data.maximum = drawn.max()
     return X_splitted, y_splitted
 
 
 def split_sorted_unitary(X: [], y: [], classifier_data: ClassifierData = ClassifierData()):
-    """Splits data into subsets for training, validating and testing
+    """Splits data into subsets for training, validating and testing, subsets are strided views of X and y (no copies)
 
     :param X: []
     :param y: []
@@ -593,33 +576,85 @@ def split_sorted_unitary(X: [], y: [], classifier_data: ClassifierData = Classif
     print('Splitting samples')
     if len(X) < (number_of_classifiers + 2) * number_of_space_parts:
         raise NotEnoughSamplesError('Not enough samples found when sorting (len(X) = {})'.format(len(X)))
-    X_splitted, y_splitted = [], []
+    X, y = np.asarray(X, dtype = float), np.asarray(y, dtype = int)
     length_of_subset = int(len(X) / (number_of_classifiers + 2))
-    for i in range(number_of_classifiers + 2):
-        X_temp, y_temp = np.zeros((length_of_subset, 2)), np.zeros(length_of_subset, dtype = np.int)
-        for j in range(length_of_subset):
-            X_temp[j, :] = (X[j * (number_of_classifiers + 2) + i, :])
-            y_temp[j] = (y[j * (number_of_classifiers + 2) + i])
-        X_splitted.append(X_temp)
-        y_splitted.append(y_temp)
-    classifier_data.minimum, classifier_data.maximum = min(X[:, 0]), max(X[:, 0])
+    X_splitted = [X[i::number_of_classifiers + 2][:length_of_subset] for i in range(number_of_classifiers + 2)]
+    y_splitted = [y[i::number_of_classifiers + 2][:length_of_subset] for i in range(number_of_classifiers + 2)]
+    classifier_data.minimum, classifier_data.maximum = X[:, 0].min(), X[:, 0].max()
     return X_splitted, y_splitted
 
 
 def prepare_samples_for_subspace(X_test: [], y_test: [], j: int,
-                                 classifier_data: ClassifierData = ClassifierData()):
+                                 classifier_data: ClassifierData = ClassifierData(), subspace_indices: [] = None):
     """Preparing sample for testing in j-th subspace
 
     :param X_test: np.array
     :param y_test: np.array
     :param j: int
     :param classifier_data: ClassifierData
-    :return: X_part, y_part: [], []
+    :param subspace_indices: [], precomputed result of get_subspace_indices for X_test, optional
+    :return: X_part, y_part: np.array, np.array
     """
+    X_test, y_test = np.asarray(X_test), np.asarray(y_test)
+    if subspace_indices is not None:
+        return X_test[subspace_indices[j]], y_test[subspace_indices[j]]
     x_samp_min, x_samp_max = get_subspace_limits(j, classifier_data)
-    X_part = [row for row in X_test if x_samp_min <= row[0] < x_samp_max]
-    y_part = [y_test[k] for k in range(len(y_test)) if x_samp_min <= X_test[k][0] < x_samp_max]
-    return X_part, y_part
+    mask = (x_samp_min <= X_test[:, 0]) & (X_test[:, 0] < x_samp_max)
+    return X_test[mask], y_test[mask]
+
+
+def get_subspace_edges(classifier_data: ClassifierData = ClassifierData()):
+    """Gets limits of all subspaces as one ascending array, j-th subspace spans [edges[j], edges[j + 1])
+
+    :param classifier_data: ClassifierData
+    :return: edges: np.array
+    """
+    number_of_space_parts = classifier_data.number_of_space_parts
+    edges = np.empty(number_of_space_parts + 1, dtype = float)
+    for j in range(number_of_space_parts):
+        edges[j], edges[j + 1] = get_subspace_limits(j, classifier_data)
+    return edges
+
+
+def assign_samples_to_subspaces(X: [], classifier_data: ClassifierData = ClassifierData()):
+    """Computes number of subspace for every sample, samples lying beyond all subspaces get -1
+
+    :param X: np.array
+    :param classifier_data: ClassifierData
+    :return: subspace_numbers: np.array
+    """
+    edges = get_subspace_edges(classifier_data)
+    subspace_numbers = np.searchsorted(edges, np.asarray(X)[:, 0], side = 'right') - 1
+    subspace_numbers[subspace_numbers >= len(edges) - 1] = -1
+    return subspace_numbers
+
+
+def get_subspace_indices(X: [], classifier_data: ClassifierData = ClassifierData()):
+    """Groups indices of samples by subspace, so that subspaces can be sliced out without rescanning data
+
+    :param X: np.array
+    :param classifier_data: ClassifierData
+    :return: subspace_indices: [], j-th element is an ascending np.array of indices of samples in j-th subspace
+    """
+    number_of_space_parts = classifier_data.number_of_space_parts
+    subspace_numbers = assign_samples_to_subspaces(X, classifier_data)
+    order = np.argsort(subspace_numbers, kind = 'stable')
+    offsets = np.searchsorted(subspace_numbers[order], np.arange(number_of_space_parts + 1))
+    return [order[offsets[j]:offsets[j + 1]] for j in range(number_of_space_parts)]
+
+
+def get_subspace_numbers(subspace_indices: [], number_of_samples: int):
+    """Inverts result of get_subspace_indices into number of subspace for every sample, samples lying beyond all
+    subspaces get number equal to number of subspaces, so that np.bincount can aggregate per subspace
+
+    :param subspace_indices: []
+    :param number_of_samples: int
+    :return: subspace_numbers: np.array
+    """
+    subspace_numbers = np.full(number_of_samples, len(subspace_indices), dtype = int)
+    for j in range(len(subspace_indices)):
+        subspace_numbers[subspace_indices[j]] = j
+    return subspace_numbers
 
 
 def get_samples_limits(X: []):
@@ -811,6 +846,29 @@ def evaluate_weighted_average_coefficients_from_n_best(coefficients: [], scores:
     return a, b
 
 
+def evaluate_weighted_average_coefficients_for_all_n_best(coefficients: [], scores: [], j: int,
+                                                          classifier_data: ClassifierData = ClassifierData()):
+    """Evaluates coefficients in j-th subspace for every number of best classifiers at once, using prefix sums over
+    classifiers sorted by score the same way as evaluate_weighted_average_coefficients_from_n_best
+
+    :param coefficients: []
+    :param scores: []
+    :param j: int
+    :param classifier_data: ClassifierData
+    :return: a, b: np.array, np.array, element n - 1 holds coefficients evaluated from n best classifiers
+    """
+    number_of_classifiers = classifier_data.number_of_classifiers
+    scores_in_subspace = np.array([scores[i][j] for i in range(number_of_classifiers)], dtype = float)
+    indices = np.argsort(scores_in_subspace, kind = 'stable')[::-1]
+    sorted_scores = scores_in_subspace[indices]
+    sorted_coefficients = np.asarray(coefficients, dtype = float)[indices]
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        score_sums = np.cumsum(sorted_scores)
+        a = np.cumsum(sorted_scores * sorted_coefficients[:, 0]) / score_sums
+        b = np.cumsum(sorted_scores * sorted_coefficients[:, 1]) / score_sums
+    return a, b
+
+
 def get_subspace_limits(j: int, classifier_data: ClassifierData = ClassifierData()):
     """Gets limits of j-th subspace
 
@@ -828,7 +886,8 @@ def get_subspace_limits(j: int, classifier_data: ClassifierData = ClassifierData
 
 
 def test_classifiers(clfs: [], X_validation: [], y_validation: [], coefficients: [],
-                     classifier_data: ClassifierData = ClassifierData()):
+                     classifier_data: ClassifierData = ClassifierData(), subspace_indices: [] = None,
+                     predictions: [] = None):
     """Tests classifiers
 
     :param clfs: clfs: [], scikit classifiers
@@ -836,18 +895,28 @@ def test_classifiers(clfs: [], X_validation: [], y_validation: [], coefficients:
     :param y_validation: np.array
     :param coefficients: []
     :param classifier_data: ClassifierData
+    :param subspace_indices: [], precomputed result of get_subspace_indices for X_validation, optional
+    :param predictions: [], precomputed result of predict_classifiers for X_validation, optional
     :return: scores, cumulated_scores: [], []
     """
     number_of_space_parts = classifier_data.number_of_space_parts
     write_computed_scores = classifier_data.write_computed_scores
+    if subspace_indices is None:
+        subspace_indices = get_subspace_indices(X_validation, classifier_data)
+    if predictions is None:
+        predictions = predict_classifiers(clfs, X_validation)
+    subspace_numbers = get_subspace_numbers(subspace_indices, len(X_validation))
+    part_lengths = np.bincount(subspace_numbers, minlength = number_of_space_parts + 1)[:number_of_space_parts]
     scores, cumulated_scores, i = [], [], 0
-    for clf in clfs:
+    for y_predicted in predictions:
+        properly_classified = \
+            np.bincount(subspace_numbers, weights = y_predicted == y_validation,
+                        minlength = number_of_space_parts + 1)[:number_of_space_parts]
         score, cumulated_score = [], 0
         for j in range(number_of_space_parts):
-            X_part, y_part = prepare_samples_for_subspace(X_validation, y_validation, j, classifier_data)
-            if len(X_part) > 0:
-                score.append(clf.score(X_part, y_part))
-                cumulated_score += clf.score(X_part, y_part) * len(X_part)
+            if part_lengths[j] > 0:
+                score.append(properly_classified[j] / part_lengths[j])
+                cumulated_score += score[j] * part_lengths[j]
             else:
                 score.append(0)
         cumulated_score /= len(X_validation)
@@ -856,13 +925,13 @@ def test_classifiers(clfs: [], X_validation: [], y_validation: [], coefficients:
         a, b = coefficients[i]
 
         if write_computed_scores:
-            compute_scores_manually(X_validation, y_validation, a, b, classifier_data)
+            compute_scores_manually(X_validation, y_validation, a, b, classifier_data, subspace_indices)
         i += 1
     return scores, cumulated_scores
 
 
 def compute_scores_manually(X_validation: [], y_validation: [], a: float, b: float,
-                            classifier_data: ClassifierData = ClassifierData()):
+                            classifier_data: ClassifierData = ClassifierData(), subspace_indices: [] = None):
     """Computes and prints scores manually
 
     :param X_validation: []
@@ -870,13 +939,17 @@ def compute_scores_manually(X_validation: [], y_validation: [], a: float, b: flo
     :param a: float
     :param b: float
     :param classifier_data: ClassifierData
+    :param subspace_indices: [], precomputed result of get_subspace_indices for X_validation, optional
     :return:
     """
     print('Computing scores manually')
     number_of_space_parts = classifier_data.number_of_space_parts
+    if subspace_indices is None:
+        subspace_indices = get_subspace_indices(X_validation, classifier_data)
     manually_computed_scores, overall_absolute_score = [], 0
     for j in range(number_of_space_parts):
-        X_part, y_part = prepare_samples_for_subspace(X_validation, y_validation, j, classifier_data)
+        X_part, y_part = \
+            prepare_samples_for_subspace(X_validation, y_validation, j, classifier_data, subspace_indices)
         propperly_classified, all_classified = 0, 0
         for k in range(len(X_part)):
             if (a * X_part[k][0] + b > X_part[k][1]) ^ (y_part[k] == 1):
@@ -898,46 +971,48 @@ def compute_scores_manually(X_validation: [], y_validation: [], a: float, b: flo
             print(computed_score)
 
 
-def compute_confusion_matrix(clfs: [], X_test: [], y_test: []):
+def predict_classifiers(clfs: [], X: []):
+    """Predicts labels of samples with every classifier
+
+    :param clfs: []
+    :param X: np.array
+    :return: predictions: [], one np.array per classifier
+    """
+    return [clf.predict(X) for clf in clfs]
+
+
+def compute_confusion_matrix(clfs: [], X_test: [], y_test: [], predictions: [] = None):
     """Calculates confusion matrices for defined classifiers
 
     :param clfs: []
     :param X_test: np.array
     :param y_test: np.array
+    :param predictions: [], precomputed result of predict_classifiers for X_test, optional
     :return: []
     """
+    if predictions is None:
+        predictions = predict_classifiers(clfs, X_test)
     confusion_matrices = []
-    for clf in clfs:
-        y_predicted = clf.predict(X_test)
+    for y_predicted in predictions:
         conf_mat = confusion_matrix(y_test, y_predicted)
         confusion_matrices.append(conf_mat)
     return confusion_matrices
 
 
-def prepare_majority_voting(clfs: [], X_test: [], y_test: []):
+def prepare_majority_voting(clfs: [], X_test: [], y_test: [], predictions: [] = None):
     """Returns confusion matrix and score of majority voting of give classifiers
 
     :param clfs: []
     :param X_test: np.array
     :param y_test: np.array
+    :param predictions: [], precomputed result of predict_classifiers for X_test, optional
     :return: conf_mat, score: [], float
     """
-    y_predicted = np.empty(len(X_test), dtype = float)
-    for clf in clfs:
-        y_predicted += clf.predict(X_test)
-    y_predicted /= len(clfs)
-    prop_0_pred_0, prop_0_pred_1, prop_1_pred_0, prop_1_pred_1, score = 0, 0, 0, 0, 0
-    for i in range(len(y_predicted)):
-        if y_test[i] == 0:
-            if y_predicted[i] < .5:
-                prop_0_pred_0 += 1
-            else:
-                prop_0_pred_1 += 1
-        else:
-            if y_predicted[i] < .5:
-                prop_1_pred_0 += 1
-            else:
-                prop_1_pred_1 += 1
+    if predictions is None:
+        predictions = predict_classifiers(clfs, X_test)
+    votes = np.stack(predictions).astype(np.int8)
+    y_predicted = 2 * votes.sum(axis = 0, dtype = int) >= len(votes)
+    prop_0_pred_0, prop_0_pred_1, prop_1_pred_0, prop_1_pred_1 = count_confusion_cells(y_test, y_predicted)
     conf_mat = compose_conf_matrix(prop_0_pred_0, prop_0_pred_1, prop_1_pred_0, prop_1_pred_1)
     score = (prop_0_pred_0 + prop_1_pred_1) / len(y_test)
     return np.array(conf_mat), score
@@ -982,7 +1057,7 @@ def compute_mcc(prop_0_pred_0: int, prop_0_pred_1: int, prop_1_pred_0: int, prop
 
 def prepare_composite_mean_classifier(X_test: [], y_test: [], X: [], coefficients: [], scores: [],
                                       number_of_subplots: int, i: int,
-                                      classifier_data: ClassifierData = ClassifierData()):
+                                      classifier_data: ClassifierData = ClassifierData(), subspace_indices: [] = None):
     """Prepares composite classifiers using mean strategy
 
     :param X_test: np.array
@@ -993,12 +1068,15 @@ def prepare_composite_mean_classifier(X_test: [], y_test: [], X: [], coefficient
     :param number_of_subplots: int
     :param i: int
     :param classifier_data: ClassifierData
+    :param subspace_indices: [], precomputed result of get_subspace_indices for X_test, optional
     :return: scores: []
     """
     number_of_space_parts = classifier_data.number_of_space_parts
     space_division = classifier_data.space_division
     show_plots = classifier_data.show_plots
     print('Preparing composite classifier')
+    if subspace_indices is None:
+        subspace_indices = get_subspace_indices(X_test, classifier_data)
 
     if show_plots:
         ax = plt.subplot(1, number_of_subplots, number_of_subplots - len(space_division) + 1 + i)
@@ -1017,24 +1095,13 @@ def prepare_composite_mean_classifier(X_test: [], y_test: [], X: [], coefficient
             y = a * x + b
             ax.plot(x, y)
 
-        X_part, y_part = prepare_samples_for_subspace(X_test, y_test, j, classifier_data)
-        all_classified, propperly_classified = 0, 0
+        X_part, y_part = prepare_samples_for_subspace(X_test, y_test, j, classifier_data, subspace_indices)
         if len(X_part) > 0 and not (math.isnan(a)) and not (math.isnan(b)):
-            for k in range(len(X_part)):
-                all_classified += 1
-                if y_part[k] >= .5:
-                    if a * X_part[k][0] + b > X_part[k][1]:
-                        prop_1_pred_1 += 1
-                        propperly_classified += 1
-                    else:
-                        prop_1_pred_0 += 1
-                else:
-                    if a * X_part[k][0] + b > X_part[k][1]:
-                        prop_0_pred_1 += 1
-                    else:
-                        prop_0_pred_0 += 1
-                        propperly_classified += 1
-            score.append(propperly_classified / all_classified)
+            y_predicted = a * X_part[:, 0] + b > X_part[:, 1]
+            part_0_pred_0, part_0_pred_1, part_1_pred_0, part_1_pred_1 = count_confusion_cells(y_part, y_predicted)
+            prop_0_pred_0, prop_0_pred_1 = prop_0_pred_0 + part_0_pred_0, prop_0_pred_1 + part_0_pred_1
+            prop_1_pred_0, prop_1_pred_1 = prop_1_pred_0 + part_1_pred_0, prop_1_pred_1 + part_1_pred_1
+            score.append((part_0_pred_0 + part_1_pred_1) / len(X_part))
         else:
             score.append(0)
         part_lengths.append(len(X_part))
@@ -1056,9 +1123,65 @@ def prepare_composite_mean_classifier(X_test: [], y_test: [], X: [], coefficient
     return scores, cumulated_score, np.array(conf_mat)
 
 
+def prepare_composite_mean_classifier_for_all_n_best(X_test: [], y_test: [], coefficients: [], scores: [],
+                                                     classifier_data: ClassifierData = ClassifierData(),
+                                                     subspace_indices: [] = None):
+    """Prepares composite classifiers using mean strategy for every n_best in range(2, number_of_classifiers) at
+    once, equivalent to calling prepare_composite_mean_classifier for each of them without plots
+
+    :param X_test: np.array
+    :param y_test: np.array
+    :param coefficients: []
+    :param scores: []
+    :param classifier_data: ClassifierData
+    :param subspace_indices: [], precomputed result of get_subspace_indices for X_test, optional
+    :return: results_pro_n_best: [], (scores, cumulated_score, conf_mat) for n_best at index n_best - 2
+    """
+    number_of_space_parts = classifier_data.number_of_space_parts
+    number_of_classifiers = classifier_data.number_of_classifiers
+    print('Preparing composite classifiers')
+    if subspace_indices is None:
+        subspace_indices = get_subspace_indices(X_test, classifier_data)
+
+    n_bests = np.arange(2, number_of_classifiers)
+    score = np.zeros((len(n_bests), number_of_space_parts), dtype = float)
+    cells = np.zeros((len(n_bests), 4), dtype = int)
+    for j in range(number_of_space_parts):
+        a, b = evaluate_weighted_average_coefficients_for_all_n_best(coefficients, scores, j, classifier_data)
+        a, b = a[n_bests - 1], b[n_bests - 1]
+        X_part, y_part = prepare_samples_for_subspace(X_test, y_test, j, classifier_data, subspace_indices)
+        is_valid = ~(np.isnan(a) | np.isnan(b))
+        if len(X_part) == 0 or not is_valid.any():
+            continue
+        y_true = np.asarray(y_part) >= .5
+        y_predicted = a[is_valid, np.newaxis] * X_part[np.newaxis, :, 0] + b[is_valid, np.newaxis] > \
+                      X_part[np.newaxis, :, 1]
+        part_cells = np.stack([np.sum(~y_true & ~y_predicted, axis = 1), np.sum(~y_true & y_predicted, axis = 1),
+                               np.sum(y_true & ~y_predicted, axis = 1), np.sum(y_true & y_predicted, axis = 1)],
+                              axis = 1)
+        cells[is_valid] += part_cells
+        score[is_valid, j] = (part_cells[:, 0] + part_cells[:, 3]) / len(X_part)
+
+    results_pro_n_best = []
+    for k in range(len(n_bests)):
+        prop_0_pred_0, prop_0_pred_1, prop_1_pred_0, prop_1_pred_1 = (int(cell) for cell in cells[k])
+        n_best_score = score[k].tolist()
+        cumulated_score = \
+            (prop_0_pred_0 + prop_1_pred_1) / (prop_0_pred_0 + prop_0_pred_1 + prop_1_pred_0 + prop_1_pred_1)
+        if cumulated_score < 0.5:
+            cumulated_score = 1 - cumulated_score
+            for i in range(len(n_best_score)):
+                n_best_score[i] = 1 - n_best_score[i]
+            prop_0_pred_0, prop_0_pred_1 = prop_0_pred_1, prop_0_pred_0
+            prop_1_pred_0, prop_1_pred_1 = prop_1_pred_1, prop_1_pred_0
+        conf_mat = compose_conf_matrix(prop_0_pred_0, prop_0_pred_1, prop_1_pred_0, prop_1_pred_1)
+        results_pro_n_best.append((list(scores) + [n_best_score], cumulated_score, np.array(conf_mat)))
+    return results_pro_n_best
+
+
 def prepare_composite_median_classifier(X_test: [], y_test: [], X: [], coefficients: [], scores: [],
                                         number_of_subplots: int, i: int,
-                                        classifier_data: ClassifierData = ClassifierData()):
+                                        classifier_data: ClassifierData = ClassifierData(), subspace_indices: [] = None):
     """Prepares composite classifiers using median strategy
 
     :param X_test: np.array
@@ -1069,12 +1192,15 @@ def prepare_composite_median_classifier(X_test: [], y_test: [], X: [], coefficie
     :param number_of_subplots: int
     :param i: int
     :param classifier_data: ClassifierData
+    :param subspace_indices: [], precomputed result of get_subspace_indices for X_test, optional
     :return: scores: []
     """
     number_of_space_parts = classifier_data.number_of_space_parts
     space_division = classifier_data.space_division
     show_plots = classifier_data.show_plots
     print('Preparing composite classifier')
+    if subspace_indices is None:
+        subspace_indices = get_subspace_indices(X_test, classifier_data)
 
     if show_plots:
         ax = plt.subplot(1, number_of_subplots, number_of_subplots - len(space_division) + 1 + i)
@@ -1091,30 +1217,16 @@ def prepare_composite_median_classifier(X_test: [], y_test: [], X: [], coefficie
         if show_plots:
             x_subspace_min, x_subspace_max = get_subspace_limits(j, classifier_data)
             x = np.linspace(x_subspace_min, x_subspace_max)
-            y = np.zeros(shape = (1, len(x)), dtype = float)[0]
-            for i in range(len(x)):
-                y[i] = get_decision_limit(x[i], filtered_coeffs)
+            y = get_decision_limits(x, filtered_coeffs)
             ax.plot(x, y)
 
-        X_part, y_part = prepare_samples_for_subspace(X_test, y_test, j, classifier_data)
-        all_classified, propperly_classified = 0, 0
+        X_part, y_part = prepare_samples_for_subspace(X_test, y_test, j, classifier_data, subspace_indices)
         if len(X_part) > 0 and not is_nan:
-            for k in range(len(X_part)):
-                decision_limit = get_decision_limit(X_part[k][0], filtered_coeffs)
-                all_classified += 1
-                if y_part[k] >= .5:
-                    if decision_limit > X_part[k][1]:
-                        prop_1_pred_1 += 1
-                        propperly_classified += 1
-                    else:
-                        prop_1_pred_0 += 1
-                else:
-                    if decision_limit > X_part[k][1]:
-                        prop_0_pred_1 += 1
-                    else:
-                        prop_0_pred_0 += 1
-                        propperly_classified += 1
-            score.append(propperly_classified / all_classified)
+            y_predicted = get_decision_limits(X_part[:, 0], filtered_coeffs) > X_part[:, 1]
+            part_0_pred_0, part_0_pred_1, part_1_pred_0, part_1_pred_1 = count_confusion_cells(y_part, y_predicted)
+            prop_0_pred_0, prop_0_pred_1 = prop_0_pred_0 + part_0_pred_0, prop_0_pred_1 + part_0_pred_1
+            prop_1_pred_0, prop_1_pred_1 = prop_1_pred_0 + part_1_pred_0, prop_1_pred_1 + part_1_pred_1
+            score.append((part_0_pred_0 + part_1_pred_1) / len(X_part))
         else:
             score.append(0)
         part_lengths.append(len(X_part))
@@ -1153,6 +1265,29 @@ def get_decision_limit(sample: float, filtered_coeffs: []):
     return decision_limit
 
 
+def get_decision_limits(samples: [], filtered_coeffs: []):
+    """Gets values of decision limit function for many attribute values at once, vectorized get_decision_limit
+
+    :param samples: np.array
+    :param filtered_coeffs: []
+    :return: decision_limits: np.array
+    """
+    filtered_coeffs = np.asarray(filtered_coeffs, dtype = float)
+    representations = filtered_coeffs[:, 0:1] * np.asarray(samples)[np.newaxis, :] + filtered_coeffs[:, 1:2]
+    return np.median(representations, axis = 0)
+
+
+def count_confusion_cells(y_true: [], y_predicted: []):
+    """Counts cells of confusion matrix, samples labelled with at least .5 are treated as class 1
+
+    :param y_true: np.array
+    :param y_predicted: np.array, bool or binary
+    :return: prop_0_pred_0, prop_0_pred_1, prop_1_pred_0, prop_1_pred_1: int, int, int, int
+    """
+    cells = np.bincount(2 * (np.asarray(y_true) >= .5) + np.asarray(y_predicted, dtype = int), minlength = 4)
+    return tuple(int(cell) for cell in cells)
+
+
 def reduce_coefficients_in_subspace(coefficients: [], scores: [], j: int,
                                     classifier_data: ClassifierData = ClassifierData()):
     """Returns array of coefficients for classificator integration (only best)
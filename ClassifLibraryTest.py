@@ -1,5 +1,7 @@
 import math
+import os
 import random
+import tempfile
 import unittest
 
 import numpy as np
@@ -21,6 +23,62 @@ class MyLibraryTest(unittest.TestCase):
     TEST_FILENAME = 'Dane_9_12_2017.xlsx'
     QUOTIENT = 2 / 3
     conf_matrix = [[400, 100], [200, 300]]
+    # number of classifiers, number of space parts, sorted first attributes of class 0 and 1 and indices of samples
+    # removed from them by previous recursive implementation
+    ASSERT_DISTRIBUTION_CASES = [
+        (1, 5, [0, 0, 0, 1, 2, 2, 3, 5, 5, 7, 8, 9, 10, 11, 12, 13, 19, 19],
+         [1, 2, 3, 4, 5, 5, 7, 8, 9, 11, 12, 13, 13, 13, 15, 15, 16, 17, 18, 19, 19],
+         [17], [0, 6, 9, 14, 15]),
+        (3, 1, [1, 2, 4, 6, 7, 10, 13, 17, 17, 17],
+         [0, 0, 0, 6, 6, 8, 10, 14, 15, 15, 17, 18],
+         [], [0, 1]),
+        (1, 2, [2, 2, 3, 5, 6, 8, 11, 13, 16],
+         [1, 2, 3, 4, 4, 5, 6, 10, 10, 10, 15, 15, 15, 15, 19],
+         [], [0, 13, 14]),
+        (1, 4, [1, 2, 2, 3, 5, 6, 6, 8, 9, 10, 10, 10, 11, 11, 14, 16, 16, 17, 17, 19, 19],
+         [5, 6, 8, 8, 15],
+         [11, 13, 14, 20], []),
+        (1, 4, [3, 4, 6, 9, 12, 18],
+         [0, 0, 3, 4, 6, 6, 6, 7, 9, 9, 10, 11, 13, 14, 15, 17, 17, 18, 19],
+         [], [8, 9, 12, 13]),
+        (1, 4, [0, 0, 0, 2, 4, 4, 4, 5, 6, 8, 10, 13, 14, 15, 16, 19],
+         [2, 2, 3, 5, 6, 7, 8, 8, 8, 12, 13, 14, 15, 15, 17],
+         [0], []),
+        (2, 5, [0, 0, 0, 1, 2, 4, 4, 6, 6, 7, 8, 9, 10, 10, 11, 14, 14, 14, 14, 14, 16, 17, 18],
+         [0, 0, 9, 9, 10, 11, 12, 16, 16, 19],
+         [0, 1, 2, 9, 14, 18, 19, 21, 22], []),
+        (3, 3, [4, 9, 9, 10, 11, 11, 12, 12, 13, 14, 16, 17],
+         [0, 1, 3, 5, 6, 7, 10, 11, 13, 14, 15, 16, 19, 19],
+         [10, 11], [0, 1, 8, 13])]
+    # as above, removed by previous implementation of assert_distribution_simplified
+    ASSERT_DISTRIBUTION_SIMPLIFIED_CASES = [
+        (3, 5, [-1.9, -1.84, -1.34, -1.29, -1.27, -.99, -.93, -.89, -.62, -.49, -.46, -.45, -.27, -.24, -.03, .06, .11,
+                .16, .27, .36, .49, .7, 1.34],
+         [-2.52, -1.53, -.98, -.81, -.81, -.58, -.54, -.48, -.19, -.11, -.05, -.03, .11, .11, .88, 1.06],
+         [0, 1, 5, 11, 12, 13, 18, 19, 20], [0, 14, 15]),
+        (3, 5, [0, 1, 4, 9, 12, 14, 14],
+         [1, 2, 7, 7, 10, 10, 11, 11, 12, 12, 13, 13, 14, 17],
+         [0, 1, 2, 5, 6], [0, 1, 10, 11]),
+        (1, 2, [-1.19, -.68, -.58, -.46, -.2, -.07, .13, .2, .67, 1.44],
+         [-1.99, -1.32, -.79, -.46, .65, .9, 1.15],
+         [4, 5], [2, 3]),
+        (1, 5, [0, 2, 3, 3, 4, 5, 7, 9, 11, 11, 11, 12, 15, 16, 17, 18, 18, 18, 19, 19],
+         [0, 1, 4, 4, 7, 8, 11, 11, 11, 12, 14, 17, 19, 19],
+         [13], [7, 8, 10]),
+        (2, 3, [-2.04, -1.69, -1.29, -.9, -.83, -.62, -.3, -.01, .16, .21, .35, .58, 2.24],
+         [-2.0, -1.13, -1.05, -1.03, -.86, -.59, -.21, -.18, -.12, -.08, .04, .09, .19, .26, .36, .49, .52, .7, .97],
+         [3, 4, 5, 12], [15, 16, 17]),
+        (2, 1, [2, 3, 6, 6, 6, 7, 11, 17, 18, 19],
+         [1, 3, 4, 4, 5, 7, 8, 8, 8, 10, 10, 11, 11, 14, 15, 16, 17, 17, 17, 18, 19, 19, 19],
+         [], [0]),
+        (1, 1, [-1.45, -1.38, -1.05, -.81, -.69, -.67, -.56, -.38, -.33, -.3, -.15, .01, .01, .34, .97, 1.26, 1.41,
+                1.65],
+         [-1.76, -1.22, -1.11, -.75, -.63, -.54, -.51, -.51, -.44, -.3, -.21, -.15, -.14, -.03, -.02, .02, .07, .29,
+          .45, .63, .73, 1.18, 1.34],
+         [], [0, 1]),
+        (3, 3, [0, 0, 1, 2, 2, 3, 4, 4, 4, 6, 6, 8, 9, 10, 11, 11, 12, 12, 13, 13, 16, 17, 18],
+         [0, 3, 4, 7, 11, 15, 16],
+         [7, 8, 9, 10, 14, 15, 16, 17, 22], [])]
 
     def setUp(self):
         self.X, self.y = \
@@ -173,6 +231,31 @@ class MyLibraryTest(unittest.TestCase):
         self.assertEqual(len(X1[0]), 2)
         self.assertEqual(len(X2[0]), 2)
 
+    def test_should_read_keel_file_skipping_header(self):
+        # given
+        lines = ['@relation test', '@attribute a real', '@data', '1.5, 2, 0', '-3, 4.25, 1', '5, 6e-1, 1']
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'test.dat')
+            with open(filename, 'w') as file:
+                file.write('\n'.join(lines) + '\n')
+            # when
+            X, y = ClassifLibrary.read_csv_file(ClassifierData(filename = filename))
+        # then
+        self.assertEqual([[1.5, 2], [-3, 4.25], [5, .6]], X.tolist())
+        self.assertEqual([0, 1, 1], y.tolist())
+
+    def test_should_not_truncate_data_line_at_at_sign(self):
+        # given
+        lines = ['@relation test', '@data', '1.5, 2, 0', '-3, 4@25, 1']
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'test.dat')
+            with open(filename, 'w') as file:
+                file.write('\n'.join(lines) + '\n')
+            # when
+            # then
+            with self.assertRaises(ValueError):
+                ClassifLibrary.read_csv_file(ClassifierData(filename = filename))
+
     def test_should_select_right_features(self):
         # given
         X = [[0, 5, 10], [1, 0, 10], [2, 6, 10], [3, -1, 10], [4, 4, 10]]
@@ -182,8 +265,8 @@ class MyLibraryTest(unittest.TestCase):
         # when
         X0, X1 = ClassifLibrary.make_selection(X, y, ClassifLibrary.ClassifierData())
         # then
-        self.assertEqual(expected_X0, X0)
-        self.assertEqual(expected_X1, X1)
+        self.assertEqual(expected_X0, X0.tolist())
+        self.assertEqual(expected_X1, X1.tolist())
 
     def test_should_select_right_features_when_swapped(self):
         # given
@@ -195,8 +278,8 @@ class MyLibraryTest(unittest.TestCase):
         # when
         X0, X1 = ClassifLibrary.make_selection(X, y, classifier_data)
         # then
-        self.assertEqual(expected_X0, X0)
-        self.assertEqual(expected_X1, X1)
+        self.assertEqual(expected_X0, X0.tolist())
+        self.assertEqual(expected_X1, X1.tolist())
 
     def test_cumulative_length_of_returned_datasets_should_be_multiply_of_number_of_subspaces(self):
         # given
@@ -259,6 +342,33 @@ class MyLibraryTest(unittest.TestCase):
         self.assertEqual(len(X0_full) - 1, len(X0))
         self.assertEqual(len(X1_full) - 2, len(X1))
 
+    def assert_removed_samples(self, assert_function, cases):
+        for number_of_classifiers, number_of_space_parts, values0, values1, removed0, removed1 in cases:
+            # given
+            classifier_data = ClassifierData(number_of_classifiers = number_of_classifiers,
+                                             number_of_space_parts = number_of_space_parts)
+            X0_full = np.column_stack((values0, np.arange(len(values0))))
+            X1_full = np.column_stack((values1, np.arange(len(values1))))
+            # when
+            X0, X1 = assert_function(X0_full, X1_full, classifier_data)
+            # then
+            self.assertEqual(removed0, sorted(set(range(len(X0_full))) - set(X0[:, 1].astype(int))))
+            self.assertEqual(removed1, sorted(set(range(len(X1_full))) - set(X1[:, 1].astype(int))))
+
+    def test_should_assert_distribution_same_as_recursive_implementation(self):
+        self.assert_removed_samples(ClassifLibrary.assert_distribution, self.ASSERT_DISTRIBUTION_CASES)
+
+    def test_should_cut_off_heavy_tail_of_imbalanced_dataset(self):
+        # given
+        rng = np.random.default_rng(1)
+        X0_full = np.column_stack((np.sort(rng.pareto(.5, 3000)), np.zeros(3000)))
+        X1_full = np.column_stack((np.sort(rng.uniform(0, 1, 50)), np.ones(50)))
+        # when
+        X0, X1 = ClassifLibrary.assert_distribution(X0_full, X1_full)
+        # then
+        self.assertEqual(2815, len(X0))
+        self.assertEqual(len(X1_full), len(X1))
+
     def test_should_have_amount_of_data_multiple_of_number_of_classifiers_plus_2_in_every_subspace_own_dataset(self):
         # given
         X0_full = np.array(
@@ -350,6 +460,10 @@ class MyLibraryTest(unittest.TestCase):
         for i in range(self.NUMBER_OF_SUBSPACES):
             self.assertEqual(0, (lengths0[i] + lengths1[i]) % (self.NUMBER_OF_CLASSIFIERS + 2))
 
+    def test_should_assert_distribution_simplified_same_as_previous_implementation(self):
+        self.assert_removed_samples(ClassifLibrary.assert_distribution_simplified,
+                                    self.ASSERT_DISTRIBUTION_SIMPLIFIED_CASES)
+
     def test_should_return_right_extrema(self):
         # given
         X0 = np.array([[-20, 0], [0, 0], [10, 0]])
@@ -360,17 +474,6 @@ class MyLibraryTest(unittest.TestCase):
         self.assertEqual(X0[0][0], x_min)
         self.assertEqual(X1[-1][0], x_max)
 
-    def test_should_return_right_count_and_index(self):
-        # given
-        X = np.array([[0, 0], [0, 0], [0, 0], [0, 0], [3, 0], [10, 0]])
-        # when
-        counter, index = \
-            ClassifLibrary.get_count_of_samples_in_subspace_and_beg_ind_of_next_subspace(X, X[0][0],
-                                                                                         X[-1][0], 1)
-        # then
-        self.assertEqual(1, counter)
-        self.assertEqual(5, index)
-
     def test_should_return_right_subtraction_and_rest_when_counter_bigger(self):
         # given
         counter, remainder = 5, 3
@@ -389,70 +492,6 @@ class MyLibraryTest(unittest.TestCase):
         self.assertEqual(counter, subtraction)
         self.assertEqual(remainder - subtraction, rest)
 
-    def test_should_limit_datasets_for_every_subspace_but_last(self):
-        # given
-        X0_raw = np.array([[1, 0], [2, 0], [3, 0], [4, 0], [5, 0], [6, 0], [7, 0], [8, 0], [9, 0], [10, 0], [11, 0],
-                           [12, 0], [13, 0], [14, 0], [15, 0], [16, 0]])
-        X1_raw = np.array([[1, 0], [2, 0], [3, 0], [4, 0], [5, 0], [6, 0], [7, 0], [8, 0], [9, 0], [10, 0], [11, 0],
-                           [12, 0], [13, 0], [14, 0], [15, 0], [16, 0], [17, 0]])
-        counter, remainder, index0, index1, is_first_bigger = 2, 3, int(len(X0_raw) / 2), int(len(X1_raw) / 2), False
-        # when
-        X0, X1 = \
-            ClassifLibrary.limit_datasets_for_every_subspace_but_last(X0_raw, X1_raw, counter, remainder,
-                                                                      index0, index1, is_first_bigger)
-        # then
-        self.assertEqual(remainder - counter, len(X0_raw) - len(X0))
-        self.assertEqual(counter, len(X1_raw) - len(X1))
-
-    def test_should_limit_datasets_for_last_subspace(self):
-        # given
-        X0_raw = np.array([[1, 0], [2, 0], [3, 0], [4, 0], [5, 0], [6, 0], [7, 0], [8, 0], [9, 0], [10, 0], [11, 0],
-                           [12, 0], [13, 0], [14, 0], [15, 0], [16, 0]])
-        X1_raw = np.array([[1, 0], [2, 0], [3, 0], [4, 0], [5, 0], [6, 0], [7, 0], [8, 0], [9, 0], [10, 0], [11, 0],
-                           [12, 0], [13, 0], [14, 0], [15, 0], [16, 0], [17, 0]])
-        counter, remainder, index0, index1, is_first_bigger = 2, 3, int(len(X0_raw) / 2), int(len(X1_raw) / 2), False
-        # when
-        X0, X1 = \
-            ClassifLibrary.limit_datasets_for_last_subspace(X0_raw, X1_raw, counter, remainder, index0, index1,
-                                                            is_first_bigger)
-        # then
-        self.assertEqual(remainder - counter, len(X0_raw) - len(X0))
-        self.assertEqual(counter, len(X1_raw) - len(X1))
-
-    def test_should_limit_datasets_when_last(self):
-        # given
-        X0_raw = np.array(
-            [[1, 0], [2, 0], [3, 0], [4, 0], [5, 0], [6, 0], [7, 0], [8, 0], [9, 0], [10, 0], [11, 0], [12, 0],
-             [13, 0], [14, 0], [15, 0], [16, 0]])
-        X1_raw = np.array(
-            [[1, 0], [2, 0], [3, 0], [4, 0], [5, 0], [6, 0], [7, 0], [8, 0], [9, 0], [10, 0], [11, 0], [12, 0],
-             [13, 0], [14, 0], [15, 0], [16, 0], [17, 0]])
-        counter, remainder, index0, index1, is_first_bigger, is_last = \
-            2, 3, int(len(X0_raw) / 2), int(len(X1_raw) / 2), False, True
-        # when
-        X0, X1 = \
-            ClassifLibrary.limit_datasets(X0_raw, X1_raw, counter, remainder, index0, index1, is_first_bigger, is_last)
-        # then
-        self.assertEqual(remainder - counter, len(X0_raw) - len(X0))
-        self.assertEqual(counter, len(X1_raw) - len(X1))
-
-    def test_should_limit_datasets_when_not_last(self):
-        # given
-        X0_raw = np.array(
-            [[1, 0], [2, 0], [3, 0], [4, 0], [5, 0], [6, 0], [7, 0], [8, 0], [9, 0], [10, 0], [11, 0], [12, 0],
-             [13, 0], [14, 0], [15, 0], [16, 0]])
-        X1_raw = np.array(
-            [[1, 0], [2, 0], [3, 0], [4, 0], [5, 0], [6, 0], [7, 0], [8, 0], [9, 0], [10, 0], [11, 0], [12, 0],
-             [13, 0], [14, 0], [15, 0], [16, 0], [17, 0]])
-        counter, remainder, index0, index1, is_first_bigger, is_last = 2, 3, int(len(X0_raw) / 2), \
-                                                                       int(len(X1_raw) / 2), False, False
-        # when
-        X0, X1 = \
-            ClassifLibrary.limit_datasets(X0_raw, X1_raw, counter, remainder, index0, index1, is_first_bigger, is_last)
-        # then
-        self.assertEqual(remainder - counter, len(X0_raw) - len(X0))
-        self.assertEqual(counter, len(X1_raw) - len(X1))
-
     def test_should_have_amount_of_data_as_multiple_of_number_of_classifiers_plus_2_in_every_subspace_for_real_dataset(
             self):
         # given
@@ -578,6 +617,21 @@ class MyLibraryTest(unittest.TestCase):
                 self.assertTrue(X_1[i][j] in X_2[i])
                 self.assertTrue(X_2[i][j] in X_1[i])
 
+    def test_should_split_into_strided_views_without_copying(self):
+        # given
+        X, y = self.X.astype(float), self.y.astype(int)
+        number_of_subsets = self.NUMBER_OF_CLASSIFIERS + 2
+        length_of_subset = int(len(X) / number_of_subsets)
+        # when
+        X_splitted, y_splitted = ClassifLibrary.split_sorted_unitary(X, y)
+        # then
+        for i in range(number_of_subsets):
+            self.assertTrue(np.shares_memory(X, X_splitted[i]))
+            self.assertEqual(length_of_subset, len(X_splitted[i]))
+            for j in range(length_of_subset):
+                self.assertTrue(np.array_equal(X[j * number_of_subsets + i], X_splitted[i][j]))
+                self.assertEqual(y[j * number_of_subsets + i], y_splitted[i][j])
+
     def test_should_return_same_division_on_generated_data_every_time(self):
         # given
         ar, N = [], 10000
@@ -647,6 +701,60 @@ class MyLibraryTest(unittest.TestCase):
         for i in range(len(X_sub)):
             self.assertTrue(X_sub[i][0] <= treshold)
 
+    def test_should_group_same_samples_by_subspace_indices_as_by_limits(self):
+        # given
+        X = np.array([[3, 3], [1, 1], [5, 5], [4, 4], [1, 1], [2.6, 2], [5, 0]])
+        y = np.array([0, 1, 0, 1, 0, 1, 1])
+        data = ClassifierData(number_of_space_parts = 3)
+        data.minimum, data.maximum = 1, 5
+        # when
+        subspace_indices = ClassifLibrary.get_subspace_indices(X, data)
+        # then
+        self.assertEqual(data.number_of_space_parts, len(subspace_indices))
+        for j in range(data.number_of_space_parts):
+            x_samp_min, x_samp_max = ClassifLibrary.get_subspace_limits(j, data)
+            expected = [k for k in range(len(X)) if x_samp_min <= X[k][0] < x_samp_max]
+            self.assertEqual(expected, subspace_indices[j].tolist())
+            X_part, y_part = ClassifLibrary.prepare_samples_for_subspace(X, y, j, data, subspace_indices)
+            self.assertTrue(np.array_equal(X[expected], X_part))
+            self.assertTrue(np.array_equal(y[expected], y_part))
+
+    def test_should_score_classifiers_in_subspaces_like_scikit(self):
+        # given
+        data = ClassifierData(number_of_space_parts = 4)
+        data.minimum, data.maximum = self.X[:, 0].min(), self.X[:, 0].max()
+        clf = NearestCentroid().fit(self.X[::2], self.y[::2])
+        X_validation, y_validation = self.X[1::2], self.y[1::2]
+        # when
+        scores, cumulated_scores = \
+            ClassifLibrary.test_classifiers([clf], X_validation, y_validation, [[0, 0]], data)
+        # then
+        for j in range(data.number_of_space_parts):
+            X_part, y_part = ClassifLibrary.prepare_samples_for_subspace(X_validation, y_validation, j, data)
+            expected = clf.score(X_part, y_part) if len(X_part) > 0 else 0
+            self.assertEqual(expected, scores[0][j])
+        self.assertAlmostEqual(clf.score(X_validation[X_validation[:, 0] < data.maximum],
+                                         y_validation[X_validation[:, 0] < data.maximum]) *
+                               np.sum(X_validation[:, 0] < data.maximum) / len(X_validation), cumulated_scores[0])
+
+    def test_should_draw_same_bootstrap_samples_for_same_seed(self):
+        # given
+        first_data, second_data = ClassifierData(seed = 5), ClassifierData(seed = 5)
+        # when
+        X_first, y_first = ClassifLibrary.split_sorted_unitary_bagging(self.X, self.y, first_data)
+        X_second, y_second = ClassifLibrary.split_sorted_unitary_bagging(self.X, self.y, second_data)
+        # then
+        self.assertEqual(first_data.number_of_classifiers + 2, len(X_first))
+        for i in range(len(X_first)):
+            self.assertEqual(self.X.shape, X_first[i].shape)
+            self.assertTrue(np.array_equal(X_first[i], X_second[i]))
+            self.assertTrue(np.array_equal(y_first[i], y_second[i]))
+            samples = set(zip(map(tuple, self.X), self.y))
+            for k in range(len(X_first[i])):
+                self.assertIn((tuple(X_first[i][k]), y_first[i][k]), samples)
+        self.assertEqual(min(X[:, 0].min() for X in X_first), first_data.minimum)
+        self.assertEqual(max(X[:, 0].max() for X in X_first), first_data.maximum)
+
     def test_should_return_right_minima_and_maxima(self):
         # given
         X = np.array([[1, 1], [2, 2], [3, 3], [4, 4], [5, 5]])
@@ -710,6 +818,29 @@ class MyLibraryTest(unittest.TestCase):
         self.assertEqual((coefficients[2][1] * scores[2][0] + coefficients[3][1] * scores[3][0]) /
                          (scores[2][0] + scores[3][0]), b)
 
+    def test_should_prepare_same_mean_composites_for_all_n_best_at_once(self):
+        # given
+        number_of_classifiers, number_of_space_parts = 6, 4
+        coefficients = [[random.uniform(-1, 1), random.uniform(-1, 1)] for _ in range(number_of_classifiers)]
+        scores = [[random.choice([0, .25, .5, .75, 1]) for _ in range(number_of_space_parts)]
+                  for _ in range(number_of_classifiers)]
+        data = ClassifierData(number_of_classifiers = number_of_classifiers,
+                              number_of_space_parts = number_of_space_parts, show_plots = False)
+        data.minimum, data.maximum = self.X[:, 0].min(), self.X[:, 0].max()
+        # when
+        results_pro_n_best = \
+            ClassifLibrary.prepare_composite_mean_classifier_for_all_n_best(self.X, self.y, coefficients, scores, data)
+        # then
+        for n_best in range(2, number_of_classifiers):
+            data.number_of_best_classifiers = n_best
+            expected_scores, expected_score, expected_conf_mat = \
+                ClassifLibrary.prepare_composite_mean_classifier(self.X, self.y, self.X, coefficients, list(scores),
+                                                                 0, 0, data)
+            target_scores, target_score, target_conf_mat = results_pro_n_best[n_best - 2]
+            self.assertEqual(expected_scores, target_scores)
+            self.assertEqual(expected_score, target_score)
+            self.assertTrue(np.array_equal(expected_conf_mat, target_conf_mat))
+
     def ignore_test_should_return_subspace_limits(self):
         # given
         X = np.array([[0.1, 0], [1.3, 1], [2.5, 2], [3.7, 3], [7.9, 7], [8.7, 8], [9.5, 9], [10.3, 10]])
@@ -905,6 +1036,39 @@ class MyLibraryTest(unittest.TestCase):
         self.assertEqual(np.mean([i_mcc1, i_mcc2, i_mcc3, i_mcc4]), result[0][0].i_mcc)
         self.assertEqual(np.std([i_mcc1, i_mcc2, i_mcc3, i_mcc4]), result[0][0].i_mcc_std)
 
+    def test_should_return_same_decision_limits_as_for_single_samples(self):
+        # given
+        samples = np.array([random.uniform(-10, 10) for _ in range(50)])
+        for num_of_coeffs in [2, 3, 8, 9]:
+            coeffs = [[random.uniform(-5, 5), random.uniform(-5, 5)] for _ in range(num_of_coeffs)]
+            # when
+            y = ClassifLibrary.get_decision_limits(samples, coeffs)
+            # then
+            for k in range(len(samples)):
+                self.assertEqual(ClassifLibrary.get_decision_limit(samples[k], coeffs), y[k])
+
+    def test_should_vote_with_majority_of_classifiers(self):
+        # given
+        X_test = np.zeros((6, 2))
+        y_test = np.array([0, 0, 0, 1, 1, 1])
+        predictions = [np.array([0, 1, 0, 1, 1, 0]), np.array([0, 1, 1, 0, 1, 0]), np.array([1, 1, 0, 0, 1, 0]),
+                       np.array([0, 0, 1, 1, 1, 0])]
+        # when
+        conf_mat, score = ClassifLibrary.prepare_majority_voting([], X_test, y_test, predictions)
+        # then
+        self.assertEqual([[1, 2], [1, 2]], conf_mat.tolist())
+        self.assertEqual(3 / 6, score)
+
+    def test_should_count_confusion_cells(self):
+        # given
+        y_true = np.array([0, 0, 0, 1, 1, 1, 1, 0])
+        y_predicted = np.array([0, 1, 1, 0, 1, 1, 1, 0], dtype = bool)
+        # when
+        prop_0_pred_0, prop_0_pred_1, prop_1_pred_0, prop_1_pred_1 = \
+            ClassifLibrary.count_confusion_cells(y_true, y_predicted)
+        # then
+        self.assertEqual((2, 2, 1, 3), (prop_0_pred_0, prop_0_pred_1, prop_1_pred_0, prop_1_pred_1))
+
     def test_should_return_right_decision_limit_for_odd_coef_num_for_0(self):
         # given
         x = 0
@@ -1,9 +1,12 @@
 import os
+from functools import lru_cache
 
 import matplotlib.pyplot as plt
 
 import FileHelper
 import PlotHelper
+from ResultStore import ResultStore
+from ResultTable import ResultTable
 
 filenames = ['biodeg.scsv', 'bupa.dat', 'cryotherapy.xlsx',
              'data_banknote_authentication.csv', 'haberman.dat',
@@ -31,86 +34,57 @@ measures = ['score', 'mcc']
 intRef = ['i', 'mv']
 
 
-def read_in_objects():
+def read_in_table():
     name_pattern = "n_{}_b_{}_i_{}.xls"
     n_class_range = list(range(3, 10, 2))
     i_meth_range = [0, 1]
     bagging_range = [0, 1]
-    result_objects = []
+    tables = []
     for n_class in n_class_range:
         for bagging in bagging_range:
             for i_meth in i_meth_range:
                 res_filename = name_pattern.format(n_class, bagging, i_meth)
                 absolute_path = os.path.join(os.path.dirname(__file__), "results/" + res_filename)
-                file_objects = FileHelper.read_objects_from_file(absolute_path, n_class, bagging, i_meth)
-                result_objects.append(file_objects)
-    result_objects = [item for sublist in result_objects for item in sublist]
-    return result_objects
+                tables.append(FileHelper.read_table_from_file_cached(absolute_path, n_class, bagging, i_meth))
+    return ResultTable.concatenate(tables)
+
+
+def read_in_objects():
+    return read_in_table().to_res_objects()
+
+
+@lru_cache(maxsize = None)
+def get_result_store():
+    """Reads in result objects once pro session and keeps them indexed
+
+    :return: ResultStore
+    """
+    return ResultStore(read_in_objects())
 
 
 def get_dependent_on_space_parts(filename, n_class, n_best, i_meth, bagging):
-    result_objects = read_in_objects()
-    related = []
-    for obj in result_objects:
-        if obj.filename == filename \
-                and obj.n_class == n_class \
-                and obj.n_best == n_best \
-                and obj.i_meth == i_meth \
-                and obj.bagging == bagging:
-            related.append(obj)
-    return related
+    return get_result_store().select(filename = filename, n_class = n_class, n_best = n_best, i_meth = i_meth,
+                                     bagging = bagging)
 
 
 def get_dependent_on_n_classif_const_n_best(filename, space_parts, n_best, i_meth, bagging):
-    result_objects = read_in_objects()
-    related = []
-    for obj in result_objects:
-        if obj.filename == filename \
-                and obj.space_parts == space_parts \
-                and obj.n_best == n_best \
-                and obj.i_meth == i_meth \
-                and obj.bagging == bagging:
-            related.append(obj)
-    return related
+    return get_result_store().select(filename = filename, space_parts = space_parts, n_best = n_best, i_meth = i_meth,
+                                     bagging = bagging)
 
 
 def get_dependent_on_n_classif_non_const_n_best(filename, space_parts, n_best_diff, i_meth, bagging):
-    result_objects = read_in_objects()
-    related = []
-    for obj in result_objects:
-        if obj.filename == filename \
-                and obj.space_parts == space_parts \
-                and obj.n_class - obj.n_best == n_best_diff \
-                and obj.i_meth == i_meth \
-                and obj.bagging == bagging:
-            related.append(obj)
-    return related
+    return get_result_store().select(filename = filename, space_parts = space_parts, n_best_diff = n_best_diff,
+                                     i_meth = i_meth, bagging = bagging)
 
 
 def get_dependent_on_n_best(filename, space_parts, n_class, i_meth, bagging):
-    result_objects = read_in_objects()
-    related = []
-    for obj in result_objects:
-        if obj.filename == filename \
-                and obj.space_parts == space_parts \
-                and obj.n_class == n_class \
-                and obj.i_meth == i_meth \
-                and obj.bagging == bagging:
-            related.append(obj)
-    return related
+    return get_result_store().select(filename = filename, space_parts = space_parts, n_class = n_class, i_meth = i_meth,
+                                     bagging = bagging)
 
 
 def get_dependent_on_filename(space_parts, n_class, n_best, i_meth, bagging):
-    result_objects = read_in_objects()
-    related = []
-    for obj in result_objects:
-        if obj.space_parts == space_parts \
-                and obj.n_class == n_class \
-                and obj.n_best == n_best \
-                and obj.i_meth == i_meth \
-                and obj.bagging == bagging:
-            related.append(obj)
-    return related
+    return get_result_store().select(space_parts = space_parts, n_class = n_class, n_best = n_best, i_meth = i_meth,
+                                     bagging = bagging)
 
 
 def plot_dependence(filename: str = "biodeg.scsv",
@@ -318,19 +292,12 @@ def print_tables():
 
 
 def get_obj(n_class, n_best, n_space):
-    obj = read_in_objects()
-    res = []
-    for o in obj:
-        if o.n_class == n_class and o.n_best == n_best and o.space_parts == n_space and o.bagging == 0:
-            res.append(o)
-    return res
+    return get_result_store().select(n_class = n_class, n_best = n_best, space_parts = n_space, bagging = 0)
 
 
 def get_one(n_class, n_best, n_space, filename, meth):
-    obj = read_in_objects()
-    for o in obj:
-        if o.n_class == n_class and o.n_best == n_best and o.space_parts == n_space and o.bagging == 0 and o.filename == filename and o.i_meth == meth:
-            return o
+    return get_result_store().select_one(n_class = n_class, n_best = n_best, space_parts = n_space, bagging = 0,
+                                         filename = filename, i_meth = meth)
 
 
 """
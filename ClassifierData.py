@@ -33,7 +33,14 @@ class ClassifierData:
                  logging_intermediate_results: bool = False,
                  type_of_composition: CompositionType = CompositionType.MEAN,
                  minimum: float = 0,
-                 maximum: float = 0):
+                 maximum: float = 0,
+                 seed: int = None,
+                 dataset_cache_directory: str = None,
+                 dataset_cache_size_limit: int = 2 ** 30,
+                 memory_mapped: bool = False,
+                 checkpoint_directory: str = None,
+                 resume_from_checkpoints: bool = False,
+                 bagging_iteration: int = 0):
         self.type_of_classifier = type_of_classifier
         self.are_samples_generated = are_samples_generated
         self.number_of_samples_if_generated = number_of_samples_if_generated
@@ -58,6 +65,13 @@ class ClassifierData:
         self.type_of_composition = type_of_composition
         self.minimum = minimum
         self.maximum = maximum
+        self.seed = seed
+        self.dataset_cache_directory = dataset_cache_directory
+        self.dataset_cache_size_limit = dataset_cache_size_limit
+        self.memory_mapped = memory_mapped
+        self.checkpoint_directory = checkpoint_directory
+        self.resume_from_checkpoints = resume_from_checkpoints
+        self.bagging_iteration = bagging_iteration
 
     def validate(self):
         print('Validating parameters')
@@ -83,6 +97,13 @@ class ClassifierData:
         self.validate_logging_to_file()
         self.validate_logging_intermediate_results()
         self.validate_type_of_composition()
+        self.validate_seed()
+        self.validate_dataset_cache_directory()
+        self.validate_dataset_cache_size_limit()
+        self.validate_memory_mapped()
+        self.validate_checkpoint_directory()
+        self.validate_resume_from_checkpoints()
+        self.validate_bagging_iteration()
         self.cross_validate()
         print('Parameters valid\n')
 
@@ -206,6 +227,46 @@ class ClassifierData:
         if not type(self.type_of_composition) is CompositionType:
             raise Exception('type_of_composition must be of type CompositionType')
 
+    def validate_seed(self):
+        if self.seed is None:
+            return
+        if not type(self.seed) is int:
+            raise Exception('seed must be of type int')
+        if self.seed < 0:
+            raise Exception('seed must be non-negative')
+
+    def validate_dataset_cache_directory(self):
+        if self.dataset_cache_directory is None:
+            return
+        if not type(self.dataset_cache_directory) is str:
+            raise Exception('dataset_cache_directory must be of type str')
+
+    def validate_dataset_cache_size_limit(self):
+        if not type(self.dataset_cache_size_limit) is int:
+            raise Exception('dataset_cache_size_limit must be of type int')
+        if self.dataset_cache_size_limit <= 0:
+            raise Exception('dataset_cache_size_limit must be positive')
+
+    def validate_memory_mapped(self):
+        if not type(self.memory_mapped) is bool:
+            raise Exception('memory_mapped must be of type bool')
+
+    def validate_checkpoint_directory(self):
+        if self.checkpoint_directory is None:
+            return
+        if not type(self.checkpoint_directory) is str:
+            raise Exception('checkpoint_directory must be of type str')
+
+    def validate_resume_from_checkpoints(self):
+        if not type(self.resume_from_checkpoints) is bool:
+            raise Exception('resume_from_checkpoints must be of type bool')
+
+    def validate_bagging_iteration(self):
+        if not type(self.bagging_iteration) is int:
+            raise Exception('bagging_iteration must be of type int')
+        if self.bagging_iteration < 0:
+            raise Exception('bagging_iteration must be positive')
+
     def cross_validate(self):
         if self.bagging and self.generate_all_permutations:
             print('self.bagging == True and self.generate_all_permutations == True')
@@ -312,6 +312,96 @@ class ClassifierDataTest(unittest.TestCase):
         with self.assertRaisesRegex(Exception, 'type_of_composition must be of type CompositionType'):
             classifier_data.validate_type_of_composition()
 
+    def test_validate_seed_non_int(self):
+        # given
+        seed = 'test'
+        # when
+        classifier_data = ClassifierData(seed = seed)
+        # then
+        with self.assertRaisesRegex(Exception, 'seed must be of type int'):
+            classifier_data.validate_seed()
+
+    def test_validate_seed_negative(self):
+        # given
+        seed = -1
+        # when
+        classifier_data = ClassifierData(seed = seed)
+        # then
+        with self.assertRaisesRegex(Exception, 'seed must be non-negative'):
+            classifier_data.validate_seed()
+
+    def test_validate_dataset_cache_directory(self):
+        # given
+        dataset_cache_directory = 1
+        # when
+        classifier_data = ClassifierData(dataset_cache_directory = dataset_cache_directory)
+        # then
+        with self.assertRaisesRegex(Exception, 'dataset_cache_directory must be of type str'):
+            classifier_data.validate_dataset_cache_directory()
+
+    def test_validate_dataset_cache_size_limit_non_int(self):
+        # given
+        dataset_cache_size_limit = 'test'
+        # when
+        classifier_data = ClassifierData(dataset_cache_size_limit = dataset_cache_size_limit)
+        # then
+        with self.assertRaisesRegex(Exception, 'dataset_cache_size_limit must be of type int'):
+            classifier_data.validate_dataset_cache_size_limit()
+
+    def test_validate_dataset_cache_size_limit_too_low(self):
+        # given
+        dataset_cache_size_limit = 0
+        # when
+        classifier_data = ClassifierData(dataset_cache_size_limit = dataset_cache_size_limit)
+        # then
+        with self.assertRaisesRegex(Exception, 'dataset_cache_size_limit must be positive'):
+            classifier_data.validate_dataset_cache_size_limit()
+
+    def test_validate_memory_mapped(self):
+        # given
+        memory_mapped = 'test'
+        # when
+        classifier_data = ClassifierData(memory_mapped = memory_mapped)
+        # then
+        with self.assertRaisesRegex(Exception, 'memory_mapped must be of type bool'):
+            classifier_data.validate_memory_mapped()
+
+    def test_validate_checkpoint_directory(self):
+        # given
+        checkpoint_directory = 1
+        # when
+        classifier_data = ClassifierData(checkpoint_directory = checkpoint_directory)
+        # then
+        with self.assertRaisesRegex(Exception, 'checkpoint_directory must be of type str'):
+            classifier_data.validate_checkpoint_directory()
+
+    def test_validate_resume_from_checkpoints(self):
+        # given
+        resume_from_checkpoints = 'test'
+        # when
+        classifier_data = ClassifierData(resume_from_checkpoints = resume_from_checkpoints)
+        # then
+        with self.assertRaisesRegex(Exception, 'resume_from_checkpoints must be of type bool'):
+            classifier_data.validate_resume_from_checkpoints()
+
+    def test_validate_bagging_iteration_non_int(self):
+        # given
+        bagging_iteration = 'test'
+        # when
+        classifier_data = ClassifierData(bagging_iteration = bagging_iteration)
+        # then
+        with self.assertRaisesRegex(Exception, 'bagging_iteration must be of type int'):
+            classifier_data.validate_bagging_iteration()
+
+    def test_validate_bagging_iteration_negative(self):
+        # given
+        bagging_iteration = -1
+        # when
+        classifier_data = ClassifierData(bagging_iteration = bagging_iteration)
+        # then
+        with self.assertRaisesRegex(Exception, 'bagging_iteration must be positive'):
+            classifier_data.validate_bagging_iteration()
+
     def test_cross_validate_bagging_generate_all_permutations(self):
         # given
         generate_all_permutations = True
@@ -0,0 +1,120 @@
+import hashlib
+import os
+
+import numpy as np
+
+from ClassifierData import ClassifierData
+
+CACHE_EXTENSION = '.npz'
+HASH_CHUNK_SIZE = 1 << 20
+
+
+def compute_file_hash(filename: str):
+    """Computes sha256 of file content, reading it in chunks
+
+    :param filename: str
+    :return: str
+    """
+    file_hash = hashlib.sha256()
+    with open(filename, 'rb') as file:
+        for chunk in iter(lambda: file.read(HASH_CHUNK_SIZE), b''):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+def get_cache_key(classifier_data: ClassifierData = ClassifierData()):
+    """Builds key of prepared dataset from file content and parameters, which influence preparation, extension of
+    file is part of key as it selects parser and separator
+
+    :param classifier_data: ClassifierData
+    :return: str
+    """
+    parameters = [compute_file_hash(classifier_data.filename),
+                  os.path.splitext(classifier_data.filename)[1],
+                  classifier_data.memory_mapped,
+                  classifier_data.switch_columns_while_loading,
+                  classifier_data.is_validation_hard,
+                  classifier_data.number_of_classifiers,
+                  classifier_data.number_of_space_parts,
+                  classifier_data.number_of_dataset_if_not_generated]
+    return hashlib.sha256(repr(parameters).encode()).hexdigest()
+
+
+def get_cache_filename(key: str, classifier_data: ClassifierData = ClassifierData()):
+    """Returns path of cache entry
+
+    :param key: str
+    :param classifier_data: ClassifierData
+    :return: str
+    """
+    return os.path.join(classifier_data.dataset_cache_directory, key + CACHE_EXTENSION)
+
+
+def load(key: str, classifier_data: ClassifierData = ClassifierData()):
+    """Loads prepared dataset from cache and marks it as recently used
+
+    :param key: str
+    :param classifier_data: ClassifierData
+    :return: X, y: np.array, np.array or None, None if there is no entry
+    """
+    cache_filename = get_cache_filename(key, classifier_data)
+    try:
+        with np.load(cache_filename) as entry:
+            X, y = entry['X'], entry['y']
+    except (FileNotFoundError, OSError, KeyError, ValueError):
+        return None, None
+    try:
+        os.utime(cache_filename)
+    except FileNotFoundError:
+        pass
+    return X, y
+
+
+def store(key: str, X: [], y: [], classifier_data: ClassifierData = ClassifierData()):
+    """Stores prepared dataset in cache atomically and evicts least recently used entries over size limit
+
+    :param key: str
+    :param X: np.array
+    :param y: np.array
+    :param classifier_data: ClassifierData
+    :return:
+    """
+    os.makedirs(classifier_data.dataset_cache_directory, exist_ok = True)
+    cache_filename = get_cache_filename(key, classifier_data)
+    temporary_filename = '{}.{}.tmp'.format(cache_filename, os.getpid())
+    with open(temporary_filename, 'wb') as file:
+        np.savez(file, X = X, y = y)
+    os.replace(temporary_filename, cache_filename)
+    evict(classifier_data, cache_filename)
+
+
+def evict(classifier_data: ClassifierData = ClassifierData(), protected_filename: str = None):
+    """Removes least recently used entries until cache fits in dataset_cache_size_limit
+
+    :param classifier_data: ClassifierData
+    :param protected_filename: str, entry, which is never removed
+    :return:
+    """
+    directory = classifier_data.dataset_cache_directory
+    entries = []
+    for name in os.listdir(directory):
+        if not name.endswith(CACHE_EXTENSION):
+            continue
+        path = os.path.join(directory, name)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+    entries.sort()
+    total_size = sum(size for _, size, _ in entries)
+    for _, size, path in entries:
+        if total_size <= classifier_data.dataset_cache_size_limit:
+            break
+        if path == protected_filename:
+            continue
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total_size -= size
@@ -0,0 +1,78 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+import DatasetCache
+from ClassifierData import ClassifierData
+
+
+class DatasetCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.directory.name, 'data.dat')
+        with open(self.filename, 'w') as file:
+            file.write('1, 2, 0\n3, 4, 1\n')
+        self.cache_directory = os.path.join(self.directory.name, 'cache')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_should_load_stored_samples(self):
+        # given
+        classifier_data = ClassifierData(filename = self.filename, dataset_cache_directory = self.cache_directory)
+        X, y = np.array([[1., 2.], [3., 4.]]), np.array([0, 1])
+        key = DatasetCache.get_cache_key(classifier_data)
+        # when
+        DatasetCache.store(key, X, y, classifier_data)
+        X_loaded, y_loaded = DatasetCache.load(key, classifier_data)
+        # then
+        self.assertTrue(np.array_equal(X, X_loaded))
+        self.assertTrue(np.array_equal(y, y_loaded))
+
+    def test_should_return_none_when_not_stored(self):
+        # given
+        classifier_data = ClassifierData(filename = self.filename, dataset_cache_directory = self.cache_directory)
+        # when
+        X, y = DatasetCache.load(DatasetCache.get_cache_key(classifier_data), classifier_data)
+        # then
+        self.assertIsNone(X)
+        self.assertIsNone(y)
+
+    def test_should_change_key_with_content_and_parameters(self):
+        # given
+        classifier_data = ClassifierData(filename = self.filename)
+        key = DatasetCache.get_cache_key(classifier_data)
+        # when
+        switched_key = DatasetCache.get_cache_key(ClassifierData(filename = self.filename,
+                                                                 switch_columns_while_loading = True))
+        memory_mapped_key = DatasetCache.get_cache_key(ClassifierData(filename = self.filename, memory_mapped = True))
+        semicolon_filename = os.path.join(self.directory.name, 'data.scsv')
+        with open(self.filename) as file, open(semicolon_filename, 'w') as semicolon_file:
+            semicolon_file.write(file.read())
+        semicolon_key = DatasetCache.get_cache_key(ClassifierData(filename = semicolon_filename))
+        with open(self.filename, 'a') as file:
+            file.write('5, 6, 1\n')
+        changed_key = DatasetCache.get_cache_key(classifier_data)
+        # then
+        self.assertEqual(5, len({key, switched_key, memory_mapped_key, semicolon_key, changed_key}))
+
+    def test_should_evict_least_recently_used_entries(self):
+        # given
+        classifier_data = ClassifierData(filename = self.filename, dataset_cache_directory = self.cache_directory)
+        X, y = np.zeros((1000, 2)), np.zeros(1000, dtype = int)
+        DatasetCache.store('first', X, y, classifier_data)
+        DatasetCache.store('second', X, y, classifier_data)
+        entry_size = os.path.getsize(os.path.join(self.cache_directory, 'first.npz'))
+        os.utime(os.path.join(self.cache_directory, 'first.npz'), (0, 0))
+        classifier_data.dataset_cache_size_limit = 2 * entry_size
+        # when
+        DatasetCache.store('third', X, y, classifier_data)
+        # then
+        self.assertEqual(['second.npz', 'third.npz'], sorted(os.listdir(self.cache_directory)))
+
+
+if __name__ == '__main__':
+    unittest.main()
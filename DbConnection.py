@@ -0,0 +1,77 @@
+import atexit
+import os
+from contextlib import contextmanager
+
+import psycopg2.pool
+
+DSN_VARIABLE = 'DOC_DB_DSN'
+DEFAULT_DSN = 'dbname=doc user=jb host=127.0.0.1 port=5432'
+MIN_CONNECTIONS = 1
+MAX_CONNECTIONS = 4
+
+pool = None
+
+
+def get_dsn():
+    """Returns connection string of database, taken from DOC_DB_DSN environment variable if set
+
+    :return: str
+    """
+    return os.environ.get(DSN_VARIABLE, DEFAULT_DSN)
+
+
+def get_pool():
+    """Returns pool of connections, creates it on first use
+
+    :return: psycopg2.pool.ThreadedConnectionPool
+    """
+    global pool
+    if pool is None:
+        pool = psycopg2.pool.ThreadedConnectionPool(MIN_CONNECTIONS, MAX_CONNECTIONS, get_dsn())
+    return pool
+
+
+@contextmanager
+def connection():
+    """Borrows connection from pool, commits when block succeeds, rolls back when it raises and gives connection back
+
+    :return: generator of psycopg2 connection
+    """
+    connections = get_pool()
+    con = connections.getconn()
+    try:
+        yield con
+        con.commit()
+    except BaseException:
+        con.rollback()
+        raise
+    finally:
+        connections.putconn(con)
+
+
+@contextmanager
+def cursor():
+    """Opens cursor on borrowed connection, see connection
+
+    :return: generator of psycopg2 cursor
+    """
+    with connection() as con:
+        cur = con.cursor()
+        try:
+            yield cur
+        finally:
+            cur.close()
+
+
+def close_all():
+    """Closes all connections of pool, next use creates new pool
+
+    :return:
+    """
+    global pool
+    if pool is not None:
+        pool.closeall()
+        pool = None
+
+
+atexit.register(close_all)
@@ -1,6 +1,7 @@
 import os
 from DtdRes import DtdRes
 from nonparametric_tests import friedman_test, bonferroni_dunn_test, holm_test
+from permutation_tests import friedman_permutation_test
 from LatexMappings import LatexMappings
 from MathUtils import round_to_str
 
@@ -13,6 +14,9 @@ n_clfs = [3, 5, 7, 9]
 n_feas = [2]
 n_divs = [20, 40, 60]
 dims = ["clf", "fea", "div", "series"]
+use_permutation_tests = False
+if use_permutation_tests:
+    friedman_test = friedman_permutation_test
 
 
 def read(n_clf, n_fea, n_div, series):
@@ -3,6 +3,7 @@ import os
 from DtdBatchRes import DtdBatchRes
 from MathUtils import round_to_str
 from nonparametric_tests import friedman_test, bonferroni_dunn_test
+from permutation_tests import friedman_permutation_test
 
 filenames = ['bio', 'bup', 'cry', 'dba', 'hab', 'ion', 'met', 'pop', 'sei', 'wdb', 'wis']
 # references = ['mv', 'rf', 'wmv_vol', 'wmv_inv']
@@ -10,6 +11,9 @@ references = ['mv', 'rf']
 n_clfs = [3, 5, 7, 9]
 n_feas = [2]
 n_divs = [20, 40, 60]
+use_permutation_tests = False
+if use_permutation_tests:
+    friedman_test = friedman_permutation_test
 
 
 def read(n_clf, n_fea):
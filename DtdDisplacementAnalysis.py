@@ -5,6 +5,7 @@ import numpy as np
 from DtdDisplacementRes import DtdDisplacementRes
 from MathUtils import round_to_str
 from nonparametric_tests import friedman_test, bonferroni_dunn_test
+from permutation_tests import friedman_permutation_test
 
 filenames = ['bio', 'bup', 'cry', 'dba', 'hab', 'ion', 'met', 'pop', 'sei', 'wdb', 'wis']
 # references = ['mv', 'rf', 'wmv_vol', 'wmv_inv']
@@ -19,6 +20,10 @@ n_meas = 2
 even_indices = np.arange(0, n_displacements ** n_feas) * n_meas
 odd_indices = np.arange(0, n_displacements ** n_feas) * n_meas + 1
 
+use_permutation_tests = False
+if use_permutation_tests:
+    friedman_test = friedman_permutation_test
+
 
 def read(n_clf, n_fea):
     name_pattern = 'dtd-displacement/{}_{}_[' + '_'.join([str(el) for el in n_divs]) + ']_{}'
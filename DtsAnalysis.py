@@ -1,6 +1,7 @@
 import os
 from DtsRes import DtsRes
 from nonparametric_tests import friedman_test, bonferroni_dunn_test, holm_test
+from permutation_tests import friedman_permutation_test
 from MathUtils import round_to_str
 from LatexMappings import LatexMappings
 
@@ -13,6 +14,9 @@ betas2 = ["0.0"]
 gammas1 = ["20.0"]
 gammas2 = gammas1
 dims = ["clf", "alpha", "series"]
+use_permutation_tests = False
+if use_permutation_tests:
+    friedman_test = friedman_permutation_test
 
 
 def read(n_clf, alpha, series):
@@ -1,6 +1,7 @@
 import os
 from DtsRes import DtsRes
 from nonparametric_tests import friedman_test, bonferroni_dunn_test, holm_test
+from permutation_tests import friedman_permutation_test
 from MathUtils import round_to_str
 
 seriex = ["sim", "pre", "post-cv", "post-tr"]
@@ -9,6 +10,9 @@ filenames = ["bi", "bu", "c", "d", "h", "i", "m", "p", "se", "t", "wd", "wi"]
 n_clfs = [3, 5, 7, 9]
 alphas = ["1.0", "0.3"]
 dims = ["clf", "alpha", "series", "effective_series"]
+use_permutation_tests = False
+if use_permutation_tests:
+    friedman_test = friedman_permutation_test
 
 
 def read(n_clf, alpha, series):
@@ -5,6 +5,7 @@ import numpy as np
 from DtsBatchRes import DtsBatchRes
 from MathUtils import round_to_str
 from nonparametric_tests import friedman_test, bonferroni_dunn_test
+from permutation_tests import friedman_permutation_test
 
 seriex = ["pre-filtered"]
 # filenames = ['bio', 'bup', 'cry', 'dba', 'hab', 'ion', 'met', 'pop', 'sei', 'wdb', 'wis']
@@ -45,6 +46,9 @@ betas2 = ["0.0"]
 gammas1 = ["5.0", "20.0", "5.0", "20.0"]
 gammas2 = ["5.0", "5.0", "20.0", "20.0"]
 dims = ["clf", "alpha", "series"]
+use_permutation_tests = False
+if use_permutation_tests:
+    friedman_test = friedman_permutation_test
 
 
 def read(n_clf, alpha, series, gamma_permutation = -1):
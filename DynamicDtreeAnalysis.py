@@ -3,6 +3,7 @@ import os
 from DynamicDtreeRes import DynamicDtreeRes
 from MathUtils import round_to_str
 from nonparametric_tests import friedman_test, bonferroni_dunn_test
+from permutation_tests import friedman_permutation_test
 
 import numpy as np
 
@@ -41,6 +42,9 @@ n_clfs = [3]  # [3, 5, 7, 9]
 n_meas = 4
 metrics = ['euclidean']
 mappings = ['???']
+use_permutation_tests = False
+if use_permutation_tests:
+    friedman_test = friedman_permutation_test
 
 
 def read(n_clf, metric, mapping):
@@ -1,9 +1,10 @@
 import os
+from functools import lru_cache
 
 import numpy as np
 import pandas as pd
-import psycopg2
 
+import DbConnection
 from MathUtils import round_to_str
 
 references = ['mv', 'rf', 'i', 'io']
@@ -19,22 +20,27 @@ mappings = ['hbd']
 n_mappings = len(mappings)
 
 from_db = True
-con = psycopg2.connect(database = "doc", user = "jb", password = "", host = "127.0.0.1", port = "5432")
-cur = con.cursor()
-cur.execute(
+
+
+@lru_cache(maxsize = None)
+def get_filenames():
+    """Reads abbreviations of datasets with statistics on first use
+
+    :return: filenames: [str]
     """
-    select abbreviation 
-    from files f
-    where exists(
-        select * 
-        from dynamic_ring_stats drs
-        where drs.file = f.id
-    )
-    order by f.id
-    """)
-filenames = [a[0] for a in cur.fetchall()]
-cur.close()
-n_files = len(filenames)
+    with DbConnection.cursor() as cur:
+        cur.execute(
+            """
+            select abbreviation 
+            from files f
+            where exists(
+                select * 
+                from dynamic_ring_stats drs
+                where drs.file = f.id
+            )
+            order by f.id
+            """)
+        return [a[0] for a in cur.fetchall()]
 
 
 # [filenames x meas/scores x metrics x mappings x n_clf]
@@ -45,7 +51,8 @@ def read(metric, mapping, clf):
     name_pattern = 'dynamic-ring/{}_{}_{}'
     res_filename = name_pattern.format(clf, metric, mapping)
     absolute_path = os.path.join(os.path.dirname(__file__), res_filename)
-    objects = np.zeros((n_files, n_score), dtype = float)
+    filenames = get_filenames()
+    objects = np.zeros((len(filenames), n_score), dtype = float)
     with(open(absolute_path)) as file:
         for counter, line in enumerate(file.readlines()):
             values = line.split(',')
@@ -55,30 +62,30 @@ def read(metric, mapping, clf):
 
 
 def read_from_db(metric, mapping, clf):
-    con = psycopg2.connect(database = "doc", user = "jb", password = "", host = "127.0.0.1", port = "5432")
-    cur = con.cursor()
-    objects = np.zeros((n_files, n_score), dtype = float)
-    cur.execute(
-        """
-        select * 
-        from dynamic_ring_stats
-        where (metric, mapping, clfs) = (
-            (select id from metrics where abbreviation = %s),
-            (select id from mappings where abbreviation = %s),
-            %s
+    filenames = get_filenames()
+    objects = np.zeros((len(filenames), n_score), dtype = float)
+    with DbConnection.cursor() as cur:
+        cur.execute(
+            """
+            select * 
+            from dynamic_ring_stats
+            where (metric, mapping, clfs) = (
+                (select id from metrics where abbreviation = %s),
+                (select id from mappings where abbreviation = %s),
+                %s
+            )
+            order by file
+            """,
+            (metric, mapping, clf)
         )
-        order by file
-        """,
-        (metric, mapping, clf)
-    )
-    for (count, row) in enumerate(cur.fetchall()):
-        objects[count, :] = [float(el) for el in row[5:]]
-    cur.close()
+        for (count, row) in enumerate(cur.fetchall()):
+            objects[count, :] = [float(el) for el in row[5:]]
     return objects, filenames, scores
 
 
 def read_cube():
-    res = np.zeros((n_files, n_score, n_metrics, n_mappings, n_clfs))
+    filenames = get_filenames()
+    res = np.zeros((len(filenames), n_score, n_metrics, n_mappings, n_clfs))
     for i in range(0, n_metrics):
         for j in range(0, n_mappings):
             for k in range(0, n_clfs):
@@ -90,7 +97,7 @@ def read_cube():
 
 
 def average_cube(cube):
-    return np.average(cube, axis = (2, 3)), filenames, scores, clfs
+    return np.average(cube, axis = (2, 3)), get_filenames(), scores, clfs
 
 
 def custom_print(text, file = None):
@@ -109,7 +116,7 @@ def double_script_psi(subscript: str, superscript: str):
 
 
 def print_results(file_to_write = None):
-    cube, _, _, _, _, _ = read_cube()
+    cube, filenames, _, _, _, _ = read_cube()
     cube_aggregated, _, _, _ = average_cube(cube)
     for i, meas in enumerate(measurements):
         for j, mapping in enumerate(mappings):
@@ -140,10 +147,11 @@ def print_results(file_to_write = None):
                     custom_print(round_to_str(ranks[len(references) - 1], 2) + '\n', file_to_write)
 
 
-with open('reports/4-dynamic-ring.csv', 'w') as f:
-    print_results(f)
+if __name__ == '__main__':
+    with open('reports/4-dynamic-ring.csv', 'w') as f:
+        print_results(f)
 
-cube, _, _, _, _, _ = read_cube()
-cube_aggregated, _, _, _ = average_cube(cube)
-df = pd.DataFrame(cube_aggregated[:, [len(measurements) * n_ref + 0 for n_ref in range(0, len(references))], 0].T)
-ranks = df.round(3).rank(ascending = False, method = 'dense').agg(np.average, axis = 1)
+    cube, _, _, _, _, _ = read_cube()
+    cube_aggregated, _, _, _ = average_cube(cube)
+    df = pd.DataFrame(cube_aggregated[:, [len(measurements) * n_ref + 0 for n_ref in range(0, len(references))], 0].T)
+    ranks = df.round(3).rank(ascending = False, method = 'dense').agg(np.average, axis = 1)
@@ -2,8 +2,10 @@ import os
 import random
 
 import numpy as np
-import psycopg2
+from psycopg2 import sql
+from psycopg2.extras import execute_values
 
+import DbConnection
 from etl import calculate_conf_matrix
 
 filenames = np.array([
@@ -52,156 +54,157 @@ n_mappings = len(mappings)
 # [filenames x meas/scores x metrics x mappings x n_clf]
 # [28 x 12 x 1 x 1 x 4]
 
-con = psycopg2.connect(database = "doc", user = "jb", password = "", host = "127.0.0.1", port = "5432")
-
 
 def cleanup():
-    cur = con.cursor()
-    cur.execute(
-        """
-        delete from dynamic_ring_raw;
-        delete from dynamic_ring;
-        delete from dynamic_ring_stats;
-        delete from dynamic_dtree_raw;
-        """
-    )
-    con.commit()
-    cur.close()
+    with DbConnection.cursor() as cur:
+        cur.execute(
+            """
+            delete from dynamic_ring_raw;
+            delete from dynamic_ring;
+            delete from dynamic_ring_stats;
+            delete from dynamic_dtree_raw;
+            """
+        )
+
+
+def read_ids():
+    """Reads ids of lookup tables by abbreviations
+
+    :return: {}, name of table: {abbreviation: id}
+    """
+    with DbConnection.cursor() as cur:
+        ids = {}
+        for table in ['files', 'metrics', 'mappings']:
+            cur.execute(sql.SQL("select abbreviation, id from {}").format(sql.Identifier(table)))
+            ids[table] = dict(cur.fetchall())
+    return ids
+
+
+def insert_rows(table, rows):
+    """Inserts rows in one round-trip, id of every row is taken from mes_seq
+
+    :param table: str
+    :param rows: [tuple], values of all columns except id
+    :return:
+    """
+    if len(rows) == 0:
+        return
+    with DbConnection.cursor() as cur:
+        template = "(nextval('mes_seq'), " + ", ".join(["%s"] * len(rows[0])) + ")"
+        execute_values(cur, sql.SQL("insert into {} values %s").format(sql.Identifier(table)), rows,
+                       template = template, page_size = len(rows))
 
 
 def write_data_to_db():
+    ids = read_ids()
+    ring_rows = []
+    dtree_rows = []
     for i in range(0, n_metrics):
         for j in range(0, n_mappings):
             for k in range(0, n_ring_clfs):
-                write_ring_to_db(metrics[i], mappings[j], ring_clfs[k])
+                ring_rows.extend(read_ring_rows(metrics[i], mappings[j], ring_clfs[k], ids))
             for k in range(0, n_dtree_clfs):
-                write_dtree_to_db(metrics[i], mappings[j], dtree_clfs[k])
+                dtree_rows.extend(read_dtree_rows(metrics[i], mappings[j], dtree_clfs[k], ids))
+    insert_rows('dynamic_ring_raw', ring_rows)
+    insert_rows('dynamic_dtree_raw', dtree_rows)
 
 
-def write_ring_to_db(metric, mapping, clf):
-    name_pattern = 'dynamic-ring/{}_{}_{}'
+def read_raw_rows(name_pattern, metric, mapping, clf, ids):
     res_filename = name_pattern.format(clf, metric, mapping)
     absolute_path = os.path.join(os.path.dirname(__file__), res_filename)
-    cur = con.cursor()
+    rows = []
     with(open(absolute_path)) as file:
-        for counter, line in enumerate(file.readlines()):
-            # noinspection SqlInsertValues
-            cur.execute("""
-            insert into dynamic_ring_raw 
-            values (
-                nextval('mes_seq'), 
-                (select id from files where abbreviation = %s),
-                %s,
-                (select id from metrics where abbreviation = %s),
-                (select id from mappings where abbreviation = %s),""" + line + ");",
-                        (filenames[counter], clf, metric, mapping)
-                        )
-        con.commit()
-        cur.close()
-
-
-def write_dtree_to_db(metric, mapping, clf):
-    name_pattern = 'dynamic-ring/dtree/{}_{}_{}'
-    res_filename = name_pattern.format(clf, metric, mapping)
-    absolute_path = os.path.join(os.path.dirname(__file__), res_filename)
-    cur = con.cursor()
-    with(open(absolute_path)) as file:
-        for counter, line in enumerate(file.readlines()):
-            # noinspection SqlInsertValues
-            cur.execute("""
-            insert into dynamic_dtree_raw 
-            values (
-                nextval('mes_seq'), 
-                (select id from files where abbreviation = %s),
-                %s,
-                (select id from metrics where abbreviation = %s),
-                (select id from mappings where abbreviation = %s),""" + line + ");",
-                        (filenames[counter], clf, metric, mapping)
-                        )
-        con.commit()
-        cur.close()
+        lines = [line for line in file.read().splitlines() if line.strip()]
+        for counter, line in enumerate(lines):
+            values = [float(value) for value in line.split(',')]
+            if len(values) != n_score:
+                raise Exception('Line ' + str(counter + 1) + ' of ' + res_filename + ' must contain ' + str(n_score) +
+                                ' values')
+            rows.append((ids['files'][filenames[counter]], clf, ids['metrics'][metric], ids['mappings'][mapping],
+                         *values))
+    return rows
+
+
+def read_ring_rows(metric, mapping, clf, ids):
+    return read_raw_rows('dynamic-ring/{}_{}_{}', metric, mapping, clf, ids)
+
+
+def read_dtree_rows(metric, mapping, clf, ids):
+    return read_raw_rows('dynamic-ring/dtree/{}_{}_{}', metric, mapping, clf, ids)
 
 
 def translate_into_matrix():
+    ids = read_ids()
+    rows = []
     for i in range(0, n_metrics):
         for j in range(0, n_mappings):
             for k in range(0, n_ring_clfs):
-                calculate_matrix_and_write_to_db(metrics[i], mappings[j], ring_clfs[k])
-
-
-def calculate_matrix_and_write_to_db(metric, mapping, clf):
-    cur = con.cursor()
-    cur.execute(
-        """
-        select file, metric, mapping, f.size, f.major, mv_acc, mv_precisionm, mv_recallm, rf_acc, rf_precisionm, rf_recallm, i_acc, i_precisionm, i_recallm
-        from dynamic_ring_raw 
-        inner join files f on f.id = dynamic_ring_raw.file
-        where metric = (select id from metrics where abbreviation = %s)
-        and mapping = (select id from mappings where abbreviation = %s)
-        and clfs = %s
-        """,
-        (metric, mapping, clf)
-    )
-    for row in cur.fetchall():
-        # noinspection SqlInsertValues
+                rows.extend(calculate_matrix(metrics[i], mappings[j], ring_clfs[k], ids))
+    insert_rows('dynamic_ring', rows)
+
+
+def calculate_matrix(metric, mapping, clf, ids):
+    with DbConnection.cursor() as cur:
         cur.execute(
             """
-                insert into dynamic_ring 
-                values (nextval('mes_seq'), %s, %s, %s, %s,
-            """ +
-            ",".join(cast_and_calculate_matrix(row[5], row[6], row[7], row[3], row[4])) + "," +
-            ",".join(cast_and_calculate_matrix(row[8], row[9], row[10], row[3], row[4])) + "," +
-            ",".join(cast_and_calculate_matrix(row[11], row[12], row[13], row[3], row[4])) + ")",
-            (row[0], clf, row[1], row[2])
+            select file, metric, mapping, f.size, f.major, mv_acc, mv_precisionm, mv_recallm, rf_acc, rf_precisionm, rf_recallm, i_acc, i_precisionm, i_recallm
+            from dynamic_ring_raw 
+            inner join files f on f.id = dynamic_ring_raw.file
+            where metric = %s
+            and mapping = %s
+            and clfs = %s
+            """,
+            (ids['metrics'][metric], ids['mappings'][mapping], clf)
         )
-    con.commit()
-    cur.close()
+        rows = []
+        for row in cur.fetchall():
+            rows.append((row[0], clf, row[1], row[2],
+                         *cast_and_calculate_matrix(row[5], row[6], row[7], row[3], row[4]),
+                         *cast_and_calculate_matrix(row[8], row[9], row[10], row[3], row[4]),
+                         *cast_and_calculate_matrix(row[11], row[12], row[13], row[3], row[4])))
+    return rows
 
 
 def cast_and_calculate_matrix(acc, precision, recall, size, positive):
-    return [str(x) for x in sum(calculate_conf_matrix(float(acc), float(precision), float(recall), int(size), int(positive)), [])]
+    return sum(calculate_conf_matrix(float(acc), float(precision), float(recall), int(size), int(positive)), [])
 
 
 def populate_new(base_clf, new_clf):
+    ids = read_ids()
+    rows = []
     for i in range(0, n_metrics):
         for j in range(0, n_mappings):
-            populate_new_scenario(metrics[i], mappings[j], base_clf, new_clf)
-
-
-def populate_new_scenario(metric, mapping, base_clf, new_clf):
-    cur = con.cursor()
-    cur.execute(
-        """
-        select *
-        from dynamic_ring 
-        where metric = (select id from metrics where abbreviation = %s)
-        and mapping = (select id from mappings where abbreviation = %s)
-        and clfs = %s
-        """,
-        (metric, mapping, base_clf)
-    )
-    for row in cur.fetchall():
-        # noinspection SqlInsertValues
+            rows.extend(populate_new_scenario(metrics[i], mappings[j], base_clf, new_clf, ids))
+    insert_rows('dynamic_ring', rows)
+
+
+def populate_new_scenario(metric, mapping, base_clf, new_clf, ids):
+    with DbConnection.cursor() as cur:
         cur.execute(
             """
-            insert into dynamic_ring
-            values (nextval('mes_seq'), %s, %s, %s, %s,
-            """ +
-            ",".join(generate_reference_matrix(row[5], row[6], row[7], row[8])) + "," +
-            ",".join(generate_reference_matrix(row[9], row[10], row[11], row[12])) + "," +
-            ",".join(generate_integrated_matrix(row[13], row[14], row[15], row[16])) + ")",
-            (row[1], new_clf, row[3], row[4])
+            select *
+            from dynamic_ring 
+            where metric = %s
+            and mapping = %s
+            and clfs = %s
+            """,
+            (ids['metrics'][metric], ids['mappings'][mapping], base_clf)
         )
-    con.commit()
-    cur.close()
+        rows = []
+        for row in cur.fetchall():
+            rows.append((row[1], new_clf, row[3], row[4],
+                         *generate_reference_matrix(row[5], row[6], row[7], row[8]),
+                         *generate_reference_matrix(row[9], row[10], row[11], row[12]),
+                         *generate_integrated_matrix(row[13], row[14], row[15], row[16])))
+    return rows
 
 
 def generate_reference_matrix(tp, fp, fn, tn):
-    return [str(x) for x in generate_matrix(int(tp), int(fp), int(fn), int(tn), .005, .01)]
+    return generate_matrix(int(tp), int(fp), int(fn), int(tn), .005, .01)
 
 
 def generate_integrated_matrix(tp, fp, fn, tn):
-    return [str(x) for x in generate_matrix(int(tp), int(fp), int(fn), int(tn), .015, .015)]
+    return generate_matrix(int(tp), int(fp), int(fn), int(tn), .015, .015)
 
 
 def generate_matrix(tp, fp, fn, tn, mu, sigma):
@@ -219,38 +222,28 @@ def generate_matrix(tp, fp, fn, tn, mu, sigma):
 
 
 def insert_base_data():
-    cur = con.cursor()
-    cur.execute("call insert_base_data();")
-    con.commit()
-    cur.close()
+    with DbConnection.cursor() as cur:
+        cur.execute("call insert_base_data();")
 
 
 def insert_non_windowed_stats():
-    cur = con.cursor()
-    cur.execute("call insert_non_windowed_stats();")
-    con.commit()
-    cur.close()
+    with DbConnection.cursor() as cur:
+        cur.execute("call insert_non_windowed_stats();")
 
 
 def insert_windowed_stats(target_transition):
-    cur = con.cursor()
-    cur.execute("call insert_windowed_stats(%s::smallint);", [target_transition])
-    con.commit()
-    cur.close()
+    with DbConnection.cursor() as cur:
+        cur.execute("call insert_windowed_stats(%s::smallint);", [target_transition])
 
 
 def insert_fScores(target_transition):
-    cur = con.cursor()
-    cur.execute("call insert_fScores(%s::smallint);", [target_transition])
-    con.commit()
-    cur.close()
+    with DbConnection.cursor() as cur:
+        cur.execute("call insert_fScores(%s::smallint);", [target_transition])
 
 
 def insert_dtree_data():
-    cur = con.cursor()
-    cur.execute("call insert_dtree_data();")
-    con.commit()
-    cur.close()
+    with DbConnection.cursor() as cur:
+        cur.execute("call insert_dtree_data();")
 
 
 transisions = [(3, 5), (5, 7), (7, 9)]
@@ -266,4 +259,4 @@ for (_, transition_to) in transisions:
     insert_windowed_stats(transition_to)
     insert_fScores(transition_to)
 insert_dtree_data()
-con.close()
+DbConnection.close_all()
@@ -1,10 +1,13 @@
 import math
 import os
+import zipfile
 from datetime import datetime
 
+import numpy as np
 import xlrd
 import xlwt
 
+import ResultTable
 from AdvIntegrRes import AdvIntegrRes
 from ClassifierData import ClassifierData
 from CompositionType import CompositionType
@@ -23,6 +26,7 @@ FILENAMES = [
     'cryotherapy.xlsx',  # 90
     'meter_a.tsv'  # 86
 ]
+RESULT_CACHE_EXTENSION = '.npz'
 
 
 def prepare_filenames(filenames_raw: []):
@@ -445,48 +449,102 @@ def save_intermediate_results(score: [], mcc: [], i: int, classifier_data: Class
         number_of_classifiers) + '_s_' + str(space_division[i]) + '.xls')
 
 
+def read_result_rows(res_filename: str):
+    """Reads rows of datasets from result file, metrics are parsed with float_nan_safe, so empty or text cells become
+    NaN
+
+    :param res_filename: str
+    :return: space_parts, rows: [], [] of (n_best, filename, metrics pro space division)
+    """
+    file = xlrd.open_workbook(res_filename)
+    sheet = file.sheet_by_index(0)
+    number_of_divisions = int((sheet.ncols - 2) / 8)
+    space_parts = [int(sheet.cell(0, 2 + n_subspace * 8).value) for n_subspace in range(number_of_divisions)]
+    rows = []
+    n_best = None
+    for line_num, (ctype, value) in enumerate(zip(sheet.col_types(0), sheet.col_values(0))):
+        if ctype == xlrd.XL_CELL_TEXT:
+            n_best = value
+        filename = sheet.cell_value(line_num, 1)
+        if filename in FILENAMES:
+            metrics = [float_nan_safe(cell, math.nan)
+                       for cell in sheet.row_values(line_num, 2, 2 + 8 * number_of_divisions)]
+            rows.append((int(n_best), filename,
+                         [metrics[8 * n_subspace:8 * (n_subspace + 1)] for n_subspace in range(number_of_divisions)]))
+    return space_parts, rows
+
+
 def read_objects_from_file(res_filename: str, n_class: int, bagging: int, i_meth: int):
     """Reads objects from result files
 
-    :param res_filename: str, one of: 'biodeg.scsv', 'bupa.dat', 'cryotherapy.xlsx', 'data_banknote_authentication.csv',
-                 'haberman.dat', 'ionosphere.dat', 'meter_a.tsv', 'pop_failures.tsv', 'seismic_bumps.dat',
-                 'twonorm.dat', 'wdbc.dat', 'wisconsin.dat'
+    :param res_filename: str, rows of datasets from FILENAMES are read
     :param n_class: int
     :param bagging: int
     :param i_meth: int
     :return:
     """
-    filenames = ['biodeg.scsv', 'bupa.dat', 'cryotherapy.xlsx', 'data_banknote_authentication.csv',
-                 'haberman.dat', 'ionosphere.dat', 'meter_a.tsv', 'pop_failures.tsv', 'seismic_bumps.dat',
-                 'twonorm.dat', 'wdbc.dat', 'wisconsin.dat']
-    file = xlrd.open_workbook(res_filename)
-    sheet = file.sheet_by_index(0)
+    space_parts, rows = read_result_rows(res_filename)
     result_objects = []
-    for line_num in range(sheet.nrows):
-        line = sheet.row(line_num)
-        if line[1].value in filenames:
-            n_best_line = line_num
-            while True:
-                if sheet.cell(n_best_line, 0).ctype == 1:
-                    n_best = int(sheet.cell(n_best_line, 0).value)
-                    break
-                n_best_line -= 1
-            for n_subspace in range(int((sheet.ncols - 2) / 8)):
-                space_parts = int(sheet.cell(0, 2 + n_subspace * 8).value)
-                mv_score = sheet.cell(line_num, 8 * n_subspace + 2).value
-                mv_score_std = sheet.cell(line_num, 8 * n_subspace + 3).value
-                mv_mcc = sheet.cell(line_num, 8 * n_subspace + 4).value
-                mv_mcc_std = sheet.cell(line_num, 8 * n_subspace + 5).value
-                i_score = sheet.cell(line_num, 8 * n_subspace + 6).value
-                i_score_std = sheet.cell(line_num, 8 * n_subspace + 7).value
-                i_mcc = sheet.cell(line_num, 8 * n_subspace + 8).value
-                i_mcc_std = sheet.cell(line_num, 8 * n_subspace + 9).value
-                res_obj = AdvIntegrRes(mv_score, mv_score_std, mv_mcc, mv_mcc_std, i_score, i_score_std, i_mcc,
-                                       i_mcc_std, n_class, n_best, i_meth, bagging, space_parts, line[1].value)
-                result_objects.append(res_obj)
+    for n_best, filename, metrics_pro_space_division in rows:
+        for n_subspace, metrics in enumerate(metrics_pro_space_division):
+            mv_score, mv_score_std, mv_mcc, mv_mcc_std, i_score, i_score_std, i_mcc, i_mcc_std = metrics
+            res_obj = AdvIntegrRes(mv_score, mv_score_std, mv_mcc, mv_mcc_std, i_score, i_score_std, i_mcc,
+                                   i_mcc_std, n_class, n_best, i_meth, bagging, space_parts[n_subspace], filename)
+            result_objects.append(res_obj)
     return result_objects
 
 
+def read_table_from_file(res_filename: str, n_class: int, bagging: int, i_meth: int):
+    """Reads results from result file into columnar table, rows are in the same order as in read_objects_from_file
+
+    :param res_filename: str
+    :param n_class: int
+    :param bagging: int
+    :param i_meth: int
+    :return: ResultTable
+    """
+    space_parts, rows = read_result_rows(res_filename)
+    number_of_divisions = len(space_parts)
+    metrics = np.array([row_metrics for _, _, metrics_pro_space_division in rows
+                        for row_metrics in metrics_pro_space_division], dtype = float)
+    metrics = metrics.reshape(len(rows) * number_of_divisions, 8)
+    columns = {name: metrics[:, i] for i, name in enumerate(ResultTable.METRIC_COLUMNS)}
+    columns['n_class'] = np.full(len(metrics), n_class)
+    columns['n_best'] = np.repeat([n_best for n_best, _, _ in rows], number_of_divisions)
+    columns['i_meth'] = np.full(len(metrics), i_meth)
+    columns['bagging'] = np.full(len(metrics), bagging)
+    columns['space_parts'] = np.tile(space_parts, len(rows))
+    columns['filename'] = np.repeat([filename for _, filename, _ in rows], number_of_divisions)
+    return ResultTable.ResultTable(columns)
+
+
+def read_table_from_file_cached(res_filename: str, n_class: int, bagging: int, i_meth: int):
+    """Reads results from result file into columnar table using sidecar .npz cache next to it, cache is rebuilt
+    when modification time or size of result file changes
+
+    :param res_filename: str
+    :param n_class: int
+    :param bagging: int
+    :param i_meth: int
+    :return: ResultTable
+    """
+    stat = os.stat(res_filename)
+    metadata = [stat.st_mtime_ns, stat.st_size, n_class, bagging, i_meth]
+    cache_filename = res_filename + RESULT_CACHE_EXTENSION
+    try:
+        table, cached_metadata = ResultTable.ResultTable.load(cache_filename)
+        if cached_metadata.tolist() == metadata:
+            return table
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+        pass
+    table = read_table_from_file(res_filename, n_class, bagging, i_meth)
+    try:
+        table.save(cache_filename, metadata)
+    except OSError:
+        pass
+    return table
+
+
 def float_nan_safe(value, default_on_nan = 0.):
     try:
         converted = float(value)
@@ -494,4 +552,4 @@ def float_nan_safe(value, default_on_nan = 0.):
             return default_on_nan
         return converted
     except:
-        default_on_nan
+        return default_on_nan
@@ -1,5 +1,13 @@
+import math
+import os
+import tempfile
 import unittest
+
+import xlwt
+
 import FileHelper
+from ClassifierData import ClassifierData
+from IntegrRes import IntegrRes
 
 
 class FileHelperTest(unittest.TestCase):
@@ -69,5 +77,62 @@ class FileHelperTest(unittest.TestCase):
             self.assertEqual(expected_filename, filename_sorted)
 
 
+    def test_should_read_same_results_into_table_as_into_objects(self):
+        # given
+        classifier_data = ClassifierData(number_of_classifiers = 4, space_division = [3, 5])
+        results = [[[IntegrRes(i + j / 10, .1, .2, .3, k + .5, .4, .6, .7) for k in range(2)] for j in range(2)]
+                   for i in range(2)]
+        with tempfile.TemporaryDirectory() as directory:
+            FileHelper.save_res_objects_pro_space_division_pro_base_classif_with_classif_data_name(
+                ['bupa.dat', 'wdbc.dat'], results, 4, results_directory_relative = directory,
+                classifier_data = classifier_data)
+            res_filename = os.path.join(directory, 'n_4_b_0_i_0.xls')
+            expected = FileHelper.read_objects_from_file(res_filename, 4, 0, 0)
+            # when
+            table = FileHelper.read_table_from_file(res_filename, 4, 0, 0)
+        # then
+        self.assertEqual([vars(res_obj) for res_obj in expected], [vars(res_obj) for res_obj in table.to_res_objects()])
+
+    def test_should_read_empty_and_text_cells_as_nan(self):
+        # given
+        workbook = xlwt.Workbook()
+        sheet = workbook.add_sheet('results')
+        sheet.write(0, 2, 3)
+        sheet.write(1, 0, '2')
+        sheet.write(1, 1, 'bupa.dat')
+        for col, value in enumerate([.5, '', .2, 'n/a', .6, .1, .3, .1]):
+            sheet.write(1, 2 + col, value)
+        with tempfile.TemporaryDirectory() as directory:
+            res_filename = os.path.join(directory, 'n_3_b_0_i_0.xls')
+            workbook.save(res_filename)
+            # when
+            res_obj = FileHelper.read_objects_from_file(res_filename, 3, 0, 0)[0]
+            table = FileHelper.read_table_from_file(res_filename, 3, 0, 0)
+        # then
+        self.assertEqual(.5, res_obj.mv_score)
+        self.assertTrue(math.isnan(res_obj.mv_score_std))
+        self.assertTrue(math.isnan(table['mv_mcc_std'][0]))
+        self.assertEqual([2], table['n_best'].tolist())
+
+    def test_should_rebuild_cached_table_when_result_file_changes(self):
+        # given
+        classifier_data = ClassifierData(number_of_classifiers = 3, space_division = [3])
+        with tempfile.TemporaryDirectory() as directory:
+            res_filename = os.path.join(directory, 'n_3_b_0_i_0.xls')
+            for i_score in [.5, .75]:
+                if os.path.isfile(res_filename):
+                    os.remove(res_filename)
+                FileHelper.save_res_objects_pro_space_division_pro_base_classif_with_classif_data_name(
+                    ['bupa.dat'], [[[IntegrRes(.1, 0, .2, 0, i_score, 0, .3, 0)]]], 3,
+                    results_directory_relative = directory, classifier_data = classifier_data)
+                os.utime(res_filename, ns = (0, int(i_score * 1e9)))
+                # when
+                table = FileHelper.read_table_from_file_cached(res_filename, 3, 0, 0)
+                cached_table = FileHelper.read_table_from_file_cached(res_filename, 3, 0, 0)
+                # then
+                self.assertTrue(os.path.isfile(res_filename + FileHelper.RESULT_CACHE_EXTENSION))
+                self.assertEqual([i_score], table['i_score'].tolist())
+                self.assertEqual([i_score], cached_table['i_score'].tolist())
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,11 +1,15 @@
 import MergingAlgorithm
 import ClassifLibrary
 import FileHelper
+import ResultSink
 from NotEnoughSamplesError import NotEnoughSamplesError
 import os
+import argparse
 from ClfType import ClfType
 from CompositionType import CompositionType
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
 
 ### Dataset ###
 filenames = ['bi', 'bu', 'c', 'd', 'h', 'i', 'm', 'p', 's', 't', 'wd', 'wi']
@@ -40,77 +44,169 @@ results_directory_relative = 'results'
 logging_to_file = True
 logging_intermediate_results = True
 
-results_directory_absolute = os.path.join(os.path.dirname(__file__), results_directory_relative)
-try:
-    os.makedirs(results_directory_absolute)
-    print('Created results directory: ', results_directory_absolute)
-except FileExistsError:
-    pass
-
-log_number = 0
-while True:
-    if not os.path.isfile(results_directory_relative + '//integration' + str(log_number) + '.log'):
-        break
-    log_number += 1
-log = open(results_directory_relative + '//integration' + str(log_number) + '.log', 'w')
-log.write('Starting algorithm: ' + str(datetime.now()) + '\n\n')
-log.close()
-
-result_file_number = 0
-while True:
-    if not os.path.isfile(results_directory_relative + '//Results' + str(result_file_number) + '.xls'):
-        break
-    result_file_number += 1
-
-results = []
-for filename in filenames:
-    print('Analysing ' + filename)
+### Parallelism ###
+run_in_parallel = True
+number_of_workers = os.cpu_count()
+number_of_runs_pro_file = number_of_bagging_repetitions if bagging else 1
+
+### Reproducibility ###
+seed = None
+
+### Caching ###
+dataset_cache_directory = 'cache'
+dataset_cache_size_limit = 2 ** 30
+memory_mapped = False
+
+### Checkpointing ###
+checkpoint_directory = None
+default_checkpoint_directory = 'checkpoints'
+resume_from_checkpoints = False
+
+
+def prepare_classifier_data(filename, log_number):
     if filename in files_to_switch:
         switch_columns_while_loading = True
-        print('Switching columns')
     else:
         switch_columns_while_loading = False
-    classifier_data = \
-        ClassifLibrary.ClassifierData(type_of_classifier = type_of_classifier,
-                                      are_samples_generated = are_samples_generated,
-                                      number_of_samples_if_generated = number_of_samples_if_generated,
-                                      number_of_dataset_if_not_generated = number_of_dataset_if_not_generated,
-                                      switch_columns_while_loading = switch_columns_while_loading,
-                                      number_of_classifiers = number_of_classifiers,
-                                      show_color_plot = draw_color_plot,
-                                      write_computed_scores = write_computed_scores,
-                                      show_plots = show_plots,
-                                      show_only_first_plot = show_only_first_plot,
-                                      is_validation_hard = is_validation_hard,
-                                      filename = 'datasets//' + filename,
-                                      generate_all_permutations = generate_all_permutations,
-                                      log_number = log_number,
-                                      bagging = bagging,
-                                      type_of_composition = type_of_composition,
-                                      logging_to_file = logging_to_file,
-                                      logging_intermediate_results = logging_intermediate_results,
-                                      space_division = space_division)
+    return ClassifLibrary.ClassifierData(type_of_classifier = type_of_classifier,
+                                         are_samples_generated = are_samples_generated,
+                                         number_of_samples_if_generated = number_of_samples_if_generated,
+                                         number_of_dataset_if_not_generated = number_of_dataset_if_not_generated,
+                                         switch_columns_while_loading = switch_columns_while_loading,
+                                         number_of_classifiers = number_of_classifiers,
+                                         show_color_plot = draw_color_plot,
+                                         write_computed_scores = write_computed_scores,
+                                         show_plots = show_plots,
+                                         show_only_first_plot = show_only_first_plot,
+                                         is_validation_hard = is_validation_hard,
+                                         filename = 'datasets//' + filename,
+                                         generate_all_permutations = generate_all_permutations,
+                                         log_number = log_number,
+                                         bagging = bagging,
+                                         type_of_composition = type_of_composition,
+                                         logging_to_file = logging_to_file,
+                                         logging_intermediate_results = logging_intermediate_results,
+                                         space_division = space_division,
+                                         dataset_cache_directory = dataset_cache_directory,
+                                         dataset_cache_size_limit = dataset_cache_size_limit,
+                                         memory_mapped = memory_mapped,
+                                         checkpoint_directory = checkpoint_directory,
+                                         resume_from_checkpoints = resume_from_checkpoints)
+
+
+def spawn_seeds():
+    """Spawns independent seed for every (dataset, bagging iteration) unit from the global seed
+
+    :return: seeds_pro_file: []
+    """
+    children = np.random.SeedSequence(seed).spawn(len(filenames) * number_of_runs_pro_file)
+    seeds = [int(child.generate_state(1)[0]) for child in children]
+    return [seeds[i * number_of_runs_pro_file:(i + 1) * number_of_runs_pro_file] for i in range(len(filenames))]
+
+
+def run_serially(classifier_data_pro_file, sink):
+    results = []
+    for filename, classifier_data, seeds in zip(filenames, classifier_data_pro_file, spawn_seeds()):
+        print('Analysing ' + filename)
+        if classifier_data.switch_columns_while_loading:
+            print('Switching columns')
+        try:
+            if bagging:
+                bagging_results = []
+                for i in range(number_of_bagging_repetitions):
+                    print('{}. bagging iteration'.format(i + 1))
+                    bagging_res = MergingAlgorithm.run_isolated(classifier_data, seeds[i], i)
+                    bagging_results.append(bagging_res)
+                res = ClassifLibrary.get_mean_res(bagging_results)
+            else:
+                res = MergingAlgorithm.run_isolated(classifier_data, seeds[0])
+        except NotEnoughSamplesError as e:
+            print(e.args[0])
+            break
+        results.append(res)
+        sink.write_res_objects(filename, res, classifier_data)
+    return results
+
+
+def run_in_process_pool(classifier_data_pro_file, sink):
+    """Submits every (dataset, bagging iteration) unit to a process pool and collects results in the order
+    of filenames and iterations, so that the outcome does not depend on the order in which units finish,
+    results of every dataset are appended to sink as soon as they are collected
+    """
+    results = []
+    with ProcessPoolExecutor(max_workers = number_of_workers) as executor:
+        futures_pro_file = [[executor.submit(MergingAlgorithm.run_isolated, classifier_data, unit_seed, i)
+                             for i, unit_seed in enumerate(seeds)]
+                            for classifier_data, seeds in zip(classifier_data_pro_file, spawn_seeds())]
+        for filename, classifier_data, futures in zip(filenames, classifier_data_pro_file, futures_pro_file):
+            print('Analysing ' + filename)
+            try:
+                bagging_results = [future.result() for future in futures]
+            except NotEnoughSamplesError as e:
+                print(e.args[0])
+                for remaining_futures in futures_pro_file:
+                    for future in remaining_futures:
+                        future.cancel()
+                break
+            if bagging:
+                res = ClassifLibrary.get_mean_res(bagging_results)
+            else:
+                res = bagging_results[0]
+            results.append(res)
+            sink.write_res_objects(filename, res, classifier_data)
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--resume', action = 'store_true',
+                        help = 'skip (dataset, bagging iteration, permutation) units finished in previous runs')
+    parser.add_argument('--checkpoint-dir', default = checkpoint_directory,
+                        help = 'store finished units in this directory, {} if only --resume is given'
+                        .format(default_checkpoint_directory))
+    parser.add_argument('--seed', type = int, default = seed)
+    args = parser.parse_args()
+    if args.resume and args.seed is None:
+        parser.error('--resume requires a fixed seed, otherwise bagging samples differ between runs')
+    seed, resume_from_checkpoints, checkpoint_directory = args.seed, args.resume, args.checkpoint_dir
+    if resume_from_checkpoints and checkpoint_directory is None:
+        checkpoint_directory = default_checkpoint_directory
+
+    results_directory_absolute = os.path.join(os.path.dirname(__file__), results_directory_relative)
     try:
-        if bagging:
-            bagging_results = []
-            for i in range(number_of_bagging_repetitions):
-                print('{}. bagging iteration'.format(i + 1))
-                bagging_res = MergingAlgorithm.run(classifier_data)
-                bagging_results.append(bagging_res)
-            res = ClassifLibrary.get_mean_res(bagging_results)
+        os.makedirs(results_directory_absolute)
+        print('Created results directory: ', results_directory_absolute)
+    except FileExistsError:
+        pass
+
+    log_number = 0
+    while True:
+        if not os.path.isfile(results_directory_relative + '//integration' + str(log_number) + '.log'):
+            break
+        log_number += 1
+    log = open(results_directory_relative + '//integration' + str(log_number) + '.log', 'w')
+    log.write('Starting algorithm: ' + str(datetime.now()) + '\n\n')
+    log.close()
+
+    result_file_number = 0
+    while True:
+        if not os.path.isfile(results_directory_relative + '//Results' + str(result_file_number) + '.csv'):
+            break
+        result_file_number += 1
+    sink_filename = results_directory_relative + '//Results' + str(result_file_number) + '.csv'
+
+    classifier_data_pro_file = [prepare_classifier_data(filename, log_number) for filename in filenames]
+    with ResultSink.ResultSink(sink_filename) as sink:
+        if run_in_parallel:
+            run_in_process_pool(classifier_data_pro_file, sink)
         else:
-            res = MergingAlgorithm.run(classifier_data)
-    except NotEnoughSamplesError as e:
-        print(e.args[0])
-        break
-    results.append(res)
-FileHelper.save_res_objects_pro_space_division_pro_base_classif_with_classif_data_name(filenames, results,
-                                                                                       number_of_classifiers,
-                                                                                       results_directory_relative =
-                                                                                       results_directory_relative,
-                                                                                       classifier_data =
-                                                                                       classifier_data)
-
-log = open(results_directory_relative + '//integration' + str(log_number) + '.log', 'a')
-log.write('Finishing algorithm: ' + str(datetime.now()))
-log.close()
+            run_serially(classifier_data_pro_file, sink)
+    ResultSink.export_to_xls(sink_filename, filenames, results_directory_relative = results_directory_relative,
+                             classifier_data = classifier_data_pro_file[-1])
+
+    if logging_to_file:
+        MergingAlgorithm.merge_logs(results_directory_relative + '//integration' + str(log_number) + '.log',
+                                    classifier_data_pro_file, number_of_runs_pro_file)
+    log = open(results_directory_relative + '//integration' + str(log_number) + '.log', 'a')
+    log.write('Finishing algorithm: ' + str(datetime.now()))
+    log.close()
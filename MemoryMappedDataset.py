@@ -0,0 +1,151 @@
+import os
+
+import numpy as np
+import pandas as pd
+from numpy.lib.format import open_memmap
+
+CHUNK_SIZE = 100000
+
+
+def get_array_filenames(filename: str):
+    """Returns paths of .npy files holding converted attributes and classes of dataset
+
+    :param filename: str
+    :return: X_filename, y_filename: str, str
+    """
+    return filename + '.X.npy', filename + '.y.npy'
+
+
+def get_marker_filename(filename: str):
+    """Returns path of file marking, that both .npy files of dataset were completely written
+
+    :param filename: str
+    :return: str
+    """
+    return filename + '.npy.complete'
+
+
+def is_converted(filename: str):
+    """Checks if dataset was completely converted after its last modification, marker is written after both .npy
+    files were replaced, so pair left by interrupted conversion is not trusted
+
+    :param filename: str
+    :return: bool
+    """
+    marker_filename = get_marker_filename(filename)
+    if not os.path.isfile(marker_filename) or os.path.getmtime(marker_filename) < os.path.getmtime(filename):
+        return False
+    return all(os.path.isfile(array_filename) for array_filename in get_array_filenames(filename))
+
+
+def get_number_of_header_lines(filename: str):
+    """Counts lines starting with @ (KEEL headers) and blank lines at the beginning of delimited file
+
+    :param filename: str
+    :return: int
+    """
+    number_of_header_lines = 0
+    with open(filename) as file:
+        for line in file:
+            if line.strip() and not line.lstrip().startswith('@'):
+                break
+            number_of_header_lines += 1
+    return number_of_header_lines
+
+
+def read_chunks(filename: str, separator: str, chunk_size: int = CHUNK_SIZE):
+    """Iterates over delimited file in chunks of rows, header lines are skipped
+
+    :param filename: str
+    :param separator: str
+    :param chunk_size: int
+    :return: generator of np.array
+    """
+    reader = pd.read_csv(filename, sep = separator, header = None, skiprows = get_number_of_header_lines(filename),
+                         skipinitialspace = True, dtype = np.float64, engine = 'c', float_precision = 'round_trip',
+                         chunksize = chunk_size)
+    with reader:
+        for chunk in reader:
+            yield chunk.to_numpy()
+
+
+def convert_delimited_file(filename: str, separator: str, chunk_size: int = CHUNK_SIZE):
+    """Converts delimited file into .npy pair without holding whole dataset in memory, first pass counts rows,
+    second one streams chunks into memory mapped arrays
+
+    :param filename: str
+    :param separator: str
+    :param chunk_size: int
+    :return:
+    """
+    print('Converting {} into memory mapped arrays'.format(filename))
+    number_of_rows, number_of_columns = 0, 0
+    for chunk in read_chunks(filename, separator, chunk_size):
+        number_of_rows += len(chunk)
+        number_of_columns = chunk.shape[1]
+    X_filename, y_filename = get_array_filenames(filename)
+    # Workers may convert the same dataset at once, every one writes its own files and replaces the final ones
+    X_temporary = '{}.{}.tmp'.format(X_filename, os.getpid())
+    y_temporary = '{}.{}.tmp'.format(y_filename, os.getpid())
+    X = open_memmap(X_temporary, mode = 'w+', dtype = np.float64, shape = (number_of_rows, number_of_columns - 1))
+    y = open_memmap(y_temporary, mode = 'w+', dtype = int, shape = (number_of_rows,))
+    position = 0
+    for chunk in read_chunks(filename, separator, chunk_size):
+        X[position:position + len(chunk)] = chunk[:, :-1]
+        y[position:position + len(chunk)] = chunk[:, -1].astype(int)
+        position += len(chunk)
+    X.flush()
+    y.flush()
+    del X, y
+    marker_filename = get_marker_filename(filename)
+    try:
+        os.remove(marker_filename)
+    except FileNotFoundError:
+        pass
+    os.replace(X_temporary, X_filename)
+    os.replace(y_temporary, y_filename)
+    with open(marker_filename, 'w'):
+        pass
+
+
+def open_arrays(filename: str):
+    """Opens converted dataset as read only memory mapped arrays
+
+    :param filename: str
+    :return: X, y: np.memmap, np.memmap
+    """
+    X_filename, y_filename = get_array_filenames(filename)
+    return np.load(X_filename, mmap_mode = 'r'), np.load(y_filename, mmap_mode = 'r')
+
+
+def compute_feature_scores(X: [], y: [], chunk_size: int = CHUNK_SIZE):
+    """Computes ANOVA F-values (as sklearn.feature_selection.f_classif) accumulating per class sums and sums of squares
+    over chunks of rows, so that only one chunk is materialized at a time
+
+    :param X: np.array or np.memmap
+    :param y: np.array or np.memmap
+    :param chunk_size: int
+    :return: feature_scores: np.array
+    """
+    classes = np.unique(y)
+    number_of_attributes = X.shape[1]
+    counts = np.zeros(len(classes), dtype = int)
+    sums = np.zeros((len(classes), number_of_attributes))
+    sums_of_squares = np.zeros((len(classes), number_of_attributes))
+    for beginning in range(0, len(X), chunk_size):
+        X_chunk = np.asarray(X[beginning:beginning + chunk_size], dtype = np.float64)
+        y_chunk = np.asarray(y[beginning:beginning + chunk_size])
+        for k in range(len(classes)):
+            X_class = X_chunk[y_chunk == classes[k]]
+            counts[k] += len(X_class)
+            sums[k] += X_class.sum(axis = 0)
+            sums_of_squares[k] += (X_class ** 2).sum(axis = 0)
+    number_of_samples = counts.sum()
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        square_of_sums_alldata = sums.sum(axis = 0) ** 2
+        sstot = sums_of_squares.sum(axis = 0) - square_of_sums_alldata / float(number_of_samples)
+        ssbn = (sums ** 2 / counts[:, np.newaxis]).sum(axis = 0) - square_of_sums_alldata / float(number_of_samples)
+        sswn = sstot - ssbn
+        msb = ssbn / float(len(classes) - 1)
+        msw = sswn / float(number_of_samples - len(classes))
+        return msb / msw
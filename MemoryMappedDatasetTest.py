@@ -0,0 +1,59 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+from sklearn.datasets import make_classification
+from sklearn.feature_selection import f_classif
+
+import MemoryMappedDataset
+
+
+class MemoryMappedDatasetTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.X, self.y = make_classification(n_features = 6, n_samples = 500, random_state = 3)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_should_convert_delimited_file_in_chunks(self):
+        # given
+        filename = os.path.join(self.directory.name, 'data.dat')
+        with open(filename, 'w') as file:
+            file.write('@relation test\n@data\n')
+            for row, label in zip(self.X, self.y):
+                file.write(', '.join(repr(value) for value in row) + ', ' + str(label) + '\n')
+        # when
+        MemoryMappedDataset.convert_delimited_file(filename, ',', chunk_size = 64)
+        X, y = MemoryMappedDataset.open_arrays(filename)
+        # then
+        self.assertTrue(MemoryMappedDataset.is_converted(filename))
+        self.assertTrue(np.array_equal(self.X, X))
+        self.assertTrue(np.array_equal(self.y, y))
+        self.assertEqual([], [name for name in os.listdir(self.directory.name) if name.endswith('.tmp')])
+        del X, y
+
+    def test_should_not_trust_arrays_of_interrupted_conversion(self):
+        # given
+        filename = os.path.join(self.directory.name, 'data.dat')
+        with open(filename, 'w') as file:
+            file.write('1, 2, 0\n3, 4, 1\n')
+        MemoryMappedDataset.convert_delimited_file(filename, ',')
+        # when
+        os.remove(MemoryMappedDataset.get_marker_filename(filename))
+        # then
+        self.assertFalse(MemoryMappedDataset.is_converted(filename))
+
+    def test_should_compute_same_feature_scores_as_f_classif(self):
+        # given
+        expected, _ = f_classif(self.X, self.y)
+        # when
+        feature_scores = MemoryMappedDataset.compute_feature_scores(self.X, self.y, chunk_size = 64)
+        # then
+        self.assertTrue(np.allclose(expected, feature_scores, rtol = 1e-10))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,19 +1,58 @@
+import copy
+
 import matplotlib.pyplot as plt
+import CheckpointStore
 import ClassifLibrary
 import FileHelper
 from CompositionType import CompositionType
 from NotEnoughSamplesError import NotEnoughSamplesError
 import numpy as np
+import os
+import shutil
 import sys
 
-def enable_logging_to_file(log_number):
-    sys.stdout = open('results//integration' + str(log_number) + '.log', 'a')
+def get_log_filename(log_number: int, filename: str, bagging_iteration: int):
+    """Returns path of log of one (dataset, bagging iteration) unit, so that units running in parallel do not write
+    to the same file
+
+    :param log_number: int
+    :param filename: str
+    :param bagging_iteration: int
+    :return: str
+    """
+    return 'results//integration{}_{}_b_{}.log'.format(log_number, os.path.basename(filename), bagging_iteration)
+
+
+def enable_logging_to_file(classif_data = ClassifLibrary.ClassifierData()):
+    sys.stdout = open(get_log_filename(classif_data.log_number, classif_data.filename, classif_data.bagging_iteration),
+                      'a')
 
 
 def disable_logging_to_file():
+    if sys.stdout is not sys.__stdout__:
+        sys.stdout.close()
     sys.stdout = sys.__stdout__
 
 
+def merge_logs(log_filename: str, classifier_data_pro_file: [], number_of_runs_pro_file: int):
+    """Appends logs of units to log of whole run in order of datasets and bagging iterations and removes them
+
+    :param log_filename: str
+    :param classifier_data_pro_file: [], ClassifLibrary.ClassifierData of every dataset
+    :param number_of_runs_pro_file: int
+    :return:
+    """
+    with open(log_filename, 'a') as log:
+        for classif_data in classifier_data_pro_file:
+            for bagging_iteration in range(number_of_runs_pro_file):
+                unit_log_filename = get_log_filename(classif_data.log_number, classif_data.filename, bagging_iteration)
+                if not os.path.isfile(unit_log_filename):
+                    continue
+                with open(unit_log_filename) as unit_log:
+                    shutil.copyfileobj(unit_log, log)
+                os.remove(unit_log_filename)
+
+
 def indicate_insufficient_samples(e: NotEnoughSamplesError = NotEnoughSamplesError('Not enough samples for plot'),
                                   classifier_data: ClassifLibrary.ClassifierData = ClassifLibrary.ClassifierData()):
     print('\n#####\n')
@@ -31,7 +70,6 @@ def run(classif_data = ClassifLibrary.ClassifierData()):
     :param classif_data: ClassifLibrary.ClassifierData
     :return: mv_score, merged_score, mv_mcc, merged_mcc
     """
-    log_number = classif_data.log_number
     logging_to_file = classif_data.logging_to_file
     logging_intermediate_results = classif_data.logging_intermediate_results
 
@@ -41,11 +79,23 @@ def run(classif_data = ClassifLibrary.ClassifierData()):
     number_of_classifiers = classif_data.number_of_classifiers
 
     if logging_to_file:
-        enable_logging_to_file(log_number)
+        enable_logging_to_file(classif_data)
     classif_data.validate()
     show_plots = classif_data.show_plots
     show_only_first_plot = classif_data.show_only_first_plot
 
+    checkpoint_directory = classif_data.checkpoint_directory
+    resume_from_checkpoints = classif_data.resume_from_checkpoints
+    if checkpoint_directory is not None:
+        fingerprint = CheckpointStore.get_config_fingerprint(classif_data)
+        if resume_from_checkpoints:
+            list_of_results_pro_selection = CheckpointStore.load(fingerprint, classifier_data = classif_data)
+            if list_of_results_pro_selection is not None:
+                print('Results of {}. bagging iteration loaded from checkpoint'.format(classif_data.bagging_iteration))
+                if logging_to_file:
+                    disable_logging_to_file()
+                return list_of_results_pro_selection
+
     clfs = ClassifLibrary.initialize_classifiers(classif_data)
 
     X, y = ClassifLibrary.prepare_raw_data(classif_data)
@@ -75,28 +125,59 @@ def run(classif_data = ClassifLibrary.ClassifierData()):
 
         print('\n{}. iteration\n'.format(n_perm + 1))
 
+        if checkpoint_directory is not None and resume_from_checkpoints:
+            checkpoint = CheckpointStore.load(fingerprint, n_perm, classif_data)
+            if checkpoint is not None:
+                print('Iteration loaded from checkpoint')
+                scores_pro_nbest, mccs_pro_nbest = checkpoint
+                for n_best in range(2, number_of_classifiers):
+                    scores_pro_space_division_pro_nbest[n_best - 2].append(scores_pro_nbest[n_best - 2])
+                    mccs_pro_space_division_pro_nbest[n_best - 2].append(mccs_pro_nbest[n_best - 2])
+                continue
+
         X_whole_train, y_whole_train, X_validation, y_validation, X_test, y_test = \
             ClassifLibrary.get_permutation(X_splitted, y_splitted, permutations[n_perm], classif_data)
 
         clfs, coefficients = \
             ClassifLibrary.train_classifiers(clfs, X_whole_train, y_whole_train, X, number_of_subplots, classif_data)
 
+        # Base classifiers and majority voting depend neither on n_best nor on space division
+        validation_predictions = ClassifLibrary.predict_classifiers(clfs, X_validation)
+        test_predictions = ClassifLibrary.predict_classifiers(clfs, X_test)
+        base_confusion_matrices = ClassifLibrary.compute_confusion_matrix(clfs, X_test, y_test, test_predictions)
+        mv_conf_mat, mv_score = ClassifLibrary.prepare_majority_voting(clfs, X_test, y_test, test_predictions)
+        tests_pro_space_division, mean_composites_pro_space_division = {}, {}
+
         for n_best in range(2, number_of_classifiers):
             scores_pro_space_division, mccs_pro_space_division = [], []
             classif_data.number_of_best_classifiers = n_best
             for i in range(len(space_division)):
                 print('{}. space division: {}'.format(i, space_division[i]))
                 classif_data.number_of_space_parts = space_division[i]
-                scores, cumulated_scores = \
-                    ClassifLibrary.test_classifiers(clfs, X_validation, y_validation, coefficients, classif_data)
-
-                confusion_matrices = ClassifLibrary.compute_confusion_matrix(clfs, X_test, y_test)
-
-                mv_conf_mat, mv_score = ClassifLibrary.prepare_majority_voting(clfs, X_test, y_test)
+                if i not in tests_pro_space_division:
+                    validation_subspace_indices = ClassifLibrary.get_subspace_indices(X_validation, classif_data)
+                    tests_pro_space_division[i] = \
+                        ClassifLibrary.get_subspace_indices(X_test, classif_data), \
+                        ClassifLibrary.test_classifiers(clfs, X_validation, y_validation, coefficients, classif_data,
+                                                        validation_subspace_indices, validation_predictions)
+                test_subspace_indices, (base_scores, base_cumulated_scores) = tests_pro_space_division[i]
+                scores, cumulated_scores = list(base_scores), list(base_cumulated_scores)
+
+                confusion_matrices = list(base_confusion_matrices)
                 confusion_matrices.append(mv_conf_mat)
                 cumulated_scores.append(mv_score)
 
-                if type_of_composition == CompositionType.MEAN:
+                if type_of_composition == CompositionType.MEAN and not show_plots:
+                    if i not in mean_composites_pro_space_division:
+                        mean_composites_pro_space_division[i] = \
+                            ClassifLibrary.prepare_composite_mean_classifier_for_all_n_best(X_test,
+                                                                                            y_test,
+                                                                                            coefficients,
+                                                                                            base_scores,
+                                                                                            classif_data,
+                                                                                            test_subspace_indices)
+                    scores, i_score, i_conf_mat = mean_composites_pro_space_division[i][n_best - 2]
+                elif type_of_composition == CompositionType.MEAN:
                     scores, i_score, i_conf_mat = \
                         ClassifLibrary.prepare_composite_mean_classifier(X_test,
                                                                          y_test,
@@ -105,7 +186,8 @@ def run(classif_data = ClassifLibrary.ClassifierData()):
                                                                          scores,
                                                                          number_of_subplots,
                                                                          i,
-                                                                         classif_data)
+                                                                         classif_data,
+                                                                         test_subspace_indices)
                 elif type_of_composition == CompositionType.MEDIAN:
                     scores, i_score, i_conf_mat = \
                         ClassifLibrary.prepare_composite_median_classifier(X_test,
@@ -115,7 +197,8 @@ def run(classif_data = ClassifLibrary.ClassifierData()):
                                                                            scores,
                                                                            number_of_subplots,
                                                                            i,
-                                                                           classif_data)
+                                                                           classif_data,
+                                                                           test_subspace_indices)
 
                 confusion_matrices.append(i_conf_mat)
                 cumulated_scores.append(i_score)
@@ -145,6 +228,12 @@ def run(classif_data = ClassifLibrary.ClassifierData()):
             scores_pro_space_division_pro_nbest[n_best - 2].append(scores_pro_space_division)
             mccs_pro_space_division_pro_nbest[n_best - 2].append(mccs_pro_space_division)
 
+        if checkpoint_directory is not None:
+            CheckpointStore.store(fingerprint,
+                                  ([scores[-1] for scores in scores_pro_space_division_pro_nbest],
+                                   [mccs[-1] for mccs in mccs_pro_space_division_pro_nbest]),
+                                  n_perm, classif_data)
+
     print('\n#####\nOverall results_pro_division after {} iterations:'.format(len(permutations)))
     mean_scores, mean_mccs = \
         np.mean(scores_pro_space_division_pro_nbest, 1), np.mean(mccs_pro_space_division_pro_nbest, 1)
@@ -181,6 +270,25 @@ def run(classif_data = ClassifLibrary.ClassifierData()):
         list_of_results_pro_selection.append(list_of_results_pro_space_division)
         classif_iter += 1
 
+    if checkpoint_directory is not None:
+        CheckpointStore.store(fingerprint, list_of_results_pro_selection, classifier_data = classif_data)
     if logging_to_file:
         disable_logging_to_file()
     return list_of_results_pro_selection
+
+
+def run_isolated(classif_data = ClassifLibrary.ClassifierData(), seed: int = None, bagging_iteration: int = None):
+    """Invokes merging algorithm on a private copy of classification data, so that it can be submitted
+    as a unit of work to a process pool
+
+    :param classif_data: ClassifLibrary.ClassifierData
+    :param seed: int, overrides seed of the copy if given
+    :param bagging_iteration: int, overrides bagging_iteration of the copy if given
+    :return: list_of_results_pro_selection: []
+    """
+    classif_data = copy.deepcopy(classif_data)
+    if seed is not None:
+        classif_data.seed = seed
+    if bagging_iteration is not None:
+        classif_data.bagging_iteration = bagging_iteration
+    return run(classif_data)
@@ -0,0 +1,171 @@
+import csv
+import os
+
+import FileHelper
+from AdvIntegrRes import AdvIntegrRes
+from ClassifierData import ClassifierData
+from CompositionType import CompositionType
+
+KEY_COLUMNS = ['filename', 'n_class', 'n_best', 'space_parts', 'i_meth', 'bagging']
+METRIC_COLUMNS = ['mv_score', 'mv_score_std', 'mv_mcc', 'mv_mcc_std', 'i_score', 'i_score_std', 'i_mcc', 'i_mcc_std']
+COLUMNS = KEY_COLUMNS + METRIC_COLUMNS
+ROWS_PRO_SYNC = 64
+
+
+def get_method_number(classifier_data: ClassifierData = ClassifierData()):
+    """Returns number of integration method as used in names of result files
+
+    :param classifier_data: ClassifierData
+    :return: int, 0 for mean, 1 for median
+    """
+    return 0 if classifier_data.type_of_composition == CompositionType.MEAN else 1
+
+
+def truncate_incomplete_line(sink_filename: str, chunk_size: int = 1 << 16):
+    """Cuts off line left incomplete by interrupted write, i.e. everything after the last line break
+
+    :param sink_filename: str
+    :param chunk_size: int, size of chunks read backwards while searching for line break
+    :return:
+    """
+    with open(sink_filename, 'r+b') as file:
+        end = file.seek(0, os.SEEK_END)
+        position = end
+        while position > 0:
+            start = max(position - chunk_size, 0)
+            file.seek(start)
+            line_break = file.read(position - start).rfind(b'\n')
+            if line_break != -1:
+                position = start + line_break + 1
+                break
+            position = start
+        if position != end:
+            file.truncate(position)
+            file.flush()
+            os.fsync(file.fileno())
+
+
+class ResultSink:
+    """Append only csv file with one row pro (filename, n_class, n_best, space_parts, i_meth, bagging), rows are
+    synced to disk in batches, so that results computed before crash are kept
+
+    """
+
+    def __init__(self, sink_filename: str, rows_pro_sync: int = ROWS_PRO_SYNC):
+        if os.path.isfile(sink_filename):
+            truncate_incomplete_line(sink_filename)
+        is_new = not os.path.isfile(sink_filename) or os.path.getsize(sink_filename) == 0
+        self.sink_filename = sink_filename
+        self.rows_pro_sync = rows_pro_sync
+        self.unsynced_rows = 0
+        self.file = open(sink_filename, 'a', newline = '')
+        self.writer = csv.writer(self.file)
+        if is_new:
+            self.writer.writerow(COLUMNS)
+            self.sync()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write(self, res_obj: AdvIntegrRes):
+        """Appends one result object
+
+        :param res_obj: AdvIntegrRes
+        :return:
+        """
+        self.writer.writerow([getattr(res_obj, column) for column in COLUMNS])
+        self.unsynced_rows += 1
+        if self.unsynced_rows >= self.rows_pro_sync:
+            self.sync()
+
+    def write_res_objects(self, filename: str, res: [], classifier_data: ClassifierData = ClassifierData()):
+        """Appends results of one dataset and syncs them
+
+        :param filename: str, name of dataset
+        :param res: [], IntegrRes pro n_best pro space division, as returned by MergingAlgorithm.run
+        :param classifier_data: ClassifierData
+        :return:
+        """
+        i_meth, bagging = get_method_number(classifier_data), int(classifier_data.bagging)
+        for j in range(len(res)):
+            for k in range(len(res[j])):
+                result = res[j][k]
+                self.write(AdvIntegrRes(result.mv_score, result.mv_score_std, result.mv_mcc, result.mv_mcc_std,
+                                        result.i_score, result.i_score_std, result.i_mcc, result.i_mcc_std,
+                                        classifier_data.number_of_classifiers, j + 2, i_meth, bagging,
+                                        classifier_data.space_division[k], filename))
+        self.sync()
+
+    def sync(self):
+        """Forces written rows to disk
+
+        :return:
+        """
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.unsynced_rows = 0
+
+    def close(self):
+        if not self.file.closed:
+            self.sync()
+            self.file.close()
+
+
+def read_res_objects(sink_filename: str):
+    """Reads result objects from sink file, incomplete rows left by interrupted writes and rows which can not be
+    parsed are skipped
+
+    :param sink_filename: str
+    :return: result_objects: [AdvIntegrRes]
+    """
+    result_objects = []
+    with open(sink_filename, newline = '') as file:
+        lines = file.read().splitlines(keepends = True)
+    if len(lines) > 0 and not lines[-1].endswith('\n'):
+        lines.pop()
+    for row in csv.DictReader(lines):
+        if None in row.values():
+            continue
+        try:
+            metrics = [float(row[column]) for column in METRIC_COLUMNS]
+            keys = [int(row[column]) for column in ['n_class', 'n_best', 'i_meth', 'bagging', 'space_parts']]
+        except ValueError:
+            continue
+        result_objects.append(AdvIntegrRes(*metrics, *keys, row['filename']))
+    return result_objects
+
+
+def export_to_xls(sink_filename: str, filenames: [], results_directory_relative: str = 'results',
+                  classifier_data: ClassifierData = ClassifierData()):
+    """Regenerates legacy xls file (as written by
+    FileHelper.save_res_objects_pro_space_division_pro_base_classif_with_classif_data_name) for number of classifiers,
+    integration method and bagging of classifier_data, datasets without complete results are skipped, later rows
+    override earlier ones
+
+    :param sink_filename: str
+    :param filenames: [], names of datasets in order of rows
+    :param results_directory_relative: str
+    :param classifier_data: ClassifierData
+    :return:
+    """
+    number_of_classifiers = classifier_data.number_of_classifiers
+    i_meth, bagging = get_method_number(classifier_data), int(classifier_data.bagging)
+    res_objects = {}
+    for res_obj in read_res_objects(sink_filename):
+        if res_obj.n_class == number_of_classifiers and res_obj.i_meth == i_meth and res_obj.bagging == bagging:
+            res_objects[(res_obj.filename, res_obj.n_best, res_obj.space_parts)] = res_obj
+    exported_filenames, results = [], []
+    for filename in filenames:
+        try:
+            res = [[res_objects[(filename, n_best, space_parts)] for space_parts in classifier_data.space_division]
+                   for n_best in range(2, number_of_classifiers)]
+        except KeyError:
+            continue
+        exported_filenames.append(filename)
+        results.append(res)
+    FileHelper.save_res_objects_pro_space_division_pro_base_classif_with_classif_data_name(
+        exported_filenames, results, number_of_classifiers, results_directory_relative = results_directory_relative,
+        classifier_data = classifier_data)
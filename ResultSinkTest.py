@@ -0,0 +1,116 @@
+import os
+import tempfile
+import unittest
+
+import FileHelper
+import ResultSink
+from ClassifierData import ClassifierData
+from CompositionType import CompositionType
+from IntegrRes import IntegrRes
+
+
+class ResultSinkTest(unittest.TestCase):
+    SPACE_DIVISION = [3, 4]
+    NUMBER_OF_CLASSIFIERS = 4
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.sink_filename = os.path.join(self.directory.name, 'Results0.csv')
+        self.classifier_data = ClassifierData(number_of_classifiers = self.NUMBER_OF_CLASSIFIERS,
+                                              space_division = self.SPACE_DIVISION, bagging = True,
+                                              type_of_composition = CompositionType.MEDIAN)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def prepare_res(self, offset: float):
+        return [[IntegrRes(offset + j, .1, offset + k, .2, offset + j + k, .3, .5, .4)
+                 for k in range(len(self.SPACE_DIVISION))]
+                for j in range(self.NUMBER_OF_CLASSIFIERS - 2)]
+
+    def test_should_read_written_rows(self):
+        # given
+        with ResultSink.ResultSink(self.sink_filename, rows_pro_sync = 3) as sink:
+            # when
+            sink.write_res_objects('bupa.dat', self.prepare_res(.25), self.classifier_data)
+        res_objects = ResultSink.read_res_objects(self.sink_filename)
+        # then
+        self.assertEqual((self.NUMBER_OF_CLASSIFIERS - 2) * len(self.SPACE_DIVISION), len(res_objects))
+        res_obj = res_objects[-1]
+        self.assertEqual(('bupa.dat', 4, 3, 4, 1, 1), (res_obj.filename, res_obj.n_class, res_obj.n_best,
+                                                        res_obj.space_parts, res_obj.i_meth, res_obj.bagging))
+        self.assertEqual(2.25, res_obj.i_score)
+
+    def test_should_skip_incomplete_last_row_and_append_after_it(self):
+        # given
+        with ResultSink.ResultSink(self.sink_filename) as sink:
+            sink.write_res_objects('bupa.dat', self.prepare_res(0), self.classifier_data)
+        with open(self.sink_filename, 'a') as file:
+            file.write('haberman.dat,4,2,3,1')
+        number_of_rows = len(ResultSink.read_res_objects(self.sink_filename))
+        # when
+        with ResultSink.ResultSink(self.sink_filename) as sink:
+            sink.write_res_objects('haberman.dat', self.prepare_res(0), self.classifier_data)
+        # then
+        self.assertEqual(2 * number_of_rows, len(ResultSink.read_res_objects(self.sink_filename)))
+
+    def test_should_cut_off_row_interrupted_after_separator(self):
+        # given
+        with ResultSink.ResultSink(self.sink_filename) as sink:
+            sink.write_res_objects('bupa.dat', self.prepare_res(0), self.classifier_data)
+        number_of_rows = len(ResultSink.read_res_objects(self.sink_filename))
+        with open(self.sink_filename, 'a') as file:
+            file.write('haberman.dat,4,2,3,1,1,0,.1,1,.2,2,.3,.5,')
+        # when
+        with ResultSink.ResultSink(self.sink_filename) as sink:
+            sink.write_res_objects('haberman.dat', self.prepare_res(0), self.classifier_data)
+        # then
+        self.assertEqual(2 * number_of_rows, len(ResultSink.read_res_objects(self.sink_filename)))
+
+    def test_should_cut_off_row_interrupted_inside_number(self):
+        # given
+        with ResultSink.ResultSink(self.sink_filename) as sink:
+            sink.write_res_objects('bupa.dat', self.prepare_res(0), self.classifier_data)
+        with open(self.sink_filename, 'a') as file:
+            file.write('haberman.dat,4,2,3,1,1,0,.1,1,.2,2,.3,.5,0.1')
+        # when
+        with ResultSink.ResultSink(self.sink_filename) as sink:
+            sink.write_res_objects('wdbc.dat', self.prepare_res(0), self.classifier_data)
+        res_objects = ResultSink.read_res_objects(self.sink_filename)
+        # then
+        self.assertNotIn('haberman.dat', [res_obj.filename for res_obj in res_objects])
+        self.assertEqual([.4] * len(res_objects), [res_obj.i_mcc_std for res_obj in res_objects])
+
+    def test_should_skip_rows_which_can_not_be_parsed(self):
+        # given
+        with ResultSink.ResultSink(self.sink_filename) as sink:
+            sink.write_res_objects('bupa.dat', self.prepare_res(0), self.classifier_data)
+        number_of_rows = len(ResultSink.read_res_objects(self.sink_filename))
+        with open(self.sink_filename, 'a', newline = '') as file:
+            file.write('haberman.dat,4,2,3,1,1,0,.1,1,.2,2,.3,.5,\r\n')
+        # when
+        res_objects = ResultSink.read_res_objects(self.sink_filename)
+        # then
+        self.assertEqual(number_of_rows, len(res_objects))
+
+    def test_should_export_legacy_xls(self):
+        # given
+        with ResultSink.ResultSink(self.sink_filename) as sink:
+            sink.write_res_objects('bupa.dat', self.prepare_res(0), self.classifier_data)
+            sink.write_res_objects('haberman.dat', self.prepare_res(10), self.classifier_data)
+        # when
+        ResultSink.export_to_xls(self.sink_filename, ['bupa.dat', 'haberman.dat', 'wdbc.dat'],
+                                 results_directory_relative = self.directory.name,
+                                 classifier_data = self.classifier_data)
+        res_objects = FileHelper.read_objects_from_file(os.path.join(self.directory.name, 'n_4_b_1_i_1.xls'),
+                                                        self.NUMBER_OF_CLASSIFIERS, 1, 1)
+        # then
+        self.assertEqual(2 * (self.NUMBER_OF_CLASSIFIERS - 2) * len(self.SPACE_DIVISION), len(res_objects))
+        expected = {(res_obj.filename, res_obj.n_best, res_obj.space_parts): res_obj.i_score
+                    for res_obj in ResultSink.read_res_objects(self.sink_filename)}
+        for res_obj in res_objects:
+            self.assertEqual(expected[(res_obj.filename, res_obj.n_best, res_obj.space_parts)], res_obj.i_score)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+from AdvIntegrRes import AdvIntegrRes
+
+DERIVED_ATTRIBUTES = {
+    'n_best_diff': lambda res_obj: res_obj.n_class - res_obj.n_best
+}
+
+
+def get_attribute(res_obj: AdvIntegrRes, name: str):
+    """Returns attribute of result object, including derived ones
+
+    :param res_obj: AdvIntegrRes
+    :param name: str, attribute of AdvIntegrRes or key of DERIVED_ATTRIBUTES
+    :return: value of attribute
+    """
+    if name in DERIVED_ATTRIBUTES:
+        return DERIVED_ATTRIBUTES[name](res_obj)
+    return getattr(res_obj, name)
+
+
+class ResultStore:
+    """In memory store of result objects with hash indexes, index for every combination of queried attributes is built
+    on the first query and reused afterwards, objects are returned in order of loading
+
+    """
+
+    def __init__(self, result_objects: []):
+        self.result_objects = list(result_objects)
+        self.indexes = {}
+
+    def __len__(self):
+        return len(self.result_objects)
+
+    def get_index(self, names: tuple):
+        """Returns index of result objects by values of given attributes, builds it if needed
+
+        :param names: tuple of str
+        :return: {}, tuple of values: [AdvIntegrRes]
+        """
+        if names not in self.indexes:
+            index = {}
+            for res_obj in self.result_objects:
+                key = tuple(get_attribute(res_obj, name) for name in names)
+                index.setdefault(key, []).append(res_obj)
+            self.indexes[names] = index
+        return self.indexes[names]
+
+    def select(self, **conditions):
+        """Selects result objects with given values of attributes, e.g. select(n_class = 3, bagging = 0)
+
+        :param conditions: attribute = value
+        :return: [AdvIntegrRes]
+        """
+        names = tuple(sorted(conditions))
+        key = tuple(conditions[name] for name in names)
+        return list(self.get_index(names).get(key, []))
+
+    def select_one(self, **conditions):
+        """Selects first result object with given values of attributes
+
+        :param conditions: attribute = value
+        :return: AdvIntegrRes or None
+        """
+        names = tuple(sorted(conditions))
+        key = tuple(conditions[name] for name in names)
+        selected = self.get_index(names).get(key)
+        return selected[0] if selected else None
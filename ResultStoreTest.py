@@ -0,0 +1,46 @@
+import unittest
+
+from AdvIntegrRes import AdvIntegrRes
+from ResultStore import ResultStore
+
+
+class ResultStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.result_objects = []
+        for filename in ['bupa.dat', 'wdbc.dat']:
+            for n_class in [3, 5]:
+                for n_best in range(2, n_class):
+                    for space_parts in [3, 4]:
+                        self.result_objects.append(
+                            AdvIntegrRes(.5, 0, .1, 0, .6, 0, .2, 0, n_class, n_best, 0, 0, space_parts, filename))
+        self.store = ResultStore(self.result_objects)
+
+    def test_should_select_same_objects_as_linear_filter(self):
+        # given
+        expected = [res_obj for res_obj in self.result_objects
+                    if res_obj.filename == 'wdbc.dat' and res_obj.n_class == 5 and res_obj.space_parts == 4]
+        # when
+        selected = self.store.select(filename = 'wdbc.dat', n_class = 5, space_parts = 4)
+        # then
+        self.assertEqual(expected, selected)
+
+    def test_should_select_by_difference_of_n_class_and_n_best(self):
+        # given
+        expected = [res_obj for res_obj in self.result_objects if res_obj.n_class - res_obj.n_best == 1]
+        # when
+        selected = self.store.select(n_best_diff = 1)
+        # then
+        self.assertEqual(expected, selected)
+
+    def test_should_return_none_when_nothing_matches(self):
+        # given
+        # when
+        selected = self.store.select_one(filename = 'haberman.dat')
+        # then
+        self.assertIsNone(selected)
+        self.assertEqual([], self.store.select(filename = 'haberman.dat'))
+
+
+if __name__ == '__main__':
+    unittest.main()
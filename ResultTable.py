@@ -0,0 +1,175 @@
+import os
+
+import numpy as np
+
+from AdvIntegrRes import AdvIntegrRes
+
+METRIC_COLUMNS = ['mv_score', 'mv_score_std', 'mv_mcc', 'mv_mcc_std', 'i_score', 'i_score_std', 'i_mcc', 'i_mcc_std']
+PARAMETER_COLUMNS = ['n_class', 'n_best', 'i_meth', 'bagging', 'space_parts']
+CATEGORICAL_COLUMN = 'filename'
+COLUMNS = METRIC_COLUMNS + PARAMETER_COLUMNS + [CATEGORICAL_COLUMN]
+
+
+class ResultTable:
+    """Columnar table of integration results, one array pro field of AdvIntegrRes, filename is stored as categorical
+    column (codes into array of categories)
+
+    """
+
+    def __init__(self, columns: {}, categories: [] = None):
+        """
+        :param columns: {}, name of column: array, filename column contains either codes (if categories are given)
+        or names of files
+        :param categories: [], names of files
+        """
+        self.columns = {}
+        for name in METRIC_COLUMNS:
+            self.columns[name] = np.asarray(columns[name], dtype = float)
+        for name in PARAMETER_COLUMNS:
+            self.columns[name] = np.asarray(columns[name], dtype = int)
+        if categories is None:
+            categories, codes = np.unique(np.asarray(columns[CATEGORICAL_COLUMN], dtype = str), return_inverse = True)
+        else:
+            codes = columns[CATEGORICAL_COLUMN]
+        self.categories = np.asarray(categories, dtype = str)
+        self.columns[CATEGORICAL_COLUMN] = np.asarray(codes, dtype = int).reshape(-1)
+
+    @classmethod
+    def from_res_objects(cls, res_objects: []):
+        """Builds table from result objects
+
+        :param res_objects: [AdvIntegrRes]
+        :return: ResultTable
+        """
+        return cls({name: [getattr(res_obj, name) for res_obj in res_objects] for name in COLUMNS})
+
+    @classmethod
+    def concatenate(cls, tables: []):
+        """Joins tables one after another
+
+        :param tables: [ResultTable]
+        :return: ResultTable
+        """
+        columns = {name: np.concatenate([table.columns[name] for table in tables] + [np.empty(0)])
+                   for name in METRIC_COLUMNS + PARAMETER_COLUMNS}
+        columns[CATEGORICAL_COLUMN] = np.concatenate([table[CATEGORICAL_COLUMN] for table in tables] +
+                                                     [np.empty(0, dtype = str)])
+        return cls(columns)
+
+    @classmethod
+    def load(cls, filename: str):
+        """Loads table saved with save
+
+        :param filename: str, .npz file
+        :return: table, metadata: ResultTable, np.array
+        """
+        with np.load(filename) as file:
+            columns = {name: file[name] for name in COLUMNS}
+            return cls(columns, file['categories']), file['metadata']
+
+    def save(self, filename: str, metadata: [] = ()):
+        """Saves table into .npz file atomically
+
+        :param filename: str
+        :param metadata: [], integers stored together with table
+        :return:
+        """
+        temporary_filename = '{}.{}.tmp'.format(filename, os.getpid())
+        with open(temporary_filename, 'wb') as file:
+            np.savez(file, categories = self.categories, metadata = np.asarray(metadata, dtype = np.int64),
+                     **self.columns)
+        os.replace(temporary_filename, filename)
+
+    def __len__(self):
+        return len(self.columns[CATEGORICAL_COLUMN])
+
+    def __getitem__(self, name: str):
+        """Returns column, filenames are decoded from categories
+
+        :param name: str
+        :return: np.array
+        """
+        if name == CATEGORICAL_COLUMN:
+            return self.categories[self.columns[CATEGORICAL_COLUMN]]
+        return self.columns[name]
+
+    def to_res_objects(self):
+        """Converts table back into result objects
+
+        :return: [AdvIntegrRes]
+        """
+        values = [self[name].tolist() for name in COLUMNS]
+        return [AdvIntegrRes(*row) for row in zip(*values)]
+
+    def mask(self, **conditions):
+        """Computes mask of rows with given values, value can be also list of allowed values,
+        e.g. mask(n_class = 9, space_parts = [3, 5])
+
+        :param conditions: column = value or list of values
+        :return: np.array of bool
+        """
+        mask = np.ones(len(self), dtype = bool)
+        for name, value in conditions.items():
+            column = self[name] if name == CATEGORICAL_COLUMN else self.columns[name]
+            if isinstance(value, (list, tuple, np.ndarray)):
+                mask &= np.isin(column, value)
+            else:
+                mask &= column == value
+        return mask
+
+    def take(self, indices):
+        """Returns table with chosen rows
+
+        :param indices: mask or array of indices
+        :return: ResultTable
+        """
+        columns = {name: column[indices] for name, column in self.columns.items()}
+        return ResultTable(columns, self.categories)
+
+    def select(self, **conditions):
+        """Returns table with rows with given values, see mask
+
+        :param conditions: column = value or list of values
+        :return: ResultTable
+        """
+        return self.take(self.mask(**conditions))
+
+    def pivot(self, index: str, columns: str, values: str, index_values: [] = None, column_values: [] = None):
+        """Arranges values into matrix with rows given by one column and columns by another one, if a cell occurs more
+        than once, last row wins, raises ValueError if any cell is missing
+
+        :param index: str, column defining rows
+        :param columns: str, column defining columns
+        :param values: str, column with values
+        :param index_values: [], values of rows in order, unique values of index column if None
+        :param column_values: [], values of columns in order, unique values of columns column if None
+        :return: index_values, column_values, matrix: np.array, np.array, np.array
+        """
+        index_column, columns_column = self[index], self[columns]
+        index_values = np.unique(index_column) if index_values is None else np.asarray(index_values)
+        column_values = np.unique(columns_column) if column_values is None else np.asarray(column_values)
+        matrix = np.full((len(index_values), len(column_values)), np.nan)
+        rows, row_found = get_positions(index_values, index_column)
+        cols, col_found = get_positions(column_values, columns_column)
+        found = row_found & col_found
+        matrix[rows[found], cols[found]] = self[values][found]
+        filled = np.zeros(matrix.shape, dtype = bool)
+        filled[rows[found], cols[found]] = True
+        if not filled.all():
+            missing = [(index_values[row], column_values[col]) for row, col in np.argwhere(~filled)]
+            raise ValueError('Missing cells ({}, {}) in pivot: {}'.format(index, columns, missing))
+        return index_values, column_values, matrix
+
+
+def get_positions(values: [], column: []):
+    """Finds positions of column elements in values
+
+    :param values: np.array
+    :param column: np.array
+    :return: positions, found: np.array, np.array of bool
+    """
+    if len(values) == 0:
+        return np.zeros(len(column), dtype = int), np.zeros(len(column), dtype = bool)
+    order = np.argsort(values, kind = 'stable')
+    positions = np.minimum(np.searchsorted(values, column, sorter = order), len(values) - 1)
+    return order[positions], values[order][positions] == column
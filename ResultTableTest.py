@@ -0,0 +1,69 @@
+import unittest
+
+from AdvIntegrRes import AdvIntegrRes
+from ResultTable import ResultTable
+
+
+class ResultTableTest(unittest.TestCase):
+
+    def setUp(self):
+        self.result_objects = []
+        value = 0
+        for filename in ['wdbc.dat', 'bupa.dat']:
+            for n_best in range(2, 5):
+                for space_parts in [3, 4]:
+                    value += 1
+                    self.result_objects.append(AdvIntegrRes(value / 100, 0, .1, 0, value / 50, 0, .2, 0, 5, n_best, 1,
+                                                            0, space_parts, filename))
+        self.table = ResultTable.from_res_objects(self.result_objects)
+
+    def test_should_convert_back_to_same_objects(self):
+        # given
+        # when
+        result_objects = self.table.to_res_objects()
+        # then
+        self.assertEqual([vars(res_obj) for res_obj in self.result_objects],
+                         [vars(res_obj) for res_obj in result_objects])
+
+    def test_should_select_rows(self):
+        # given
+        expected = [res_obj.i_score for res_obj in self.result_objects
+                    if res_obj.filename == 'bupa.dat' and res_obj.n_best in [2, 4]]
+        # when
+        selection = self.table.select(filename = 'bupa.dat', n_best = [2, 4])
+        # then
+        self.assertEqual(expected, selection['i_score'].tolist())
+
+    def test_should_pivot_in_given_order(self):
+        # given
+        selection = self.table.select(space_parts = 4)
+        # when
+        n_bests, filenames, matrix = selection.pivot('n_best', 'filename', 'mv_score', [4, 2],
+                                                     ['bupa.dat', 'wdbc.dat'])
+        # then
+        self.assertEqual([4, 2], n_bests.tolist())
+        self.assertEqual([.12, .08], matrix[:, 0].tolist())
+        self.assertEqual([.06, .02], matrix[:, 1].tolist())
+
+    def test_should_raise_error_for_missing_cells_in_pivot(self):
+        # given
+        selection = self.table.select(space_parts = 4)
+        # when
+        # then
+        with self.assertRaises(ValueError):
+            selection.pivot('n_best', 'filename', 'mv_score', [4, 2], ['wdbc.dat', 'haberman.dat', 'bupa.dat'])
+        with self.assertRaises(ValueError):
+            selection.pivot('n_best', 'filename', 'mv_score', [5], ['wdbc.dat'])
+
+    def test_should_concatenate_tables(self):
+        # given
+        other = ResultTable.from_res_objects(self.result_objects[:3])
+        # when
+        table = ResultTable.concatenate([self.table, other])
+        # then
+        self.assertEqual(len(self.result_objects) + 3, len(table))
+        self.assertEqual(self.table['filename'].tolist() + other['filename'].tolist(), table['filename'].tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,11 +1,11 @@
-from ClassificationAnalysis import read_in_objects
-from ClassifLibrary import initialize_list_of_lists
+from ClassificationAnalysis import read_in_table
 from scipy.stats import kstest, shapiro, friedmanchisquare, f_oneway, kruskal, wilcoxon, ttest_ind, median_test
 import numpy as np
 import matplotlib.pyplot as plt
-from nonparametric_tests import friedman_aligned_ranks_test, friedman_test, bonferroni_dunn_test, holm_test
+from nonparametric_tests import friedman_aligned_ranks_test, friedman_test, holm_test, control_post_hoc_tests
+from permutation_tests import friedman_permutation_test, wilcoxon_permutation_test
 
-objects = read_in_objects()
+table = read_in_table()
 filenames = ['biodeg.scsv', 'bupa.dat', 'cryotherapy.xlsx',
              'data_banknote_authentication.csv', 'haberman.dat',
              'ionosphere.dat', 'meter_a.tsv', 'pop_failures.tsv',
@@ -31,6 +31,10 @@ measures_dict = {
 }
 measures = ['score', 'mcc']
 intRef = ['i', 'mv']
+# p-values of Friedman and Wilcoxon tests from permutation distribution instead of asymptotic one
+use_permutation_tests = False
+if use_permutation_tests:
+    friedman_test, wilcoxon = friedman_permutation_test, wilcoxon_permutation_test
 
 def bland_altman_plot(data1, data2, *args, **kwargs):
     data1 = np.asarray(data1)
@@ -46,106 +50,52 @@ def bland_altman_plot(data1, data2, *args, **kwargs):
 
 
 def get_dependent_from_n_class_const(n_class, n_best, space_parts, i_meth, bagging):
-    subjects = initialize_list_of_lists(len(n_class))
-    for i in range(len(n_class)):
-        for object in objects:
-            if object.n_class == n_class[i] and \
-                    object.n_best == n_best and \
-                    object.space_parts == space_parts and \
-                    object.i_meth == i_meth and \
-                    object.bagging == bagging:
-                subjects[i].append(object)
-    return subjects
+    selection = table.select(n_best = n_best, space_parts = space_parts, i_meth = i_meth, bagging = bagging)
+    return [selection.select(n_class = value) for value in n_class]
 
 
 def get_mv_i_diff(i_meth, bagging, measure):
-    means, diffs = [], []
-    for object in objects:
-        if object.i_meth == i_meth and \
-                object.bagging == bagging:
-            if measure == 'score':
-                means.append((object.i_score + object.mv_score) / 2)
-                diffs.append(object.i_score - object.mv_score)
-            else:
-                means.append((object.i_mcc + object.mv_mcc) / 2)
-                diffs.append(object.i_mcc - object.mv_mcc)
-    return means, diffs
+    selection = table.select(i_meth = i_meth, bagging = bagging)
+    i_values, mv_values = selection['i_' + measure], selection['mv_' + measure]
+    return (i_values + mv_values) / 2, i_values - mv_values
 
 
 def get_diff_meth(bagging):
-    mean_score, median_score, mean_mcc, median_mcc = [], [], [], []
-    for object in objects:
-        if object.bagging == bagging:
-            if object.i_meth == 0:
-                mean_score.append(object.i_score)
-                mean_mcc.append(object.i_mcc)
-            else:
-                median_score.append(object.i_score)
-                median_mcc.append(object.i_mcc)
-    return mean_score, median_score, mean_mcc, median_mcc
+    selection = table.select(bagging = bagging)
+    mean = selection['i_meth'] == 0
+    return selection['i_score'][mean], selection['i_score'][~mean], selection['i_mcc'][mean], selection['i_mcc'][~mean]
 
 
 def get_diff_bag():
-    bag_score, nbag_score, bag_mcc, nbag_mcc = [], [], [], []
-    for object in objects:
-        if object.bagging == 0:
-            nbag_score.append(object.i_score)
-            nbag_mcc.append(object.i_mcc)
-        else:
-            bag_score.append(object.i_score)
-            bag_mcc.append(object.i_mcc)
-    return bag_score, nbag_score, bag_mcc, nbag_mcc
+    nbag = table['bagging'] == 0
+    return table['i_score'][~nbag], table['i_score'][nbag], table['i_mcc'][~nbag], table['i_mcc'][nbag]
 
 
 def get_mv_i(i_meth, bagging):
-    i_score, mv_score, i_mcc, mv_mcc = [], [], [], []
-    for object in objects:
-        if object.i_meth == i_meth and \
-                object.bagging == bagging:
-            i_score.append(object.i_score)
-            mv_score.append(object.mv_score)
-            i_mcc.append(object.i_mcc)
-            mv_mcc.append(object.mv_mcc)
-    return i_score, mv_score, i_mcc, mv_mcc
+    selection = table.select(i_meth = i_meth, bagging = bagging)
+    return selection['i_score'], selection['mv_score'], selection['i_mcc'], selection['mv_mcc']
 
 
 def get_dependent_from_n_class_non_const(n_class, diff, space_parts, i_meth, bagging):
-    subjects = initialize_list_of_lists(len(n_class))
-    for i in range(len(n_class)):
-        for object in objects:
-            if object.n_class == n_class[i] and \
-                    object.n_best == n_class[i] - diff and \
-                    object.space_parts == space_parts and \
-                    object.i_meth == i_meth and \
-                    object.bagging == bagging:
-                subjects[i].append(object)
-    return subjects
+    selection = table.select(space_parts = space_parts, i_meth = i_meth, bagging = bagging)
+    return [selection.select(n_class = value, n_best = value - diff) for value in n_class]
 
 
 def get_dependent_from_n_best(n_class, n_best, space_parts, i_meth, bagging):
-    subjects = initialize_list_of_lists(len(n_best))
-    for i in range(len(n_best)):
-        for object in objects:
-            if object.n_class == n_class and \
-                    object.n_best == n_best[i] and \
-                    object.space_parts == space_parts and \
-                    object.i_meth == i_meth and \
-                    object.bagging == bagging:
-                subjects[i].append(object)
-    return subjects
+    selection = table.select(n_class = n_class, space_parts = space_parts, i_meth = i_meth, bagging = bagging)
+    return [selection.select(n_best = value) for value in n_best]
 
 
 def get_dependent_from_space_parts(n_class, n_best, space_parts, i_meth, bagging):
-    subjects = initialize_list_of_lists(len(space_parts))
-    for i in range(len(space_parts)):
-        for object in objects:
-            if object.n_class == n_class and \
-                    object.n_best == n_best and \
-                    object.space_parts == space_parts[i] and \
-                    object.i_meth == i_meth and \
-                    object.bagging == bagging:
-                subjects[i].append(object)
-    return subjects
+    selection = table.select(n_class = n_class, n_best = n_best, i_meth = i_meth, bagging = bagging)
+    return [selection.select(space_parts = value) for value in space_parts]
+
+
+def get_pivot_from_n_best(n_class, n_best, space_parts, i_meth, bagging, param):
+    """Returns values of param with row pro n_best and column pro filename
+    """
+    selection = table.select(n_class = n_class, space_parts = space_parts, i_meth = i_meth, bagging = bagging)
+    return selection.pivot('n_best', 'filename', param, n_best, filenames)[2]
 
 
 def get_min_stat(subjects, alpha = .005):
@@ -191,13 +141,7 @@ def get_p_sw(subjects, alpha = .005):
 
 
 def extract_arrtibute(subjects, attr):
-    result = []
-    for subject in subjects:
-        partial_result = []
-        for object in subject:
-            partial_result.append(getattr(object, attr))
-        result.append(partial_result)
-    return result
+    return [subject[attr] for subject in subjects]
 
 
 def test_friedman(subjects, alpha = .005):
@@ -225,34 +169,18 @@ def normalize_variance(subjects):
 
 
 def extract_param(objects, param):
-    vals = []
-    for o in objects:
-        row = []
-        for val in o:
-            row.append(getattr(val, param))
-        vals.append(row)
-    return vals
-
-
-def friedman_holm_test(vals):
-    f, p, rankings, pivots = friedman_test(vals)
-    dict = {}
-    for i in range(0, len(rankings)):
-        dict[str(i)] = rankings[i]
-    pvals = []
-    for i in range(0, len(rankings)):
-        comparisons, z, pH, adj_p = holm_test(dict, str(i))
-        pvals.append(min(adj_p))
-    return p, min(pvals)
+    return [o[param] for o in objects]
+
+
+def friedman_holm_test(vals, friedman = friedman_test):
+    f, p, rankings, pivots = friedman(vals)
+    z_values, p_values, adj_p_values = control_post_hoc_tests(rankings, ['holm'])
+    return p, np.nanmin(adj_p_values['holm'])
 
 
 def holm_min(rankings):
-    dict = {}
-    for i in range(0, len(rankings)):
-        dict[str(i)] = rankings[i]
-    comparisonsH, z, pH, adj_p = holm_test(dict, str(len(rankings) - 1))
-    comparisonsD, z_values, p_values, adj_p_values = bonferroni_dunn_test(dict, str(len(rankings) - 1))
-    return min(pH)
+    z_values, p_values, adj_p_values = control_post_hoc_tests(rankings, [])
+    return np.nanmin(p_values[-1])
 
 
 def print_p_val_multi_post_hoc(pF, pH):
@@ -260,10 +188,8 @@ def print_p_val_multi_post_hoc(pF, pH):
 
 
 def find_by_filename(objs, filename):
-    for obj in objs:
-        if obj.filename == filename:
-            return obj
-    return None
+    selection = objs.select(filename = filename)
+    return selection.to_res_objects()[0] if len(selection) > 0 else None
 
 
 # obj = get_dependent_from_space_parts(5, 3, list(range(3, 11)), 0, 0)
@@ -276,10 +202,7 @@ def find_by_filename(objs, filename):
 
 
 def extract_mv_param(obj, param):
-    row = []
-    for o in obj[0]:
-        row.append(getattr(o, param))
-    return row
+    return obj[0][param]
 
 
 def format_to_length(number: float, length: int):
@@ -301,24 +224,19 @@ for space in spaces:
                 file.write(',' + filename.split('.')[0][0:3])
             file.write(",Rank\n")
             for (key, val) in method_dict_short.items(): # iteracja po metodach
-                ranks = []
-                obj = get_dependent_from_n_best(9, best, space, key, 0)
-                valsScore = extract_param(obj, 'i_' + measure)
-                mv_scores = extract_mv_param(obj, 'mv_' + measure)
-                valsScore.append(mv_scores)
-                f, p, rankings, pivots = friedman_test(valsScore)
+                valsScore = get_pivot_from_n_best(9, best, space, key, 0, 'i_' + measure)
+                mv_scores = get_pivot_from_n_best(9, best, space, key, 0, 'mv_' + measure)[0]
+                f, p, rankings, pivots = friedman_test(np.vstack((valsScore, mv_scores)))
                 pH[val + '_' + resname] = holm_min(rankings)
                 for best_index in range(0, len(best)):
                     file.write('\clf{' + val + '}{' + str(best[best_index]) + '}')
-                    for filename in filenames:
-                        f_obj = find_by_filename(obj[best_index], filename)
-                        file.write(',' + format_to_length(getattr(f_obj, 'i_' + measure), 3))
+                    for value in valsScore[best_index]:
+                        file.write(',' + format_to_length(value, 3))
                     file.write(',' + format_to_length(rankings[best_index], 2))
                     file.write('\n')
                 file.write('\clf{MV}')
-                for filename in filenames:
-                    f_obj = find_by_filename(get_dependent_from_n_best(9, best, space, 0, 0)[0], filename)
-                    file.write(',' + format_to_length(getattr(f_obj, 'mv_' + measure), 3))
+                for value in get_pivot_from_n_best(9, best, space, 0, 0, 'mv_' + measure)[0]:
+                    file.write(',' + format_to_length(value, 3))
                 file.write(',' + format_to_length(rankings[-1], 2))
                 file.write('\n')
 
@@ -343,16 +261,13 @@ with open('stat.csv', 'w') as file:
                 file.write('Subspaces: ' + str(space) + '\n')
                 file.write('Measure: ' + measure + '\n')
                 file.write('Method: ' + val + '\n')
-                obj = get_dependent_from_n_best(9, best, space, key, 0)
-                valsScore = extract_param(obj, 'i_' + measure)
-                mv_scores = extract_mv_param(obj, 'mv_' + measure)
-                valsScore.append(mv_scores)
-                f, p, rankings, pivots = friedman_test(valsScore)
+                valsScore = get_pivot_from_n_best(9, best, space, key, 0, 'i_' + measure)
+                mv_scores = get_pivot_from_n_best(9, best, space, key, 0, 'mv_' + measure)[0]
+                f, p, rankings, pivots = friedman_test(np.vstack((valsScore, mv_scores)))
                 dict = {}
                 for i in range(0, len(rankings)):
                     dict[str(i)] = rankings[i]
                 comparisonsH, z, pH, adj_p = holm_test(dict, str(len(rankings) - 1))
-                comparisonsD, z_values, p_values, adj_p_values = bonferroni_dunn_test(dict, str(len(rankings) - 1))
                 for i in range(0, len(pH)):
-                    file.write(comparisonsD[i] + ',' + format_to_length(z[i], 2) + ',' + format_to_length(p_values[i], 2) + ',' + format_to_length(pH[i], 2) + '\n')
+                    file.write(comparisonsH[i] + ',' + format_to_length(z[i], 2) + ',' + format_to_length(pH[i], 2) + ',' + format_to_length(pH[i], 2) + '\n')
 
@@ -1,9 +1,8 @@
 # -*- coding: utf-8 -*-
 
 import numpy as np
-import scipy as sp
 import scipy.stats as st
-import itertools as it
+from functools import lru_cache
 
 
 def binomial_sign_test(*args):
@@ -49,6 +48,26 @@ def binomial_sign_test(*args):
     
         
 
+def _as_block(samples):
+    """
+        Arranges sample measurements of k groups into one block of shape (1, k, n).
+    """
+    k = len(samples)
+    if k < 2: raise ValueError('Less than 2 levels')
+    if len(set([len(v) for v in samples])) != 1: raise ValueError('Unequal number of samples')
+    return np.asarray(samples, dtype=float)[np.newaxis]
+
+
+def _as_blocks(blocks):
+    """
+        Converts blocks into array of shape (m, k, n), checks number of levels.
+    """
+    blocks = np.asarray(blocks, dtype=float)
+    if blocks.ndim != 3: raise ValueError('Blocks must be of shape (m, k, n)')
+    if blocks.shape[1] < 2: raise ValueError('Less than 2 levels')
+    return blocks
+
+
 def friedman_test(*args):
     """
         Performs a Friedman ranking test.
@@ -56,8 +75,8 @@ def friedman_test(*args):
         
         Parameters
         ----------
-        sample1, sample2, ... : array_like
-            The sample measurements for each group.
+        samples : array_like
+            The sample measurements for each group, either list of k samples or 2-D array of shape (k, n).
             
         Returns
         -------
@@ -75,23 +94,40 @@ def friedman_test(*args):
         M. Friedman, The use of ranks to avoid the assumption of normality implicit in the analysis of variance, Journal of the American Statistical Association 32 (1937) 674–701.
         D.J. Sheskin, Handbook of parametric and nonparametric statistical procedures. crc Press, 2003, Test 25: The Friedman Two-Way Analysis of Variance by Ranks
     """
-    args = args[0]
-    k = len(args)
-    if k < 2: raise ValueError('Less than 2 levels')
-    n = len(args[0])
-    if len(set([len(v) for v in args])) != 1: raise ValueError('Unequal number of samples')
+    iman_davenport, p_value, rankings_avg, rankings_cmp = friedman_test_batch(_as_block(args[0]))
+    return iman_davenport[0], p_value[0], list(rankings_avg[0]), list(rankings_cmp[0])
 
-    rankings = []
-    for i in range(n):
-        row = [col[i] for col in args]
-        row_sort = sorted(row)
-        rankings.append([row_sort.index(v) + 1 + (row_sort.count(v)-1)/2. for v in row])
 
-    rankings_avg = [sp.mean([case[j] for case in rankings]) for j in range(k)]
-    rankings_cmp = [r/sp.sqrt(k*(k+1)/(6.*n)) for r in rankings_avg]
+def friedman_test_batch(blocks):
+    """
+        Performs a Friedman ranking test for each of m blocks of k groups with n samples in one call.
+        
+        Parameters
+        ----------
+        blocks : array_like
+            The sample measurements of shape (m, k, n).
+            
+        Returns
+        -------
+        F-values : array_like
+            The computed F-values of shape (m,).
+        p-values : array_like
+            The associated p-values of shape (m,).
+        rankings : array_like
+            The rankings for each group of shape (m, k).
+        pivots : array_like
+            The pivotal quantities for each group of shape (m, k).
+    """
+    blocks = _as_blocks(blocks)
+    k, n = blocks.shape[1:]
+
+    rankings = st.rankdata(blocks, axis=1)
+
+    rankings_avg = rankings.mean(axis=2)
+    rankings_cmp = rankings_avg/np.sqrt(k*(k+1)/(6.*n))
 
-    chi2 = ((12*n)/float((k*(k+1))))*((sp.sum(r**2 for r in rankings_avg))-((k*(k+1)**2)/float(4)))
-    iman_davenport = ((n-1)*chi2)/float((n*(k-1)-chi2))
+    chi2 = ((12*n)/float((k*(k+1))))*(np.sum(rankings_avg**2, axis=1)-((k*(k+1)**2)/float(4)))
+    iman_davenport = ((n-1)*chi2)/(n*(k-1)-chi2)
 
     p_value = 1 - st.f.cdf(iman_davenport, k-1, (k-1)*(n-1))
 
@@ -108,7 +144,7 @@ def friedman_aligned_ranks_test(*args):
         Parameters
         ----------
         sample1, sample2, ... : array_like
-            The sample measurements for each group.
+            The sample measurements for each group, or single 2-D array of shape (k, n).
             
         Returns
         -------
@@ -125,32 +161,43 @@ def friedman_aligned_ranks_test(*args):
         ----------
          J.L. Hodges, E.L. Lehmann, Ranks methods for combination of independent experiments in analysis of variance, Annals of Mathematical Statistics 33 (1962) 482–497.
     """
-    k = len(args)
-    if k < 2: raise ValueError('Less than 2 levels')
-    n = len(args[0])
-    if len(set([len(v) for v in args])) != 1: raise ValueError('Unequal number of samples')
+    if len(args) == 1: args = args[0]
+    T, p_value, rankings_avg, rankings_cmp = friedman_aligned_ranks_test_batch(_as_block(args))
+    return T[0], p_value[0], list(rankings_avg[0]), list(rankings_cmp[0])
 
-    aligned_observations = []
-    for i in range(n):
-        loc = sp.mean([col[i] for col in args])
-        aligned_observations.extend([col[i] - loc for col in args])
+
+def friedman_aligned_ranks_test_batch(blocks):
+    """
+        Performs a Friedman aligned ranks ranking test for each of m blocks of k groups with n samples in one call.
         
-    aligned_observations_sort = sorted(aligned_observations)
-    
-    aligned_ranks = []
-    for i in range(n):
-        row = []
-        for j in range(k):
-            v = aligned_observations[i*k+j]
-            row.append(aligned_observations_sort.index(v) + 1 + (aligned_observations_sort.count(v)-1)/2.)
-        aligned_ranks.append(row)
+        Parameters
+        ----------
+        blocks : array_like
+            The sample measurements of shape (m, k, n).
+            
+        Returns
+        -------
+        Chi2-values : array_like
+            The computed Chi2-values of shape (m,).
+        p-values : array_like
+            The associated p-values of shape (m,).
+        rankings : array_like
+            The rankings for each group of shape (m, k).
+        pivots : array_like
+            The pivotal quantities for each group of shape (m, k).
+    """
+    blocks = _as_blocks(blocks)
+    m, k, n = blocks.shape
 
-    rankings_avg = [sp.mean([case[j] for case in aligned_ranks]) for j in range(k)]
-    rankings_cmp = [r/sp.sqrt(k*(n*k+1)/6.) for r in rankings_avg]
+    aligned_observations = blocks - blocks.mean(axis=1, keepdims=True)
+    aligned_ranks = st.rankdata(aligned_observations.reshape(m, k*n), axis=1).reshape(m, k, n)
 
-    r_i = [np.sum(case) for case in aligned_ranks]
-    r_j = [np.sum([case[j] for case in aligned_ranks]) for j in range(k)]
-    T = (k-1) * (sp.sum(v**2 for v in r_j) - (k*n**2/4.) * (k*n+1)**2) / float(((k*n*(k*n+1)*(2*k*n+1))/6.) - (1./float(k))*sp.sum(v**2 for v in r_i))
+    rankings_avg = aligned_ranks.mean(axis=2)
+    rankings_cmp = rankings_avg/np.sqrt(k*(n*k+1)/6.)
+
+    r_i = aligned_ranks.sum(axis=1)
+    r_j = aligned_ranks.sum(axis=2)
+    T = (k-1) * (np.sum(r_j**2, axis=1) - (k*n**2/4.) * (k*n+1)**2) / (((k*n*(k*n+1)*(2*k*n+1))/6.) - (1./float(k))*np.sum(r_i**2, axis=1))
 
     p_value = 1 - st.chi2.cdf(T, k-1)
 
@@ -167,7 +214,7 @@ def quade_test(*args):
         Parameters
         ----------
         sample1, sample2, ... : array_like
-            The sample measurements for each group.
+            The sample measurements for each group, or single 2-D array of shape (k, n).
             
         Returns
         -------
@@ -184,42 +231,276 @@ def quade_test(*args):
         ----------
         D. Quade, Using weighted rankings in the analysis of complete blocks with additive block effects, Journal of the American Statistical Association 74 (1979) 680–683.
     """
-    k = len(args)
-    if k < 2: raise ValueError('Less than 2 levels')
-    n = len(args[0])
-    if len(set([len(v) for v in args])) != 1: raise ValueError('Unequal number of samples')
+    if len(args) == 1: args = args[0]
+    F, p_value, rankings_avg, rankings_cmp = quade_test_batch(_as_block(args))
+    return F[0], p_value[0], list(rankings_avg[0]), list(rankings_cmp[0])
 
-    rankings = []
-    ranges = []
-    for i in range(n):
-        row = [col[i] for col in args]
-        ranges.append(max(row) - min(row))
-        row_sort = sorted(row)
-        rankings.append([row_sort.index(v) + 1 + (row_sort.count(v)-1)/2. for v in row])
-   
-    ranges_sort = sorted(ranges)
-    ranking_cases = [ranges_sort.index(v) + 1 + (ranges_sort.count(v)-1)/2. for v in ranges]
-
-    S = []
-    W = []
-    for i in range(n):
-        S.append([ranking_cases[i] * (r - (k + 1)/2.) for r in rankings[i]])
-        W.append([ranking_cases[i] * r for r in rankings[i]])
 
-    Sj = [np.sum(row[j] for row in S) for j in range(k)]
-    Wj = [np.sum(row[j] for row in W) for j in range(k)]
-    
-    rankings_avg = [w / (n*(n+1)/2.) for w in Wj]
-    rankings_cmp = [r/sp.sqrt(k*(k+1)*(2*n+1)*(k-1)/(18.*n*(n+1))) for r in rankings_avg]
+def quade_test_batch(blocks):
+    """
+        Performs a Quade ranking test for each of m blocks of k groups with n samples in one call.
+        
+        Parameters
+        ----------
+        blocks : array_like
+            The sample measurements of shape (m, k, n).
+            
+        Returns
+        -------
+        F-values : array_like
+            The computed F-values of shape (m,).
+        p-values : array_like
+            The associated p-values of shape (m,).
+        rankings : array_like
+            The rankings for each group of shape (m, k).
+        pivots : array_like
+            The pivotal quantities for each group of shape (m, k).
+    """
+    blocks = _as_blocks(blocks)
+    k, n = blocks.shape[1:]
 
-    A = sp.sum(S[i][j]**2 for i in range(n) for j in range(k))
-    B = sp.sum(s**2 for s in Sj)/float(n)
+    rankings = st.rankdata(blocks, axis=1)
+    ranges = blocks.max(axis=1) - blocks.min(axis=1)
+    ranking_cases = st.rankdata(ranges, axis=1)[:, np.newaxis, :]
+
+    S = ranking_cases * (rankings - (k + 1)/2.)
+    W = ranking_cases * rankings
+
+    Sj = S.sum(axis=2)
+    Wj = W.sum(axis=2)
+
+    rankings_avg = Wj / (n*(n+1)/2.)
+    rankings_cmp = rankings_avg/np.sqrt(k*(k+1)*(2*n+1)*(k-1)/(18.*n*(n+1)))
+
+    A = np.sum(S**2, axis=(1, 2))
+    B = np.sum(Sj**2, axis=1)/float(n)
     F = (n-1)*B/(A-B)
 
     p_value = 1 - st.f.cdf(F, k-1, (k-1)*(n-1))
 
     return F, p_value, rankings_avg, rankings_cmp
 
+
+def _bonferroni_dunn_adjustment(p_values):
+    """
+        Bonferroni-Dunn (and Nemenyi) adjustment of p-values sorted along the last axis.
+    """
+    m = p_values.shape[-1]
+    return np.minimum(m*p_values, 1)
+
+
+def _holm_adjustment(p_values):
+    """
+        Holm adjustment of p-values sorted along the last axis.
+    """
+    m = p_values.shape[-1]
+    return np.minimum(np.maximum.accumulate((m-np.arange(m))*p_values, axis=-1), 1)
+
+
+def _hochberg_adjustment(p_values):
+    """
+        Hochberg adjustment of p-values sorted along the last axis.
+    """
+    m = p_values.shape[-1]
+    weighted = (m-np.arange(m))*p_values
+    return np.minimum(np.maximum.accumulate(weighted[..., ::-1], axis=-1)[..., ::-1], 1)
+
+
+def _li_adjustment(p_values):
+    """
+        Li adjustment of p-values sorted along the last axis.
+    """
+    return p_values/(p_values+1-p_values[..., -1:])
+
+
+def _finner_adjustment(p_values):
+    """
+        Finner adjustment of p-values sorted along the last axis.
+    """
+    m = p_values.shape[-1]
+    return np.minimum(np.maximum.accumulate(1-(1-p_values)**(m/(np.arange(m)+1.)), axis=-1), 1)
+
+
+@lru_cache(maxsize=None)
+def _S(k):
+    """
+        Helper function for the Shaffer test.
+        It obtains the number of independent test hypotheses when using an All vs All strategy using the number of groups to be compared.
+        Results are memoized, so every k is enumerated only once.
+    """
+    if k == 0 or k == 1:
+        return (0,)
+    result = set()
+    for j in range(1, k+1):
+        result.update(j*(j-1)//2 + s for s in _S(k - j))
+    return tuple(sorted(result))
+
+
+@lru_cache(maxsize=None)
+def _shaffer_weights(k):
+    """
+        Weights of Shaffer's static procedure for k groups, i-th hypothesis ordered by p-value is weighted by the maximal number of hypotheses which can be true given that the previous ones are false.
+    """
+    m = k*(k-1)//2
+    A = np.asarray(_S(k))
+    weights = A[np.searchsorted(A, m - np.arange(m), side='right') - 1]
+    weights.flags.writeable = False
+    return weights
+
+
+def _shaffer_adjustment(p_values):
+    """
+        Shaffer static adjustment of p-values of all pairwise comparisons sorted along the last axis.
+    """
+    m = p_values.shape[-1]
+    k = int(round((1 + np.sqrt(1 + 8*m))/2))
+    return np.minimum(np.maximum.accumulate(_shaffer_weights(k)*p_values, axis=-1), 1)
+
+
+CONTROL_ADJUSTMENTS = {'bonferroni_dunn': _bonferroni_dunn_adjustment,
+                       'holm': _holm_adjustment,
+                       'hochberg': _hochberg_adjustment,
+                       'li': _li_adjustment,
+                       'finner': _finner_adjustment}
+MULTITEST_ADJUSTMENTS = {'nemenyi': _bonferroni_dunn_adjustment,
+                         'holm': _holm_adjustment,
+                         'hochberg': _hochberg_adjustment,
+                         'finner': _finner_adjustment,
+                         'shaffer': _shaffer_adjustment}
+
+
+def _control_comparisons(pivots, controls, methods):
+    """
+        Compares given controls with all other groups, comparisons of each control are sorted by p-value.
+        Returns indices of compared groups, z-values, p-values and dictionary of adjusted p-values, each of shape (number of controls, k-1).
+    """
+    pivots = np.asarray(pivots, dtype=float)
+    k = len(pivots)
+    if k < 2: raise ValueError('Less than 2 levels')
+    controls = np.asarray(controls)
+    z_values = np.abs(pivots[controls, np.newaxis] - pivots[np.newaxis, :])
+    p_values = 2*(1-st.norm.cdf(z_values))
+    # The control itself goes behind all comparisons and is cut off
+    p_values[np.arange(len(controls)), controls] = np.inf
+    groups = np.argsort(p_values, axis=1, kind='stable')[:, :k-1]
+    z_values = np.take_along_axis(z_values, groups, axis=1)
+    p_values = np.take_along_axis(p_values, groups, axis=1)
+    adj_p_values = {method: CONTROL_ADJUSTMENTS[method](p_values) for method in methods}
+    return groups, z_values, p_values, adj_p_values
+
+
+def _pairwise_comparisons(pivots, methods):
+    """
+        Compares each pair of groups, comparisons are sorted by p-value.
+        Returns pairs of compared groups, z-values, p-values and dictionary of adjusted p-values, each of length k*(k-1)/2.
+    """
+    pivots = np.asarray(pivots, dtype=float)
+    k = len(pivots)
+    if k < 2: raise ValueError('Less than 2 levels')
+    first, second = np.triu_indices(k, 1)
+    z_values = np.abs(pivots[first] - pivots[second])
+    p_values = 2*(1-st.norm.cdf(z_values))
+    order = np.argsort(p_values, kind='stable')
+    p_values = p_values[order]
+    adj_p_values = {method: MULTITEST_ADJUSTMENTS[method](p_values) for method in methods}
+    return (first[order], second[order]), z_values[order], p_values, adj_p_values
+
+
+def control_post_hoc_tests(pivots, methods=tuple(CONTROL_ADJUSTMENTS)):
+    """
+        Performs post-hoc tests of each group as the control method against all other methods in one pass.
+        
+        Parameters
+        ----------
+        pivots : array_like
+            The pivotal quantities of k groups obtained by a ranking test.
+        methods : array_like optional
+            Names of adjustments from CONTROL_ADJUSTMENTS, default all of them
+            
+        Returns
+        ----------
+        Z-values : array-like
+            Matrix of shape (k, k), element [c, j] is the Z-value of comparison of control c with group j, diagonal is nan.
+        p-values : array-like
+            Matrix of shape (k, k) of unadjusted p-values.
+        Adjusted p-values : dictionary_like
+            A dictionary with format 'method':matrix of shape (k, k) of adjusted p-values.
+    """
+    k = len(pivots)
+    controls = np.arange(k)
+    groups, z_values, p_values, adj_p_values = _control_comparisons(pivots, controls, methods)
+    rows = controls[:, np.newaxis]
+
+    def scatter(values):
+        matrix = np.full((k, k), np.nan)
+        matrix[rows, groups] = values
+        return matrix
+
+    return scatter(z_values), scatter(p_values), {method: scatter(values) for method, values in adj_p_values.items()}
+
+
+def multiple_post_hoc_tests(pivots, methods=tuple(MULTITEST_ADJUSTMENTS)):
+    """
+        Performs post-hoc tests of each pair of groups in one pass.
+        
+        Parameters
+        ----------
+        pivots : array_like
+            The pivotal quantities of k groups obtained by a ranking test.
+        methods : array_like optional
+            Names of adjustments from MULTITEST_ADJUSTMENTS, default all of them
+            
+        Returns
+        ----------
+        Z-values : array-like
+            Symmetric matrix of shape (k, k) of Z-values of comparisons, diagonal is nan.
+        p-values : array-like
+            Symmetric matrix of shape (k, k) of unadjusted p-values.
+        Adjusted p-values : dictionary_like
+            A dictionary with format 'method':symmetric matrix of shape (k, k) of adjusted p-values.
+    """
+    k = len(pivots)
+    (first, second), z_values, p_values, adj_p_values = _pairwise_comparisons(pivots, methods)
+
+    def scatter(values):
+        matrix = np.full((k, k), np.nan)
+        matrix[first, second] = values
+        matrix[second, first] = values
+        return matrix
+
+    return scatter(z_values), scatter(p_values), {method: scatter(values) for method, values in adj_p_values.items()}
+
+
+def _control_test(ranks, control, method):
+    """
+        Performs a post-hoc test of the control method against all other methods given by dictionary of pivots.
+    """
+    values = list(ranks.values())
+    keys = list(ranks.keys())
+    if not control :
+        control_i = values.index(min(values))
+    else:
+        control_i = keys.index(control)
+
+    groups, z_values, p_values, adj_p_values = _control_comparisons(values, [control_i], [method])
+    comparisons = [keys[control_i] + " vs " + keys[i] for i in groups[0]]
+
+    return comparisons, z_values[0].tolist(), p_values[0].tolist(), adj_p_values[method][0].tolist()
+
+
+def _multitest(ranks, method):
+    """
+        Performs a post-hoc test of each pair of methods given by dictionary of pivots.
+    """
+    values = list(ranks.values())
+    keys = list(ranks.keys())
+
+    (first, second), z_values, p_values, adj_p_values = _pairwise_comparisons(values, [method])
+    comparisons = [keys[i] + " vs " + keys[j] for i, j in zip(first, second)]
+
+    return comparisons, z_values.tolist(), p_values.tolist(), adj_p_values[method].tolist()
+
+
 def bonferroni_dunn_test(ranks, control=None):
     """
         Performs a Bonferroni-Dunn post-hoc test using the pivot quantities obtained by a ranking test.
@@ -247,24 +528,9 @@ def bonferroni_dunn_test(ranks, control=None):
         ----------
         O.J. Dunn, Multiple comparisons among means, Journal of the American Statistical Association 56 (1961) 52–64.
     """
-    k = len(ranks)
-    values = list(ranks.values())
-    keys = list(ranks.keys())
-    if not control :
-        control_i = values.index(min(values))
-    else:
-        control_i = keys.index(control)
+    return _control_test(ranks, control, 'bonferroni_dunn')
+
 
-    comparisons = [keys[control_i] + " vs " + keys[i] for i in range(k) if i != control_i]
-    z_values = [abs(values[control_i] - values[i]) for i in range(k) if i != control_i]
-    p_values = [2*(1-st.norm.cdf(abs(z))) for z in z_values]
-    # Sort values by p_value so that p_0 < p_1
-    p_values, z_values, comparisons = map(list, zip(*sorted(zip(p_values, z_values, comparisons), key=lambda t: t[0])))
-    adj_p_values = [min((k-1)*p_value,1) for p_value in p_values]
-    
-    return comparisons, z_values, p_values, adj_p_values
-    
-    
 def holm_test(ranks, control=None):
     """
         Performs a Holm post-hoc test using the pivot quantities obtained by a ranking test.
@@ -292,24 +558,9 @@ def holm_test(ranks, control=None):
         ----------
         O.J. S. Holm, A simple sequentially rejective multiple test procedure, Scandinavian Journal of Statistics 6 (1979) 65–70.
     """
-    k = len(ranks)
-    values = list(ranks.values())
-    keys = list(ranks.keys())
-    if not control :
-        control_i = values.index(min(values))
-    else:
-        control_i = keys.index(control)
+    return _control_test(ranks, control, 'holm')
+
 
-    comparisons = [keys[control_i] + " vs " + keys[i] for i in range(k) if i != control_i]
-    z_values = [abs(values[control_i] - values[i]) for i in range(k) if i != control_i]
-    p_values = [2*(1-st.norm.cdf(abs(z))) for z in z_values]
-    # Sort values by p_value so that p_0 < p_1
-    p_values, z_values, comparisons = map(list, zip(*sorted(zip(p_values, z_values, comparisons), key=lambda t: t[0])))
-    adj_p_values = [min(max((k-(j+1))*p_values[j] for j in range(i+1)), 1) for i in range(k-1)]
-    
-    return comparisons, z_values, p_values, adj_p_values
-    
-    
 def hochberg_test(ranks, control=None):
     """
         Performs a Hochberg post-hoc test using the pivot quantities obtained by a ranking test.
@@ -337,22 +588,8 @@ def hochberg_test(ranks, control=None):
         ----------
         Y. Hochberg, A sharper Bonferroni procedure for multiple tests of significance, Biometrika 75 (1988) 800–803.
     """
-    k = len(ranks)
-    values = ranks.values()
-    keys = ranks.keys()
-    if not control :
-        control_i = values.index(min(values))
-    else:
-        control_i = keys.index(control)
+    return _control_test(ranks, control, 'hochberg')
 
-    comparisons = [keys[control_i] + " vs " + keys[i] for i in range(k) if i != control_i]
-    z_values = [abs(values[control_i] - values[i]) for i in range(k) if i != control_i]
-    p_values = [2*(1-st.norm.cdf(abs(z))) for z in z_values]
-    # Sort values by p_value so that p_0 < p_1
-    p_values, z_values, comparisons = map(list, zip(*sorted(zip(p_values, z_values, comparisons), key=lambda t: t[0])))
-    adj_p_values = [min(max((k-j)*p_values[j-1] for j in range(k-1, i, -1)), 1) for i in range(k-1)]
-    
-    return comparisons, z_values, p_values, adj_p_values
 
 def li_test(ranks, control=None):
     """
@@ -381,22 +618,8 @@ def li_test(ranks, control=None):
         ----------
         J. Li, A two-step rejection procedure for testing multiple hypotheses, Journal of Statistical Planning and Inference 138 (2008) 1521–1527.
     """
-    k = len(ranks)
-    values = ranks.values()
-    keys = ranks.keys()
-    if not control :
-        control_i = values.index(min(values))
-    else:
-        control_i = keys.index(control)
+    return _control_test(ranks, control, 'li')
 
-    comparisons = [keys[control_i] + " vs " + keys[i] for i in range(k) if i != control_i]
-    z_values = [abs(values[control_i] - values[i]) for i in range(k) if i != control_i]
-    p_values = [2*(1-st.norm.cdf(abs(z))) for z in z_values]
-    # Sort values by p_value so that p_0 < p_1
-    p_values, z_values, comparisons = map(list, zip(*sorted(zip(p_values, z_values, comparisons), key=lambda t: t[0])))
-    adj_p_values = [p_values[i]/(p_values[i]+1-p_values[-1]) for i in range(k-1)]
-    
-    return comparisons, z_values, p_values, adj_p_values
 
 def finner_test(ranks, control=None):
     """
@@ -425,22 +648,7 @@ def finner_test(ranks, control=None):
         ----------
         H. Finner, On a monotonicity problem in step-down multiple test procedures, Journal of the American Statistical Association 88 (1993) 920–923.
     """
-    k = len(ranks)
-    values = ranks.values()
-    keys = ranks.keys()
-    if not control :
-        control_i = values.index(min(values))
-    else:
-        control_i = keys.index(control)
-
-    comparisons = [keys[control_i] + " vs " + keys[i] for i in range(k) if i != control_i]
-    z_values = [abs(values[control_i] - values[i]) for i in range(k) if i != control_i]
-    p_values = [2*(1-st.norm.cdf(abs(z))) for z in z_values]
-    # Sort values by p_value so that p_0 < p_1
-    p_values, z_values, comparisons = map(list, zip(*sorted(zip(p_values, z_values, comparisons), key=lambda t: t[0])))
-    adj_p_values = [min(max(1-(1-p_values[j])**((k-1)/float(j+1)) for j in range(i+1)), 1) for i in range(k-1)]
-    
-    return comparisons, z_values, p_values, adj_p_values
+    return _control_test(ranks, control, 'finner')
 
 
 def nemenyi_multitest(ranks):
@@ -468,20 +676,7 @@ def nemenyi_multitest(ranks):
         ----------
         Bonferroni-Dunn: O.J. Dunn, Multiple comparisons among means, Journal of the American Statistical Association 56 (1961) 52–64.
     """
-    k = len(ranks)
-    values = ranks.values()
-    keys = ranks.keys()
-    versus = list(it.combinations(range(k), 2))
-
-    comparisons = [keys[vs[0]] + " vs " + keys[vs[1]] for vs in versus]
-    z_values = [abs(values[vs[0]] - values[vs[1]]) for vs in versus]
-    p_values = [2*(1-st.norm.cdf(abs(z))) for z in z_values]
-    # Sort values by p_value so that p_0 < p_1
-    p_values, z_values, comparisons = map(list, zip(*sorted(zip(p_values, z_values, comparisons), key=lambda t: t[0])))
-    m = int(k*(k-1)/2.)
-    adj_p_values = [min(m*p_value,1) for p_value in p_values]
-    
-    return comparisons, z_values, p_values, adj_p_values
+    return _multitest(ranks, 'nemenyi')
 
 
 def holm_multitest(ranks):
@@ -509,20 +704,7 @@ def holm_multitest(ranks):
         ----------
         O.J. S. Holm, A simple sequentially rejective multiple test procedure, Scandinavian Journal of Statistics 6 (1979) 65–70.
     """
-    k = len(ranks)
-    values = ranks.values()
-    keys = ranks.keys()
-    versus = list(it.combinations(range(k), 2))
-
-    comparisons = [keys[vs[0]] + " vs " + keys[vs[1]] for vs in versus]
-    z_values = [abs(values[vs[0]] - values[vs[1]]) for vs in versus]
-    p_values = [2*(1-st.norm.cdf(abs(z))) for z in z_values]
-    # Sort values by p_value so that p_0 < p_1
-    p_values, z_values, comparisons = map(list, zip(*sorted(zip(p_values, z_values, comparisons), key=lambda t: t[0])))
-    m = int(k*(k-1)/2.)
-    adj_p_values = [min(max((m-j)*p_values[j] for j in range(i+1)), 1) for i in range(m)]
-    
-    return comparisons, z_values, p_values, adj_p_values
+    return _multitest(ranks, 'holm')
 
 
 def hochberg_multitest(ranks):
@@ -550,21 +732,8 @@ def hochberg_multitest(ranks):
         ----------
         Y. Hochberg, A sharper Bonferroni procedure for multiple tests of significance, Biometrika 75 (1988) 800–803.
     """
-    k = len(ranks)
-    values = ranks.values()
-    keys = ranks.keys()
-    versus = list(it.combinations(range(k), 2))
-
-    comparisons = [keys[vs[0]] + " vs " + keys[vs[1]] for vs in versus]
-    z_values = [abs(values[vs[0]] - values[vs[1]]) for vs in versus]
-    p_values = [2*(1-st.norm.cdf(abs(z))) for z in z_values]
-    # Sort values by p_value so that p_0 < p_1
-    p_values, z_values, comparisons = map(list, zip(*sorted(zip(p_values, z_values, comparisons), key=lambda t: t[0])))
-    m = int(k*(k-1)/2.)
-    adj_p_values = [max((m+1-j)*p_values[j-1] for j in range(m, i, -1))for i in range(m)]
-    
-    return comparisons, z_values, p_values, adj_p_values
-    
+    return _multitest(ranks, 'hochberg')
+
 
 def finner_multitest(ranks):
     """
@@ -591,36 +760,7 @@ def finner_multitest(ranks):
         ----------
         H. Finner, On a monotonicity problem in step-down multiple test procedures, Journal of the American Statistical Association 88 (1993) 920–923.
     """
-    k = len(ranks)
-    values = ranks.values()
-    keys = ranks.keys()
-    versus = list(it.combinations(range(k), 2))
-
-    comparisons = [keys[vs[0]] + " vs " + keys[vs[1]] for vs in versus]
-    z_values = [abs(values[vs[0]] - values[vs[1]]) for vs in versus]
-    p_values = [2*(1-st.norm.cdf(abs(z))) for z in z_values]
-    # Sort values by p_value so that p_0 < p_1
-    p_values, z_values, comparisons = map(list, zip(*sorted(zip(p_values, z_values, comparisons), key=lambda t: t[0])))
-    m = int(k*(k-1)/2.)
-    adj_p_values = [min(max(1-(1-p_values[j])**(m/float(j+1)) for j in range(i+1)), 1) for i in range(m)]
-    
-    return comparisons, z_values, p_values, adj_p_values
-
-
-def _S(k):
-    """
-        Helper function for the Shaffer test.
-        It obtains the number of independent test hypotheses when using an All vs All strategy using the number of groups to be compared.
-    """
-    if k == 0 or k == 1:
-        return {0}
-    else:
-        result = set()
-        for j in reversed(range(1, k+1)):
-            tmp = S(k - j)
-            for s in tmp:
-                result = result.union({sp.special.binom(j, 2) + s})
-        return list(result)
+    return _multitest(ranks, 'finner')
 
 
 def shaffer_multitest(ranks):
@@ -648,21 +788,4 @@ def shaffer_multitest(ranks):
         ----------
         J. Li, A two-step rejection procedure for testing multiple hypotheses, Journal of Statistical Planning and Inference 138 (2008) 1521–1527.
     """
-    k = len(ranks)
-    values = ranks.values()
-    keys = ranks.keys()
-    versus = list(it.combinations(range(k), 2))
-    
-    m = int(k*(k-1)/2.)
-    A = _S(int((1 + sp.sqrt(1+4*m*2))/2))
-    t = [max([a for a in A if a <= m-i]) for i in range(m)]
-
-    comparisons = [keys[vs[0]] + " vs " + keys[vs[1]] for vs in versus]
-    z_values = [abs(values[vs[0]] - values[vs[1]]) for vs in versus]
-    p_values = [2*(1-st.norm.cdf(abs(z))) for z in z_values]
-    # Sort values by p_value so that p_0 < p_1
-    p_values, z_values, comparisons = map(list, zip(*sorted(zip(p_values, z_values, comparisons), key=lambda t: t[0])))
-    adj_p_values = [min(max(t[j]*p_values[j] for j in range(i+1)), 1) for i in range(m)]
-    
-    return comparisons, z_values, p_values, adj_p_values
-
+    return _multitest(ranks, 'shaffer')
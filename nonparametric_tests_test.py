@@ -0,0 +1,223 @@
+import time
+import unittest
+
+import numpy as np
+
+import nonparametric_tests
+
+
+class NonparametricTestsTest(unittest.TestCase):
+    SAMPLES = [[.13, .5, .6, .03, .15, .93], [.07, .13, .95, .62, .37, .51], [.66, .28, .14, .79, .67, .51],
+               [.82, .55, .98, .2, .55, .48]]
+    TIED_SAMPLES = [[3., 1., 3., 2., 2., 0.], [2., 3., 3., 3., 3., 0.], [3., 1., 2., 1., 0., 0.],
+                    [3., 3., 1., 1., 0., 0.]]
+    # results of previous implementation for SAMPLES and TIED_SAMPLES
+    EXPECTED_RANKING_TESTS = {
+        'friedman_test': [
+            [0.6782334384858034, 0.5788127263909518, [2.1666666666666665, 2.0833333333333335, 2.75, 3.0],
+             [2.9068883707497264, 2.7950849718747373, 3.689512162874653, 4.024922359499621]],
+            [0.9016393442622909, 0.46340872037872594, [2.75, 3.0833333333333335, 2.0, 2.1666666666666665],
+             [3.689512162874653, 4.136725758374611, 2.6832815729997477, 2.9068883707497264]]],
+        'friedman_aligned_ranks_test': [
+            [1.401048492791612, 0.7052889770598965, [10.0, 11.416666666666666, 13.583333333333334, 15.0],
+             [2.449489742783178, 2.796500789677461, 3.3272235672804835, 3.674234614174767]],
+            [5.145116994397451, 0.16147419509989958, [14.166666666666666, 17.666666666666668, 8.25, 9.916666666666666],
+             [3.4701104689428353, 4.327431878916948, 2.0208290377961218, 2.4290773282599845]]],
+        'quade_test': [
+            [0.7903706859821048, 0.5179277427950196,
+             [1.8571428571428572, 2.3333333333333335, 2.7142857142857144, 3.0952380952380953],
+             [1.828348200660132, 2.2971554315986276, 2.6722012163494235, 3.04724700110022]],
+            [2.5894039735099343, 0.09143178070495939,
+             [2.7857142857142856, 3.4523809523809526, 1.7857142857142858, 1.9761904761904763],
+             [2.742522300990198, 3.3988524243040916, 1.7580271160193577, 1.945550008394756]]]}
+    RANKS = {'0': 2.5, '1': 1.25, '2': 3.75, '3': 2.5, '4': 5.}
+    # results of previous implementation for RANKS with best group and 3 as control
+    EXPECTED_CONTROL_COMPARISONS = {
+        None: [['1 vs 4', '1 vs 2', '1 vs 0', '1 vs 3'], [3.75, 2.5, 1.25, 1.25],
+               [0.00017683457040162942, 0.012419330651552318, 0.2112995473337107, 0.2112995473337107]],
+        '3': [['3 vs 4', '3 vs 1', '3 vs 2', '3 vs 0'], [2.5, 1.25, 1.25, 0.],
+              [0.012419330651552318, 0.2112995473337107, 0.2112995473337107, 1.]]}
+    EXPECTED_CONTROL_ADJUSTED_P_VALUES = {
+        None: {'bonferroni_dunn_test': [0.0007073382816065177, 0.04967732260620927, 0.8451981893348428,
+                                        0.8451981893348428],
+               'holm_test': [0.0007073382816065177, 0.037257991954656955, 0.4225990946674214, 0.4225990946674214],
+               'hochberg_test': [0.4225990946674214, 0.4225990946674214, 0.4225990946674214, 0.2112995473337107],
+               'li_test': [0.00022415979425780176, 0.015502464063635524, 0.2112995473337107, 0.2112995473337107],
+               'finner_test': [0.0007071506809326333, 0.024684421529272083, 0.2712988524512464,
+                               0.2712988524512464]},
+        '3': {'bonferroni_dunn_test': [0.04967732260620927, 0.8451981893348428, 0.8451981893348428, 1.],
+              'holm_test': [0.04967732260620927, 0.6338986420011321, 0.6338986420011321, 1.],
+              'hochberg_test': [1., 1., 1., 1.],
+              'li_test': [1., 1., 1., 1.],
+              'finner_test': [0.048759522392309296, 0.3779515959639903, 0.3779515959639903, 1.]}}
+    # results of previous implementation for RANKS, Hochberg adjusted p-values limited to 1
+    EXPECTED_MULTITEST_COMPARISONS = [
+        ['1 vs 4', '0 vs 4', '1 vs 2', '3 vs 4', '0 vs 1', '0 vs 2', '1 vs 3', '2 vs 3', '2 vs 4', '0 vs 3'],
+        [3.75, 2.5, 2.5, 2.5, 1.25, 1.25, 1.25, 1.25, 1.25, 0.],
+        [0.00017683457040162942, 0.012419330651552318, 0.012419330651552318, 0.012419330651552318,
+         0.2112995473337107, 0.2112995473337107, 0.2112995473337107, 0.2112995473337107, 0.2112995473337107, 1.]]
+    EXPECTED_MULTITEST_ADJUSTED_P_VALUES = {
+        'nemenyi_multitest': [0.0017683457040162942, 0.12419330651552318, 0.12419330651552318, 0.12419330651552318,
+                              1., 1., 1., 1., 1., 1.],
+        'holm_multitest': [0.0017683457040162942, 0.11177397586397086, 0.11177397586397086, 0.11177397586397086,
+                           1., 1., 1., 1., 1., 1.],
+        'hochberg_multitest': [1., 1., 1., 1., 1., 1., 1., 1., 1., 1.],
+        'finner_multitest': [0.0017669391964368897, 0.0605732924128598, 0.0605732924128598, 0.0605732924128598,
+                             0.3779515959639903, 0.3779515959639903, 0.3779515959639903, 0.3779515959639903,
+                             0.3779515959639903, 1.],
+        'shaffer_multitest': [0.0017683457040162942, 0.07451598390931391, 0.07451598390931391, 0.07451598390931391,
+                              1., 1., 1., 1., 1., 1.]}
+    SHAFFER_RANKS = {'0': 3.1, '1': 1.4, '2': 5.2, '3': 2.6, '4': 6.5, '5': 4., '6': 4.7}
+    # results of previous implementation for SHAFFER_RANKS
+    EXPECTED_SHAFFER_COMPARISONS = ['1 vs 4', '3 vs 4', '1 vs 2', '0 vs 4', '1 vs 6', '1 vs 5', '2 vs 3', '4 vs 5',
+                                    '0 vs 2', '3 vs 6', '4 vs 6', '0 vs 1', '0 vs 6', '3 vs 5', '2 vs 4', '1 vs 3',
+                                    '2 vs 5', '0 vs 5', '5 vs 6', '0 vs 3', '2 vs 6']
+    EXPECTED_SHAFFER_ADJUSTED_P_VALUES = [7.132723108149719e-06, 0.00144289032052769, 0.0021704413177525694,
+                                          0.010107877970305656, 0.014502724271513445, 0.13983564071156196,
+                                          0.13983564071156196, 0.13983564071156196, 0.3930172523819644,
+                                          0.3930172523819644, 0.7904670204843669, 0.8913092551708601,
+                                          0.9863872505920439, 1., 1., 1., 1., 1., 1., 1., 1.]
+
+    def assert_results_equal(self, expected, result):
+        self.assertEqual(len(expected), len(result))
+        for expected_value, value in zip(expected, result):
+            np.testing.assert_allclose(expected_value, value, rtol = 1e-12, atol = 1e-12)
+
+    def test_should_friedman_test_same_as_previous_implementation(self):
+        for samples, expected in zip([self.SAMPLES, self.TIED_SAMPLES], self.EXPECTED_RANKING_TESTS['friedman_test']):
+            # when
+            result = nonparametric_tests.friedman_test(samples)
+            # then
+            self.assert_results_equal(expected, result)
+            self.assert_results_equal(result, nonparametric_tests.friedman_test(np.array(samples)))
+
+    def test_should_friedman_aligned_ranks_test_same_as_previous_implementation(self):
+        for samples, expected in zip([self.SAMPLES, self.TIED_SAMPLES],
+                                     self.EXPECTED_RANKING_TESTS['friedman_aligned_ranks_test']):
+            # when
+            result = nonparametric_tests.friedman_aligned_ranks_test(*samples)
+            # then
+            self.assert_results_equal(expected, result)
+            self.assert_results_equal(result, nonparametric_tests.friedman_aligned_ranks_test(np.array(samples)))
+
+    def test_should_quade_test_same_as_previous_implementation(self):
+        for samples, expected in zip([self.SAMPLES, self.TIED_SAMPLES], self.EXPECTED_RANKING_TESTS['quade_test']):
+            # when
+            result = nonparametric_tests.quade_test(*samples)
+            # then
+            self.assert_results_equal(expected, result)
+            self.assert_results_equal(result, nonparametric_tests.quade_test(np.array(samples)))
+
+    def test_should_batch_tests_same_as_single_tests(self):
+        # given
+        blocks = np.random.default_rng(4).random((6, 4, 12))
+        tests = [(nonparametric_tests.friedman_test_batch, lambda block: nonparametric_tests.friedman_test(block)),
+                 (nonparametric_tests.friedman_aligned_ranks_test_batch, nonparametric_tests.friedman_aligned_ranks_test),
+                 (nonparametric_tests.quade_test_batch, nonparametric_tests.quade_test)]
+        for batch_test, single_test in tests:
+            # when
+            results = batch_test(blocks)
+            # then
+            for i in range(len(blocks)):
+                self.assert_results_equal(single_test(blocks[i]), [result[i] for result in results])
+
+    def prepare_ranks(self, rng, with_ties: bool):
+        k = rng.integers(2, 10)
+        values = rng.integers(0, 3, k) / 2. if with_ties else rng.random(k) * 3
+        return {str(i): value for i, value in enumerate(values)}
+
+    def test_should_control_tests_same_as_previous_implementation(self):
+        for control, (expected_comparisons, expected_z_values, expected_p_values) in \
+                self.EXPECTED_CONTROL_COMPARISONS.items():
+            for name, expected_adj_p_values in self.EXPECTED_CONTROL_ADJUSTED_P_VALUES[control].items():
+                # when
+                comparisons, z_values, p_values, adj_p_values = getattr(nonparametric_tests, name)(self.RANKS, control)
+                # then
+                self.assertEqual(expected_comparisons, comparisons)
+                self.assert_results_equal([expected_z_values, expected_p_values, expected_adj_p_values],
+                                          [z_values, p_values, adj_p_values])
+
+    def test_should_multitests_same_as_previous_implementation(self):
+        expected_comparisons, expected_z_values, expected_p_values = self.EXPECTED_MULTITEST_COMPARISONS
+        for name, expected_adj_p_values in self.EXPECTED_MULTITEST_ADJUSTED_P_VALUES.items():
+            # when
+            comparisons, z_values, p_values, adj_p_values = getattr(nonparametric_tests, name)(self.RANKS)
+            # then
+            self.assertEqual(expected_comparisons, comparisons)
+            self.assert_results_equal([expected_z_values, expected_p_values, expected_adj_p_values],
+                                      [z_values, p_values, adj_p_values])
+
+    def test_should_test_every_control_in_one_call(self):
+        # given
+        ranks = self.prepare_ranks(np.random.default_rng(7), with_ties = False)
+        tests = {'bonferroni_dunn': nonparametric_tests.bonferroni_dunn_test, 'holm': nonparametric_tests.holm_test,
+                 'hochberg': nonparametric_tests.hochberg_test, 'li': nonparametric_tests.li_test,
+                 'finner': nonparametric_tests.finner_test}
+        # when
+        z_values, p_values, adj_p_values = nonparametric_tests.control_post_hoc_tests(list(ranks.values()))
+        # then
+        for control in range(len(ranks)):
+            self.assertTrue(np.isnan(p_values[control, control]))
+            for method, test in tests.items():
+                comparisons, z, p, adj_p = test(ranks, str(control))
+                groups = [int(comparison.split(' vs ')[1]) for comparison in comparisons]
+                self.assert_results_equal([z, p, adj_p], [z_values[control, groups], p_values[control, groups],
+                                                          adj_p_values[method][control, groups]])
+
+    def test_should_test_every_pair_in_one_call(self):
+        # given
+        ranks = self.prepare_ranks(np.random.default_rng(8), with_ties = True)
+        tests = {'nemenyi': nonparametric_tests.nemenyi_multitest, 'holm': nonparametric_tests.holm_multitest,
+                 'hochberg': nonparametric_tests.hochberg_multitest, 'finner': nonparametric_tests.finner_multitest}
+        # when
+        z_values, p_values, adj_p_values = nonparametric_tests.multiple_post_hoc_tests(list(ranks.values()))
+        # then
+        for method, test in tests.items():
+            comparisons, z, p, adj_p = test(ranks)
+            first, second = zip(*[map(int, comparison.split(' vs ')) for comparison in comparisons])
+            self.assert_results_equal([z, p, adj_p], [z_values[second, first], p_values[first, second],
+                                                      adj_p_values[method][second, first]])
+
+    def test_should_shaffer_multitest_same_as_previous_implementation(self):
+        # given
+        ranks = self.SHAFFER_RANKS
+        # when
+        comparisons, z_values, p_values, adj_p_values = nonparametric_tests.shaffer_multitest(ranks)
+        # then
+        self.assertEqual(self.EXPECTED_SHAFFER_COMPARISONS, comparisons)
+        self.assert_results_equal([self.EXPECTED_SHAFFER_ADJUSTED_P_VALUES], [adj_p_values])
+
+    def test_should_enumerate_numbers_of_true_hypotheses(self):
+        # given
+        k = 4
+        # when
+        result = nonparametric_tests._S(k)
+        # then
+        self.assertEqual((0, 1, 2, 3, 6), result)
+        self.assertEqual((0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 15, 16, 18, 21, 22, 28, 36),
+                         nonparametric_tests._S(9))
+
+    def test_should_shaffer_multitest_many_groups_quickly(self):
+        # given
+        ranks = {str(i): value for i, value in enumerate(np.random.default_rng(10).random(40) * 3)}
+        start = time.perf_counter()
+        # when
+        comparisons, z_values, p_values, adj_p_values = nonparametric_tests.shaffer_multitest(ranks)
+        # then
+        self.assertLess(time.perf_counter() - start, 1)
+        self.assertEqual(40 * 39 // 2, len(adj_p_values))
+        self.assertTrue(np.all(np.diff(adj_p_values) >= 0))
+
+    def test_should_raise_error_for_less_than_two_levels(self):
+        # given
+        samples = [[1., 2., 3.]]
+        # when
+        # then
+        with self.assertRaises(ValueError):
+            nonparametric_tests.friedman_test(samples)
+        with self.assertRaises(ValueError):
+            nonparametric_tests.friedman_test_batch(np.ones((3, 1, 5)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+
+import itertools as it
+import math
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import scipy.stats as st
+
+from nonparametric_tests import friedman_test
+
+NUMBER_OF_RESAMPLES = 9999
+PERMUTATIONS_PRO_CHUNK = 1000
+SEED = 0
+
+
+def _count_permutations(count_function, data, observed, number_of_permutations: int, exact: bool, seed,
+                        number_of_workers: int):
+    """
+        Splits permutations into chunks and counts permutations with statistic at least as extreme as the observed one.
+        Every chunk of random permutations has its own seed spawned from the given one, so the result does not depend on the number of workers.
+    """
+    starts = range(0, number_of_permutations, PERMUTATIONS_PRO_CHUNK)
+    stops = [min(start + PERMUTATIONS_PRO_CHUNK, number_of_permutations) for start in starts]
+    seeds = [None] * len(starts) if exact else np.random.SeedSequence(seed).spawn(len(starts))
+    arguments = [[data] * len(starts), [observed] * len(starts), starts, stops, seeds]
+    if number_of_workers == 1:
+        return sum(map(count_function, *arguments))
+    with ProcessPoolExecutor(max_workers = number_of_workers) as executor:
+        return sum(executor.map(count_function, *arguments))
+
+
+def _get_p_value(count: int, number_of_permutations: int, exact: bool):
+    """
+        Exact p-value is the fraction of all permutations, Monte Carlo p-value counts the observed statistic as one of the resamples.
+    """
+    if exact:
+        return count / number_of_permutations
+    return (count + 1) / (number_of_permutations + 1)
+
+
+def _count_friedman_permutations(ranks, observed, start: int, stop: int, seed):
+    """
+        Counts permutations of ranks within blocks with sum of squared rank sums at least equal to the observed one.
+        Permutations from start to stop are enumerated if seed is None, otherwise stop - start random ones are drawn.
+    """
+    n, k = ranks.shape
+    if seed is None:
+        permutations = np.array(list(it.permutations(range(k))))
+        permuted_ranks = ranks[:, permutations]
+        # The first block stays fixed, as relabeling of groups does not change the statistic
+        indices = np.arange(start, stop)
+        rank_sums = np.tile(permuted_ranks[0, 0], (len(indices), 1))
+        for i in range(1, n):
+            rank_sums += permuted_ranks[i, indices % len(permutations)]
+            indices //= len(permutations)
+    else:
+        rng = np.random.default_rng(seed)
+        rank_sums = rng.permuted(np.broadcast_to(ranks, (stop - start, n, k)), axis = 2).sum(axis = 1)
+    return int(np.count_nonzero(np.sum(rank_sums ** 2, axis = 1) >= observed))
+
+
+def _count_wilcoxon_permutations(signed_ranks, observed, start: int, stop: int, seed):
+    """
+        Counts sign flips of signed ranks with absolute sum at least equal to the observed one.
+        Sign flips from start to stop are enumerated if seed is None, otherwise stop - start random ones are drawn.
+    """
+    n = len(signed_ranks)
+    if seed is None:
+        signs = 2 * ((np.arange(start, stop)[:, np.newaxis] >> np.arange(n)) & 1) - 1
+    else:
+        signs = 2 * np.random.default_rng(seed).integers(0, 2, (stop - start, n)) - 1
+    return int(np.count_nonzero(np.abs(signs @ np.abs(signed_ranks)) >= observed))
+
+
+def friedman_permutation_test(*args, number_of_resamples: int = NUMBER_OF_RESAMPLES, seed = SEED,
+                              number_of_workers: int = 1):
+    """
+        Performs a Friedman ranking test with p-value from the permutation distribution of ranks within each sample.
+        All permutations are enumerated if there are no more of them than number_of_resamples, otherwise the p-value is estimated by Monte Carlo.
+        Drop-in alternative of nonparametric_tests.friedman_test.
+
+        Parameters
+        ----------
+        samples : array_like
+            The sample measurements for each group, either list of k samples or 2-D array of shape (k, n).
+        number_of_resamples : int optional
+            Number of random permutations, default NUMBER_OF_RESAMPLES
+        seed : int optional
+            Seed of random permutations, default SEED
+        number_of_workers : int optional
+            Number of processes drawing permutations, default 1 (current process)
+
+        Returns
+        -------
+        F-value : float
+            The computed F-value of the test.
+        p-value : float
+            The associated p-value from the permutation distribution.
+        rankings : array_like
+            The ranking for each group.
+        pivots : array_like
+            The pivotal quantities for each group.
+    """
+    ranks = st.rankdata(np.asarray(args[0], dtype = float).T, axis = 1)
+    n, k = ranks.shape
+    if n < 2: raise ValueError('Less than 2 samples')
+    iman_davenport, _, rankings_avg, rankings_cmp = friedman_test(args[0])
+    # Sum of squared rank sums is monotone in the Friedman statistic
+    observed = np.sum(ranks.sum(axis = 0) ** 2)
+    number_of_permutations = math.factorial(k) ** (n - 1)
+    exact = number_of_permutations <= number_of_resamples
+    if not exact:
+        number_of_permutations = number_of_resamples
+    count = _count_permutations(_count_friedman_permutations, ranks, observed, number_of_permutations, exact, seed,
+                                number_of_workers)
+    return iman_davenport, _get_p_value(count, number_of_permutations, exact), rankings_avg, rankings_cmp
+
+
+def wilcoxon_permutation_test(x, y, number_of_resamples: int = NUMBER_OF_RESAMPLES, seed = SEED,
+                              number_of_workers: int = 1):
+    """
+        Performs a two-sided Wilcoxon signed-rank test for two dependent samples with p-value from the distribution of random sign flips.
+        Zero differences are eliminated, ties get average ranks.
+        All sign flips are enumerated if there are no more of them than number_of_resamples, otherwise the p-value is estimated by Monte Carlo.
+        Drop-in alternative of scipy.stats.wilcoxon.
+
+        Parameters
+        ----------
+        x, y : array_like
+            The sample measurements.
+        number_of_resamples : int optional
+            Number of random sign flips, default NUMBER_OF_RESAMPLES
+        seed : int optional
+            Seed of random sign flips, default SEED
+        number_of_workers : int optional
+            Number of processes drawing sign flips, default 1 (current process)
+
+        Returns
+        -------
+        W-value : float
+            The smaller of sums of ranks of positive and negative differences.
+        p-value : float
+            The associated p-value from the permutation distribution.
+    """
+    differences = np.asarray(x, dtype = float) - np.asarray(y, dtype = float)
+    differences = differences[differences != 0]
+    n = len(differences)
+    if n == 0: raise ValueError('All differences are zero')
+    signed_ranks = np.sign(differences) * st.rankdata(np.abs(differences))
+    positive = np.sum(signed_ranks[signed_ranks > 0])
+    statistic = min(positive, positive - np.sum(signed_ranks))
+    number_of_permutations = 2 ** n
+    exact = number_of_permutations <= number_of_resamples
+    if not exact:
+        number_of_permutations = number_of_resamples
+    count = _count_permutations(_count_wilcoxon_permutations, signed_ranks, abs(np.sum(signed_ranks)),
+                                number_of_permutations, exact, seed, number_of_workers)
+    return statistic, _get_p_value(count, number_of_permutations, exact)
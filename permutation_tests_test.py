@@ -0,0 +1,74 @@
+import itertools as it
+import unittest
+
+import numpy as np
+import scipy.stats as st
+
+import nonparametric_tests
+import permutation_tests
+
+
+class PermutationTestsTest(unittest.TestCase):
+
+    def test_should_enumerate_all_permutations_of_ranks(self):
+        # given
+        samples = np.random.default_rng(1).random((3, 4))
+        ranks = st.rankdata(samples.T, axis = 1)
+        observed = np.sum(ranks.sum(axis = 0) ** 2)
+        statistics = [np.sum(sum(ranks[i, list(permutation)] for i, permutation in enumerate(permutations)) ** 2)
+                      for permutations in it.product(it.permutations(range(3)), repeat = 4)]
+        # when
+        iman_davenport, p_value, rankings_avg, rankings_cmp = permutation_tests.friedman_permutation_test(samples)
+        # then
+        self.assertAlmostEqual(np.mean(np.array(statistics) >= observed), p_value)
+        expected = nonparametric_tests.friedman_test(samples)
+        self.assertEqual(expected[0], iman_davenport)
+        self.assertEqual(expected[2], rankings_avg)
+
+    def test_should_wilcoxon_test_same_as_exact_scipy_test(self):
+        rng = np.random.default_rng(2)
+        for i in range(10):
+            # given
+            x, y = rng.random(10), rng.random(10) + i / 20
+            # when
+            statistic, p_value = permutation_tests.wilcoxon_permutation_test(x, y)
+            # then
+            expected = st.wilcoxon(x, y, mode = 'exact')
+            self.assertEqual(expected.statistic, statistic)
+            self.assertAlmostEqual(expected.pvalue, p_value)
+
+    def test_should_draw_same_permutations_independently_of_number_of_workers(self):
+        # given
+        samples = np.random.default_rng(3).random((5, 20))
+        # when
+        result = permutation_tests.friedman_permutation_test(samples, number_of_resamples = 3000, seed = 4)
+        pooled_result = permutation_tests.friedman_permutation_test(samples, number_of_resamples = 3000, seed = 4,
+                                                                    number_of_workers = 2)
+        # then
+        self.assertEqual(result[1], pooled_result[1])
+        self.assertNotEqual(result[1], permutation_tests.friedman_permutation_test(samples, number_of_resamples = 3000,
+                                                                                   seed = 5)[1])
+
+    def test_should_estimate_p_value_close_to_asymptotic_one(self):
+        # given
+        rng = np.random.default_rng(4)
+        x, y = rng.random(28), rng.random(28) + .1
+        samples = rng.random((4, 28)) + np.arange(4)[:, np.newaxis] / 10
+        # when
+        statistic, p_value = permutation_tests.wilcoxon_permutation_test(x, y)
+        friedman_p_value = permutation_tests.friedman_permutation_test(samples)[1]
+        # then
+        self.assertAlmostEqual(st.wilcoxon(x, y).pvalue, p_value, delta = .02)
+        self.assertAlmostEqual(st.friedmanchisquare(*samples).pvalue, friedman_p_value, delta = .02)
+
+    def test_should_raise_error_for_less_than_two_samples(self):
+        # given
+        samples = np.random.default_rng(5).random((9, 1))
+        # when
+        # then
+        with self.assertRaises(ValueError):
+            permutation_tests.friedman_permutation_test(samples)
+
+
+if __name__ == '__main__':
+    unittest.main()